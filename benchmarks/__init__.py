@@ -0,0 +1,22 @@
+import math
+import os
+
+MIGRATIONS_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations"
+)
+
+
+def create_benchmark_app(database_path):
+    os.environ["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{database_path}"
+    os.environ.setdefault("JWT_SECRET_KEY", "YmVuY2htYXJr")
+    os.environ.setdefault("JWT_ALGORITHM", "HS256")
+
+    from project import create_app
+
+    return create_app()
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of the samples"""
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
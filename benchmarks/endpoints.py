@@ -0,0 +1,360 @@
+"""Time every GET endpoint of the API namespaces and the hot writes on seeded data.
+
+Every scale is seeded (see project/seed.py) into a new SQLite database in a
+temporary directory and requested through the Flask test client:
+
+    python -m benchmarks.endpoints --scales 1000 10000 --output after.json
+
+With --baseline, endpoints slower or running more queries than in an earlier
+run are reported and the exit status is 1:
+
+    python -m benchmarks.endpoints --baseline before.json --output after.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+from time import perf_counter
+
+from benchmarks import MIGRATIONS_DIRECTORY, create_benchmark_app, percentile
+
+# Endpoints read with the token of another role than the admin's
+ROLES_BY_PATH = {
+    "/courses/my": "teacher",
+    "/test-roles/teacher-only": "teacher",
+    "/test-roles/teacher-and-user": "teacher",
+    "/test-roles/user-only": "user",
+}
+
+# GETs which write: reset_password gives the user a new password, which would
+# break the logins of the seeded user and times the password hash, not a read
+WRITING_GETS = {"/user/reset_password"}
+
+
+def get_fixtures(client):
+    """Ids and tokens of the seeded data used to fill in the urls"""
+    from sqlalchemy import select
+
+    from project.extensions import db
+    from project.models import (
+        Discipline,
+        Role,
+        Roles,
+        Syllabus,
+        SyllabusStatus,
+        Teacher,
+        User,
+    )
+    from project.routes.users import SecurityUtils
+
+    # Only users with a confirmed email can log in
+    filled_syllabus_id, teacher_id, teacher_email = db.session.execute(
+        select(Syllabus.id, Teacher.id, Teacher.email)
+        .join(Syllabus.discipline)
+        .join(Discipline.teacher)
+        .join(User, User.email == Teacher.email)
+        .where(Syllabus.status == SyllabusStatus.FILLED, User.email_confirmed)
+        .order_by(Syllabus.id)
+        .limit(1)
+    ).one()
+    not_filled_syllabus_ids = db.session.scalars(
+        select(Syllabus.id)
+        .where(Syllabus.status == SyllabusStatus.NOT_FILLED)
+        .order_by(Syllabus.id)
+    ).all()
+
+    emails = {"teacher": teacher_email}
+    for role in ("admin", "user"):
+        emails[role] = db.session.scalar(
+            select(User.email)
+            .join(User.role)
+            .where(Role.name == Roles(role), User.email_confirmed)
+            .order_by(User.id)
+            .limit(1)
+        )
+
+    tokens = {}
+    for role, email in emails.items():
+        response = client.post(
+            "/user/login", data={"email": email, "password": "password"}
+        )
+        # Already prefixed with "Bearer"
+        tokens[role] = response.json["access_token"]
+
+    mail_token = SecurityUtils.encrypt_data(
+        {"email": "student1@example.com", "front_url": "http://localhost"}
+    )
+    return {
+        "url_values": {
+            "id": 1,
+            "syllabus_id": filled_syllabus_id,
+            "teacher_id": teacher_id,
+            "token": mail_token,
+        },
+        "teacher_id": teacher_id,
+        "not_filled_syllabus_ids": not_filled_syllabus_ids,
+        "tokens": tokens,
+    }
+
+
+def get_read_cases(app, api, fixtures):
+    """A request for every GET of the resources of the API namespaces"""
+    resources = {
+        resource.resource
+        for namespace in api.namespaces
+        for resource in namespace.resources
+    }
+    cases = {}
+    for rule in sorted(app.url_map.iter_rules(), key=lambda rule: rule.rule):
+        view_class = getattr(app.view_functions[rule.endpoint], "view_class", None)
+        if view_class not in resources or "GET" not in rule.methods:
+            continue
+        if rule.rule in WRITING_GETS:
+            continue
+        if not {*rule.arguments} <= fixtures["url_values"].keys():
+            continue
+
+        path = rule.build(fixtures["url_values"], append_unknown=False)[1]
+        role = ROLES_BY_PATH.get(rule.rule, "admin")
+        request = {
+            "method": "GET",
+            "path": path,
+            "headers": {"Authorization": fixtures["tokens"][role]},
+        }
+        cases[f"GET {rule.rule}"] = lambda number, request=request: request
+    return cases
+
+
+def get_write_cases(fixtures):
+    """The writes updating the syllabus filling status, each on another syllabus"""
+    headers = {"Authorization": fixtures["tokens"]["admin"]}
+    syllabus_ids = fixtures["not_filled_syllabus_ids"]
+
+    def syllabus_request(path, payload):
+        def make_request(number):
+            syllabus_id = syllabus_ids[number % len(syllabus_ids)]
+            return {
+                "method": "POST",
+                "path": path.format(syllabus_id=syllabus_id),
+                "json": {**payload, "syllabus_id": syllabus_id},
+                "headers": headers,
+            }
+
+        return make_request
+
+    def discipline_request(number):
+        return {
+            "method": "POST",
+            "path": "/disciplines",
+            "json": {
+                "name": f"Benchmark discipline {number}",
+                "syllabus_url": "https://example.com/syllabus",
+                "education_plan_url": "https://example.com/plan",
+                "teacher": {"id": fixtures["teacher_id"]},
+                "discipline_group": {"id": 1},
+                "education_program": {"id": 1},
+            },
+            "headers": headers,
+        }
+
+    topic = {
+        "theoretical_topic": "Тема",
+        "theoretical_hours": 4,
+        "practice_topics": "Практична робота",
+        "practice_hours": 4,
+        "technologies": "Python",
+    }
+    return {
+        "POST /disciplines": discipline_request,
+        "POST /syllabuses/structure/<int:syllabus_id>": syllabus_request(
+            "/syllabuses/structure/{syllabus_id}",
+            {"modules": [{"name": "Модуль", "topics": [topic] * 3}] * 2},
+        ),
+        "POST /syllabuses/market-relation/<int:syllabus_id>": syllabus_request(
+            "/syllabuses/market-relation/{syllabus_id}",
+            {"market_relations": [{"specialty": "Software Engineer", "skills": "SQL"}]},
+        ),
+        "POST /syllabuses/self-study/<int:syllabus_id>": syllabus_request(
+            "/syllabuses/self-study/{syllabus_id}",
+            {"self_study_topics": [{"name": "Тема", "hours": 6}] * 2},
+        ),
+        "POST /syllabuses/assessments/<int:syllabus_id>": syllabus_request(
+            "/syllabuses/assessments/{syllabus_id}",
+            {"assessments": [{"object": "Робота", "method": "Захист", "tool": "Звіт"}]},
+        ),
+    }
+
+
+def measure(client, make_request, repeat, warmup, queries):
+    """Status, latency percentiles, SQL statements and peak memory of one endpoint.
+
+    The error statuses (4xx and 5xx) of every request are kept, including the
+    warmup, as an endpoint failing some of the requests gets faster.
+    """
+    statuses = set()
+    for number in range(warmup):
+        statuses.add(client.open(**make_request(number)).status_code)
+
+    samples, statements = [], []
+    for number in range(warmup, warmup + repeat):
+        request = make_request(number)
+        queries[0] = 0
+        started = perf_counter()
+        response = client.open(**request)
+        samples.append((perf_counter() - started) * 1000)
+        statements.append(queries[0])
+        statuses.add(response.status_code)
+
+    # Traced separately, tracemalloc slows the requests down
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        statuses.add(client.open(**make_request(warmup + repeat)).status_code)
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "status": response.status_code,
+        "error_statuses": sorted(status for status in statuses if status >= 400),
+        "p50_ms": percentile(samples, 0.5),
+        "p95_ms": percentile(samples, 0.95),
+        "queries": max(statements),
+        "peak_memory_kib": peak / 1024,
+    }
+
+
+def run_scale(scale, repeat, warmup):
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_benchmark_app(os.path.join(directory, "benchmark.db"))
+
+        from flask_migrate import upgrade
+        from sqlalchemy import event
+
+        from project.extensions import api, db
+        from project.seed import seed_database
+
+        with app.app_context():
+            upgrade(directory=MIGRATIONS_DIRECTORY)
+            rows = seed_database(scale)
+            engine = db.engine
+
+        queries = [0]
+
+        def count_query(*args):
+            queries[0] += 1
+
+        event.listen(engine, "before_cursor_execute", count_query)
+        client = app.test_client()
+        with app.app_context():
+            fixtures = get_fixtures(client)
+
+        cases = {
+            **get_read_cases(app, api, fixtures),
+            **get_write_cases(fixtures),
+        }
+        endpoints = {}
+        for name, make_request in cases.items():
+            try:
+                endpoints[name] = measure(client, make_request, repeat, warmup, queries)
+            except Exception as e:
+                endpoints[name] = {"error": f"{type(e).__name__}: {e}"}
+        engine.dispose()
+
+    return {"rows": rows, "endpoints": endpoints}
+
+
+def find_regressions(baseline, results, tolerance):
+    regressions = []
+    for scale, result in results["scales"].items():
+        baseline_endpoints = baseline["scales"].get(scale, {}).get("endpoints", {})
+        for name, current in result["endpoints"].items():
+            before = baseline_endpoints.get(name)
+            if not before or "error" in before:
+                continue
+            if "error" in current:
+                regressions.append(f"{scale} {name}: {current['error']}")
+                continue
+            # A failing endpoint is usually faster, so it is checked first
+            before_statuses = (before["status"], before.get("error_statuses", []))
+            current_statuses = (current["status"], current["error_statuses"])
+            if current_statuses != before_statuses:
+                regressions.append(
+                    f"{scale} {name}: status {before['status']} -> "
+                    f"{current['status']}, error statuses "
+                    f"{before_statuses[1]} -> {current_statuses[1]}"
+                )
+                continue
+            if current["p95_ms"] > before["p95_ms"] * tolerance:
+                regressions.append(
+                    f"{scale} {name}: p95 {before['p95_ms']:.2f} -> "
+                    f"{current['p95_ms']:.2f} ms"
+                )
+            if current["queries"] > before["queries"]:
+                regressions.append(
+                    f"{scale} {name}: queries {before['queries']} -> "
+                    f"{current['queries']}"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--scales", type=int, nargs="+", default=[1000, 10000], help="disciplines"
+    )
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON results of an earlier run")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.25,
+        help="p95 slowdown against the baseline reported as a regression",
+    )
+    args = parser.parse_args()
+
+    results = {
+        "repeat": args.repeat,
+        "scales": {
+            str(scale): run_scale(scale, args.repeat, args.warmup)
+            for scale in args.scales
+        },
+    }
+
+    for scale, result in results["scales"].items():
+        print(f"\nscale {scale}")
+        print(
+            f"{'endpoint':58} {'status':>6} {'p50, ms':>8} {'p95, ms':>8} "
+            f"{'queries':>7} {'peak, KiB':>9}"
+        )
+        for name, endpoint in result["endpoints"].items():
+            if "error" in endpoint:
+                print(f"{name:58} {endpoint['error']}")
+                continue
+            print(
+                f"{name:58} {endpoint['status']:6} {endpoint['p50_ms']:8.2f} "
+                f"{endpoint['p95_ms']:8.2f} {endpoint['queries']:7} "
+                f"{endpoint['peak_memory_kib']:9.0f}"
+            )
+            if endpoint["error_statuses"]:
+                print(f"{'':58} error statuses {endpoint['error_statuses']}")
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2, ensure_ascii=False)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = find_regressions(json.load(file), results, args.tolerance)
+        for regression in regressions:
+            print(f"regression: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Time the lookups by foreign key, Syllabus.status and User.role_id before and
+after the 0003 migration adding the indexes.
+
+Runs on a new SQLite database in a temporary directory:
+
+    python -m benchmarks.indexes --scale 20000 --repeat 200
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+from statistics import mean, median
+from time import perf_counter
+
+from benchmarks import MIGRATIONS_DIRECTORY, create_benchmark_app
+
+BEFORE_INDEXES = "0002"
+AFTER_INDEXES = "0003"
+
+
+def get_lookups(rows):
+    from sqlalchemy import func, select
+
+    from project.models import (
+        Assessment,
+        Discipline,
+        DisciplineStructure,
+        GraduateTask,
+        MarketRelation,
+        SelfStudyTopic,
+        Syllabus,
+        SyllabusModule,
+        SyllabusStatus,
+        User,
+    )
+
+    def by_syllabus(model):
+        return lambda rng: select(model).where(
+            model.syllabus_id == rng.randint(1, rows["syllabuses"])
+        )
+
+    return {
+        "assessment.syllabus_id": by_syllabus(Assessment),
+        "graduate_task.syllabus_id": by_syllabus(GraduateTask),
+        "stakeholder.syllabus_id": by_syllabus(MarketRelation),
+        "topic_for_self_study.syllabus_id": by_syllabus(SelfStudyTopic),
+        "syllabus_module.syllabus_id": by_syllabus(SyllabusModule),
+        "structure_of_discipline.module_id": lambda rng: select(
+            DisciplineStructure
+        ).where(
+            DisciplineStructure.module_id == rng.randint(1, rows["syllabus_module"])
+        ),
+        "disciplines.teacher_id": lambda rng: select(Discipline).where(
+            Discipline.teacher_id == rng.randint(1, rows["teachers"])
+        ),
+        "disciplines.discipline_group_id": lambda rng: select(Discipline).where(
+            Discipline.discipline_group_id == rng.randint(1, rows["discipline_groups"])
+        ),
+        "syllabuses.status": lambda rng: select(func.count()).where(
+            Syllabus.status == rng.choice(list(SyllabusStatus)).value
+        ),
+        "users.role_id": lambda rng: select(func.count()).where(
+            User.role_id == rng.randint(1, rows["role"])
+        ),
+    }
+
+
+def time_lookups(lookups, repeat):
+    from project.extensions import db
+
+    timings = {}
+    for name, make_statement in lookups.items():
+        rng = random.Random(name)
+        samples = []
+        for _ in range(repeat):
+            statement = make_statement(rng)
+            started = perf_counter()
+            db.session.execute(statement).all()
+            samples.append((perf_counter() - started) * 1000)
+        timings[name] = {"mean_ms": mean(samples), "median_ms": median(samples)}
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--scale", type=int, default=20000, help="number of disciplines"
+    )
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_benchmark_app(os.path.join(directory, "benchmark.db"))
+
+        from flask_migrate import upgrade
+
+        from project.seed import seed_database
+
+        with app.app_context():
+            upgrade(directory=MIGRATIONS_DIRECTORY, revision=BEFORE_INDEXES)
+            rows = seed_database(args.scale)
+            lookups = get_lookups(rows)
+
+            before = time_lookups(lookups, args.repeat)
+            upgrade(directory=MIGRATIONS_DIRECTORY, revision=AFTER_INDEXES)
+            after = time_lookups(lookups, args.repeat)
+
+    results = {
+        "rows": rows,
+        "repeat": args.repeat,
+        "lookups": {
+            name: {
+                "before": before[name],
+                "after": after[name],
+                "speedup": before[name]["mean_ms"] / after[name]["mean_ms"],
+            }
+            for name in lookups
+        },
+    }
+
+    print(f"{'lookup':36} {'before, ms':>11} {'after, ms':>10} {'speedup':>8}")
+    for name, result in results["lookups"].items():
+        print(
+            f"{name:36} {result['before']['mean_ms']:11.3f} "
+            f"{result['after']['mean_ms']:10.3f} {result['speedup']:7.1f}x"
+        )
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
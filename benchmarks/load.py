@@ -0,0 +1,314 @@
+"""Load the app served by gunicorn on a local port with concurrent users.
+
+The database is migrated and seeded (see project/seed.py), a new SQLite file
+in a temporary directory unless --database-url is given, and every user
+thread replays a weighted mix of requests for --duration seconds:
+
+    python -m benchmarks.load --scale 10000 --workers 4 --users 50 --duration 30
+
+--server werkzeug runs the Flask development server instead of gunicorn.
+"""
+
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+from time import monotonic, perf_counter, sleep
+from urllib.parse import urlencode
+
+from benchmarks import MIGRATIONS_DIRECTORY, percentile
+
+ROOT_DIRECTORY = os.path.dirname(MIGRATIONS_DIRECTORY)
+
+# Scenario: weight in the mix
+SCENARIO_WEIGHTS = {
+    "service_info": 30,
+    "courses_my": 20,
+    "syllabus_general_info": 40,
+    "login": 10,
+}
+
+
+def prepare_database(database_url, scale, users_count):
+    """Migrate the database and seed it, unless it already has data.
+
+    Returns the emails of teachers who can log in and the number of syllabuses.
+    """
+    os.environ["SQLALCHEMY_DATABASE_URI"] = database_url
+
+    from flask_migrate import upgrade
+    from sqlalchemy import func, select
+
+    from project import create_app
+    from project.extensions import db
+    from project.models import Role, Roles, Syllabus, User
+    from project.seed import seed_database
+
+    app = create_app()
+    with app.app_context():
+        upgrade(directory=MIGRATIONS_DIRECTORY)
+        try:
+            seed_database(scale)
+        except ValueError:
+            print("The database is not empty, using its data")
+
+        emails = db.session.scalars(
+            select(User.email)
+            .join(User.role)
+            .where(Role.name == Roles.TEACHER, User.email_confirmed)
+            .order_by(User.id)
+            .limit(users_count)
+        ).all()
+        syllabuses_count = db.session.scalar(select(func.max(Syllabus.id)))
+    if not emails:
+        raise RuntimeError("There are no teachers with a confirmed email")
+    return emails, syllabuses_count
+
+
+def get_free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(server, port, workers, threads, log):
+    env = {
+        **os.environ,
+        "WEB_CONCURRENCY": str(workers),
+        "GUNICORN_THREADS": str(threads),
+    }
+    if server == "gunicorn":
+        command = [
+            *(sys.executable, "-m", "gunicorn", "app:app"),
+            *("--config", "gunicorn.conf.py", "--bind", f"127.0.0.1:{port}"),
+        ]
+    else:
+        command = [
+            *(sys.executable, "-m", "flask", "--app", "app", "run"),
+            *("--port", str(port), "--with-threads", "--no-reload", "--no-debugger"),
+        ]
+    return subprocess.Popen(
+        command, cwd=ROOT_DIRECTORY, env=env, stdout=log, stderr=subprocess.STDOUT
+    )
+
+
+def wait_for_server(process, port, timeout=60):
+    deadline = monotonic() + timeout
+    while monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"The server exited with code {process.returncode}")
+        connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        try:
+            connection.request("GET", "/swagger.json")
+            if connection.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        finally:
+            connection.close()
+        sleep(0.2)
+    raise RuntimeError(f"The server did not start in {timeout}s")
+
+
+class User:
+    """A client thread logged in as one of the seeded teachers"""
+
+    def __init__(self, port, number, email, syllabuses_count):
+        self.port = port
+        self.rng = random.Random(number)
+        self.email = email
+        self.syllabuses_count = syllabuses_count
+        self.connection = None
+        self.token = None
+        self.results = []
+
+    def request(self, method, path, body=None, headers=None):
+        if self.connection is None:
+            self.connection = http.client.HTTPConnection(
+                "127.0.0.1", self.port, timeout=60
+            )
+        try:
+            self.connection.request(method, path, body, headers or {})
+            response = self.connection.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException):
+            self.connection.close()
+            self.connection = None
+            raise
+        if response.will_close:
+            self.connection.close()
+            self.connection = None
+        return response.status, data
+
+    def login(self):
+        status, data = self.request(
+            "POST",
+            "/user/login",
+            urlencode({"email": self.email, "password": "password"}),
+            {"Content-Type": "application/x-www-form-urlencoded"},
+        )
+        if status == 200:
+            # Already prefixed with "Bearer"
+            self.token = json.loads(data)["access_token"]
+        return status
+
+    def service_info(self):
+        return self.request("GET", "/service_info")[0]
+
+    def courses_my(self):
+        headers = {"Authorization": self.token}
+        return self.request("GET", "/courses/my", headers=headers)[0]
+
+    def syllabus_general_info(self):
+        syllabus_id = self.rng.randint(1, self.syllabuses_count)
+        return self.request("GET", f"/syllabuses/general-info/{syllabus_id}")[0]
+
+    def run(self, deadline):
+        try:
+            self.login()
+        except (OSError, http.client.HTTPException):
+            pass
+
+        scenarios = list(SCENARIO_WEIGHTS)
+        weights = list(SCENARIO_WEIGHTS.values())
+        while monotonic() < deadline:
+            scenario = self.rng.choices(scenarios, weights)[0]
+            started = perf_counter()
+            try:
+                status = getattr(self, scenario)()
+            except (OSError, http.client.HTTPException):
+                status = None
+            latency = (perf_counter() - started) * 1000
+            self.results.append((scenario, latency, status))
+
+
+def summarize(results, duration):
+    latencies = [latency for _, latency, _ in results]
+    errors = sum(status is None or status >= 400 for _, _, status in results)
+    if not results:
+        return {"requests": 0, "errors": 0}
+    return {
+        "requests": len(results),
+        "throughput_rps": len(results) / duration,
+        "errors": errors,
+        "error_rate": errors / len(results),
+        "p50_ms": percentile(latencies, 0.5),
+        "p90_ms": percentile(latencies, 0.9),
+        "p95_ms": percentile(latencies, 0.95),
+        "p99_ms": percentile(latencies, 0.99),
+        "max_ms": max(latencies),
+    }
+
+
+def run_load(port, users_count, duration, emails, syllabuses_count):
+    users = [
+        User(port, number, emails[number % len(emails)], syllabuses_count)
+        for number in range(users_count)
+    ]
+    deadline = monotonic() + duration
+    threads = [threading.Thread(target=user.run, args=(deadline,)) for user in users]
+    started = monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = monotonic() - started
+
+    results = [result for user in users for result in user.results]
+    return {
+        "duration_s": elapsed,
+        "total": summarize(results, elapsed),
+        "scenarios": {
+            scenario: summarize(
+                [result for result in results if result[0] == scenario], elapsed
+            )
+            for scenario in SCENARIO_WEIGHTS
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scale", type=int, default=10000, help="disciplines")
+    parser.add_argument(
+        "--database-url",
+        help="database to migrate and seed instead of a temporary SQLite file",
+    )
+    parser.add_argument(
+        "--server", choices=("gunicorn", "werkzeug"), default="gunicorn"
+    )
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=1, help="per worker")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    os.environ.setdefault("JWT_SECRET_KEY", "YmVuY2htYXJr")
+    os.environ.setdefault("JWT_ALGORITHM", "HS256")
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = args.database_url or (
+            f"sqlite:///{os.path.join(directory, 'load.db')}"
+        )
+        emails, syllabuses_count = prepare_database(
+            database_url, args.scale, args.users
+        )
+
+        port = get_free_port()
+        log_path = os.path.join(directory, "server.log")
+        with open(log_path, "w") as log:
+            process = start_server(args.server, port, args.workers, args.threads, log)
+        try:
+            wait_for_server(process, port)
+            load = run_load(port, args.users, args.duration, emails, syllabuses_count)
+        except RuntimeError:
+            with open(log_path) as log:
+                print(log.read()[-5000:], file=sys.stderr)
+            raise
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    results = {
+        "server": args.server,
+        "workers": args.workers,
+        "threads": args.threads,
+        "users": args.users,
+        "scale": args.scale,
+        **load,
+    }
+
+    print(
+        f"{args.server}, {args.workers} workers x {args.threads} threads, "
+        f"{args.users} users, {load['duration_s']:.1f}s"
+    )
+    print(
+        f"{'scenario':22} {'requests':>8} {'rps':>8} {'errors':>7} "
+        f"{'p50, ms':>8} {'p95, ms':>8} {'p99, ms':>8}"
+    )
+    for name, summary in (*load["scenarios"].items(), ("total", load["total"])):
+        if not summary["requests"]:
+            print(f"{name:22} {0:8}")
+            continue
+        print(
+            f"{name:22} {summary['requests']:8} {summary['throughput_rps']:8.1f} "
+            f"{summary['error_rate']:7.1%} {summary['p50_ms']:8.1f} "
+            f"{summary['p95_ms']:8.1f} {summary['p99_ms']:8.1f}"
+        )
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Compare the compiled serializers with flask_restx.marshal on seeded data.
+
+The database is seeded (see project/seed.py) into a new SQLite file in a
+temporary directory, the objects of the largest responses are loaded once and
+marshalled by both, which must give the same JSON:
+
+    python -m benchmarks.serializers --scale 10000 --repeat 20
+"""
+
+import argparse
+import json
+import os
+import tempfile
+from time import perf_counter
+
+from benchmarks import MIGRATIONS_DIRECTORY, create_benchmark_app, percentile
+
+
+def get_cases(app):
+    """Data and model of the responses, loaded with the queries of the endpoints"""
+    from sqlalchemy.orm import selectinload
+
+    from project.models import (
+        Discipline,
+        DisciplineBlock,
+        EducationLevel,
+        EducationProgram,
+        Position,
+        Specialty,
+        Teacher,
+        University,
+    )
+    from project.routes.disciplines import get_discipline_response
+    from project.schemas.pagination import MAX_PAGE_SIZE
+    from project.schemas.service_info import (
+        service_info_model,
+        serviced_discipline_model,
+    )
+    from project.schemas.teachers import teacher_model
+
+    service_info = {
+        "position": Position.query.all(),
+        "education_levels": EducationLevel.query.all(),
+        "teachers": Teacher.query.all(),
+        "university": University.query.options(
+            selectinload(University.department)
+        ).all(),
+        "specialty": Specialty.query.all(),
+        "discipline": Discipline.query.all(),
+        "disciplineBlocks": DisciplineBlock.query.options(
+            selectinload(DisciplineBlock.disciplineGroups)
+        ).all(),
+        "education_program": EducationProgram.query.all(),
+    }
+    with app.test_request_context(f"/disciplines?size={MAX_PAGE_SIZE}"):
+        disciplines = get_discipline_response()
+
+    return {
+        "GET /service_info": (service_info, service_info_model),
+        f"GET /disciplines?size={MAX_PAGE_SIZE}": (
+            disciplines,
+            serviced_discipline_model,
+        ),
+        "teachers": (service_info["teachers"], teacher_model),
+    }
+
+
+def measure(function, data, model, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = perf_counter()
+        function(data, model)
+        samples.append((perf_counter() - started) * 1000)
+    return {"p50_ms": percentile(samples, 0.5), "min_ms": min(samples)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scale", type=int, default=10000, help="disciplines")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_benchmark_app(os.path.join(directory, "benchmark.db"))
+
+        import flask_restx
+        from flask_migrate import upgrade
+
+        from project.extensions import db
+        from project.seed import seed_database
+        from project.serializers import marshal
+
+        with app.app_context():
+            upgrade(directory=MIGRATIONS_DIRECTORY)
+            seed_database(args.scale)
+
+            results = {}
+            for name, (data, model) in get_cases(app).items():
+                stock = json.dumps(flask_restx.marshal(data, model), ensure_ascii=False)
+                compiled = json.dumps(marshal(data, model), ensure_ascii=False)
+                if compiled != stock:
+                    raise AssertionError(f"{name}: the compiled output differs")
+
+                results[name] = {
+                    "bytes": len(stock.encode()),
+                    "stock": measure(flask_restx.marshal, data, model, args.repeat),
+                    "compiled": measure(marshal, data, model, args.repeat),
+                }
+            db.engine.dispose()
+
+    print(f"scale {args.scale}, {args.repeat} runs")
+    print(f"{'response':32} {'KiB':>7} {'stock, ms':>10} {'compiled, ms':>12} {'x':>5}")
+    for name, result in results.items():
+        stock, compiled = result["stock"]["p50_ms"], result["compiled"]["p50_ms"]
+        print(
+            f"{name:32} {result['bytes'] / 1024:7.0f} {stock:10.2f} "
+            f"{compiled:12.2f} {stock / compiled:5.1f}"
+        )
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"scale": args.scale, "responses": results}, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
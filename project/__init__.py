@@ -7,7 +7,21 @@ from flask import Flask, g, jsonify
 from flask_cors import CORS
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
-from project.extensions import api, db, migrate, pagination, jwt, mail
+from project.counters import counters_cli
+from project.database import get_engine_options, watch_pool
+from project.extensions import (
+    api,
+    db,
+    migrate,
+    pagination,
+    jwt,
+    mail,
+    mail_dispatcher,
+    mail_pool,
+    metrics,
+    password_hasher,
+    query_counter,
+)
 from project.models import (
     Department,
     Discipline,
@@ -20,6 +34,7 @@ from project.models import (
     Teacher,
     University,
 )
+from project.outbox import outbox_cli
 from project.routes.assessment import assessment_ns
 from project.routes.courses import courses_ns
 from project.routes.departments import departments_ns
@@ -43,6 +58,7 @@ from project.routes.teachers import teachers_ns
 from project.routes.test_roles import test_roles_ns
 from project.routes.universities import university_ns
 from project.routes.users import user_ns
+from project.seed import seed_cli
 
 
 def create_app():
@@ -52,7 +68,9 @@ def create_app():
     load_dotenv()
     app.config["SQLALCHEMY_DATABASE_URI"] = environ.get("SQLALCHEMY_DATABASE_URI")
     app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-    app.config["SQLALCHEMY_POOL_SIZE"] = 1
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = get_engine_options(
+        app.config["SQLALCHEMY_DATABASE_URI"]
+    )
     app.config["RESTX_VALIDATE"] = True
     app.config["RESTX_JSON"] = {"ensure_ascii": False}
     app.config["DEBUG"] = True
@@ -66,28 +84,58 @@ def create_app():
     app.config["PAGINATE_DATA_OBJECT_KEY"] = "content"
     app.config["JSON_AS_ASCII"] = False
 
+    # Fail requests running more SQL statements than their budget, for tests
+    app.config["QUERY_BUDGET_RAISE"] = (
+        environ.get("QUERY_BUDGET_RAISE", "false").lower() == "true"
+    )
+
+    # Seconds a worker may serve cached reference data written by other workers
+    app.config["CACHE_MAX_AGE"] = int(environ.get("CACHE_MAX_AGE", 60))
+
     b64_key = environ.get("JWT_SECRET_KEY")
     app.config["JWT_SECRET_KEY"] = base64.b64decode(b64_key)
     app.config["JWT_ALGORITHM"] = environ.get("JWT_ALGORITHM")
     app.config["JWT_ACCESS_TOKEN_EXPIRES"] = timedelta(hours=1)
 
+    app.config["PASSWORD_HASH_METHOD"] = environ.get("PASSWORD_HASH_METHOD", "scrypt")
+    app.config["PASSWORD_HASH_PROCESSES"] = int(
+        environ.get("PASSWORD_HASH_PROCESSES", 0)
+    )
+
     app.config["MAIL_SERVER"] = environ.get("MAIL_SERVER")
     app.config["MAIL_PORT"] = environ.get("MAIL_PORT")
     app.config["MAIL_USERNAME"] = environ.get("MAIL_USERNAME")
     app.config["MAIL_PASSWORD"] = environ.get("MAIL_PASSWORD")
-    app.config["MAIL_USE_TLS"] = True
+    app.config["MAIL_USE_TLS"] = environ.get("MAIL_USE_TLS", "true").lower() == "true"
     app.config["MAIL_USE_SSL"] = False
     app.config["MAIL_DEFAULT_SENDER"] = ("Education UA", environ.get("MAIL_USERNAME"))
+    app.config["MAIL_DISPATCH_WORKERS"] = int(environ.get("MAIL_DISPATCH_WORKERS", 2))
+    app.config["MAIL_DISPATCH_QUEUE_SIZE"] = int(
+        environ.get("MAIL_DISPATCH_QUEUE_SIZE", 100)
+    )
+    app.config["MAIL_POOL_SIZE"] = int(environ.get("MAIL_POOL_SIZE", 2))
+    app.config["MAIL_POOL_IDLE_TIMEOUT"] = int(environ.get("MAIL_POOL_IDLE_TIMEOUT", 30))
 
     api.init_app(app)
     db.init_app(app)
     migrate.init_app(app, db)
+    with app.app_context():
+        watch_pool(db.engine)
+    metrics.init_app(app, api, db)
+    query_counter.init_app(app, db)
     pagination.init_app(app, db)
     jwt.init_app(app)
     mail.init_app(app)
+    mail_pool.init_app(app)
+    mail_dispatcher.init_app(app)
+    password_hasher.init_app(app)
 
     app.extensions["mail"].debug = 0
 
+    app.cli.add_command(counters_cli)
+    app.cli.add_command(outbox_cli)
+    app.cli.add_command(seed_cli)
+
     @app.teardown_appcontext
     def close_connection(exception=None):
         try:
@@ -0,0 +1,251 @@
+import json
+import weakref
+from collections import defaultdict
+from functools import wraps
+from hashlib import sha256
+from threading import Lock
+from time import monotonic
+
+from flask import current_app, has_request_context, request
+from flask_restx.utils import unpack
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session
+from werkzeug.http import quote_etag
+
+from project.database import increment_rows
+from project.extensions import db
+from project.models import TableVersion
+
+_table_versions = defaultdict(int)
+_versions_lock = Lock()
+
+# Tables of conditional GETs, whose versions are also kept in the database
+_shared_tables = set()
+
+# Engines whose database has the table_version table
+_engines_with_table_versions = weakref.WeakSet()
+
+# [value, ETag] of the values cached by versioned_cache, by id of the value
+_cached_etags = {}
+
+MAX_REMEMBERED_ETAGS = 1024
+
+
+def get_tables(*models):
+    """Get names of the tables the models are stored in"""
+    return tuple(table.name for model in models for table in inspect(model).tables)
+
+
+def get_tables_version(tables):
+    """Get the current version of the given tables in this process"""
+    return tuple(_table_versions[table] for table in tables)
+
+
+def bump_tables_version(tables):
+    with _versions_lock:
+        for table in tables:
+            _table_versions[table] += 1
+
+
+def has_table_versions(connection):
+    """Whether the table of the shared versions exists, checked until it does.
+
+    It is created by the 0004 migration, older revisions (e.g. seeded by the
+    index benchmark) have no shared versions.
+    """
+    if connection.engine in _engines_with_table_versions:
+        return True
+    if not inspect(connection).has_table(TableVersion.__tablename__):
+        return False
+    _engines_with_table_versions.add(connection.engine)
+    return True
+
+
+def get_shared_tables_version(tables):
+    """Get the version of the given tables committed by any process.
+
+    In a request the versions are read once, so that conditional_get and
+    versioned_cache see the same ones. Commits of the request itself are
+    seen in the versions of this process.
+    """
+    versions = {}
+    if has_request_context():
+        versions = request.environ.setdefault("project.shared_table_versions", {})
+    missing = [table for table in tables if table not in versions]
+    if missing and has_table_versions(db.session.connection()):
+        versions.update(dict.fromkeys(missing, 0))
+        versions.update(
+            db.session.execute(
+                select(TableVersion.name, TableVersion.version).where(
+                    TableVersion.name.in_(missing)
+                )
+            ).all()
+        )
+    return tuple(versions.get(table, 0) for table in tables)
+
+
+def _written_tables(session):
+    return session.info.setdefault("written_tables", set())
+
+
+@event.listens_for(Session, "after_flush")
+def collect_flushed_tables(session, flush_context):
+    """Remember the tables written by the flush until the transaction ends"""
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        _written_tables(session).update(get_tables(type(obj)))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def collect_bulk_written_tables(orm_execute_state):
+    """Remember the tables written by bulk UPDATE/DELETE/INSERT statements"""
+    if orm_execute_state.is_update or orm_execute_state.is_delete or (
+        orm_execute_state.is_insert
+    ):
+        _written_tables(orm_execute_state.session).add(
+            orm_execute_state.statement.table.name
+        )
+
+
+@event.listens_for(Session, "before_commit")
+def bump_shared_tables_version(session):
+    """Bump the versions of the written tables of conditional GETs in the commit"""
+    session.flush()
+    tables = session.info.get("written_tables", set()) & _shared_tables
+    if tables and has_table_versions(session.connection()):
+        increment_rows(
+            session.connection(),
+            TableVersion.__table__,
+            "name",
+            "version",
+            dict.fromkeys(sorted(tables), 1),
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def bump_committed_tables_version(session):
+    bump_tables_version(session.info.pop("written_tables", ()))
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def forget_rolled_back_tables(session, previous_transaction):
+    if not session.in_transaction():
+        session.info.pop("written_tables", None)
+
+
+def versioned_cache(*models):
+    """Cache the result of the function in this process until the models change.
+
+    The cached value is dropped as soon as a transaction writing to any of the
+    models' tables is committed in this process. Writes committed by other
+    processes to tables of conditional GETs are seen in their shared versions,
+    which are read with one query per request, so that no stale value gets a
+    remembered ETag. Writes to other tables are picked up after CACHE_MAX_AGE
+    seconds. The function must return plain data (e.g. a marshalled dict), not
+    ORM objects.
+    """
+
+    tables = get_tables(*models)
+
+    def wrapper(func):
+        cache = {}
+
+        @wraps(func)
+        def decorator(*args):
+            version = get_tables_version(tables)
+            shared_tables = tuple(table for table in tables if table in _shared_tables)
+            if shared_tables:
+                version += get_shared_tables_version(shared_tables)
+            entry = cache.get(args)
+            if entry:
+                cached_version, cached_at, value = entry
+                max_age = current_app.config["CACHE_MAX_AGE"]
+                if cached_version == version and monotonic() - cached_at < max_age:
+                    return value
+
+            value = func(*args)
+            if entry:
+                _cached_etags.pop(id(entry[2]), None)
+            _cached_etags[id(value)] = [value, None]
+            cache[args] = (version, monotonic(), value)
+            return value
+
+        decorator.cache = cache
+        return decorator
+
+    return wrapper
+
+
+def hash_payload(data):
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return sha256(payload.encode()).hexdigest()
+
+
+def get_etag(data):
+    """Hash of the marshalled data, computed once for a value of versioned_cache"""
+    cached = _cached_etags.get(id(data))
+    if cached is None or cached[0] is not data:
+        return hash_payload(data)
+    if cached[1] is None:
+        cached[1] = hash_payload(data)
+    return cached[1]
+
+
+def not_modified_response(etag):
+    return current_app.response_class(
+        status=304, headers={"ETag": quote_etag(etag), "Cache-Control": "no-cache"}
+    )
+
+
+def conditional_get(*models):
+    """Add a strong ETag to a GET endpoint and answer If-None-Match with 304.
+
+    Must wrap marshal_with. The ETag is a hash of the marshalled payload, so it
+    is the same in every process. For requests with If-None-Match the ETag of
+    each url is also remembered with the version of the models' tables in the
+    database, which every commit writing to them bumps. While it is unchanged,
+    a matching If-None-Match is answered with one query for the version,
+    without calling the endpoint. Data of versioned_cache is checked against
+    the same versions, so the remembered ETag is never one of stale data.
+    """
+
+    tables = get_tables(*models)
+    _shared_tables.update(tables)
+
+    def wrapper(func):
+        etags = {}
+
+        @wraps(func)
+        def decorator(*args, **kwargs):
+            key = (request.full_path, request.headers.get("X-Fields"))
+            version = None
+            if request.if_none_match:
+                version = get_shared_tables_version(tables)
+                entry = etags.get(key)
+                if entry:
+                    cached_version, etag = entry
+                    if cached_version == version and (
+                        request.if_none_match.contains_weak(etag)
+                    ):
+                        return not_modified_response(etag)
+
+            data, code, headers = unpack(func(*args, **kwargs))
+            if code != 200:
+                return data, code, headers
+
+            etag = get_etag(data)
+            if version is not None:
+                if len(etags) >= MAX_REMEMBERED_ETAGS:
+                    etags.clear()
+                etags[key] = (version, etag)
+
+            if request.if_none_match.contains_weak(etag):
+                return not_modified_response(etag)
+            return (
+                data,
+                code,
+                {**headers, "ETag": quote_etag(etag), "Cache-Control": "no-cache"},
+            )
+
+        return decorator
+
+    return wrapper
@@ -0,0 +1,227 @@
+from collections import Counter
+
+from flask.cli import AppGroup
+from sqlalchemy import case, delete, event, func, inspect, insert, select
+
+from project.database import increment_rows
+from project.extensions import db
+from project.models import (
+    Role,
+    Specialist,
+    StatisticsCounter,
+    Syllabus,
+    Teacher,
+    User,
+)
+from project.roles import get_role_name
+
+
+def syllabus_status_counter(status):
+    return f"syllabus_status:{getattr(status, 'value', status)}"
+
+
+def users_counter(role_name, kind):
+    return f"users:{getattr(role_name, 'value', role_name)}:{kind}"
+
+
+def get_counters():
+    """Get all statistics counters, counting them first if they are not there yet"""
+    counters = dict(
+        db.session.execute(
+            select(StatisticsCounter.name, StatisticsCounter.value)
+        ).all()
+    )
+    return counters or recount_counters()
+
+
+def recount_counters():
+    """Count the statistics from scratch with grouped queries and store them"""
+    counters = Counter()
+
+    syllabus_statuses = db.session.execute(
+        select(Syllabus.status, func.count()).group_by(Syllabus.status)
+    )
+    for status, count in syllabus_statuses:
+        counters[syllabus_status_counter(status)] = count
+
+    for name, model in (("teachers", Teacher), ("experts", Specialist)):
+        registered, verified = db.session.execute(
+            select(func.count(), func.count(case((model.verified, 1))))
+        ).one()
+        counters[f"{name}:registered"] = registered
+        counters[f"{name}:verified"] = verified
+
+    users = db.session.execute(
+        select(
+            Role.name,
+            func.count(User.id),
+            func.count(case((User.email_confirmed, 1))),
+        )
+        .join(User.role)
+        .group_by(Role.name)
+    )
+    for role_name, registered, verified in users:
+        counters[users_counter(role_name, "registered")] = registered
+        counters[users_counter(role_name, "verified")] = verified
+
+    db.session.execute(delete(StatisticsCounter))
+    if counters:
+        db.session.execute(
+            insert(StatisticsCounter),
+            [{"name": name, "value": value} for name, value in counters.items()],
+        )
+    db.session.commit()
+    return dict(counters)
+
+
+counters_cli = AppGroup("counters", help="Statistics counters.")
+
+
+@counters_cli.command("recount")
+def recount_counters_command():
+    """Count all statistics counters from scratch."""
+    for name, value in sorted(recount_counters().items()):
+        print(f"{name}: {value}")
+
+
+def add_to_counters(connection, deltas):
+    """Add the deltas to the stored counters in the current transaction.
+
+    A counter which isn't stored yet is inserted with its delta by the same
+    upsert, so concurrent writers don't race on its primary key.
+    """
+    increment_rows(
+        connection,
+        StatisticsCounter.__table__,
+        "name",
+        "value",
+        {name: delta for name, delta in sorted(deltas.items()) if delta},
+    )
+
+
+def count_syllabus_status_changes(changes):
+    """Update counters for bulk status changes given as (old, new) status pairs"""
+    deltas = Counter()
+    for old_status, new_status in changes:
+        deltas[syllabus_status_counter(old_status)] -= 1
+        deltas[syllabus_status_counter(new_status)] += 1
+    add_to_counters(db.session.connection(), deltas)
+
+
+def _get_stored_values(connection, target, *columns):
+    """Get the values of the columns stored for the target before this flush"""
+    model = type(target)
+    return connection.execute(select(*columns).where(model.id == target.id)).one()
+
+
+def _is_modified(target, *attributes):
+    state = inspect(target)
+    return any(state.attrs[attribute].history.has_changes() for attribute in attributes)
+
+
+@event.listens_for(Syllabus, "after_insert")
+def count_inserted_syllabus(mapper, connection, target):
+    add_to_counters(connection, {syllabus_status_counter(target.status): 1})
+
+
+@event.listens_for(Syllabus, "before_delete")
+def count_deleted_syllabus(mapper, connection, target):
+    (status,) = _get_stored_values(connection, target, Syllabus.status)
+    add_to_counters(connection, {syllabus_status_counter(status): -1})
+
+
+@event.listens_for(Syllabus, "before_update")
+def count_updated_syllabus(mapper, connection, target):
+    if not _is_modified(target, "status"):
+        return
+    (old_status,) = _get_stored_values(connection, target, Syllabus.status)
+    if old_status != target.status:
+        add_to_counters(
+            connection,
+            {
+                syllabus_status_counter(old_status): -1,
+                syllabus_status_counter(target.status): 1,
+            },
+        )
+
+
+def _listen_for_verified_counters(model, name):
+    @event.listens_for(model, "after_insert")
+    def count_inserted(mapper, connection, target):
+        add_to_counters(
+            connection,
+            {f"{name}:registered": 1, f"{name}:verified": int(bool(target.verified))},
+        )
+
+    @event.listens_for(model, "before_delete")
+    def count_deleted(mapper, connection, target):
+        (verified,) = _get_stored_values(connection, target, model.verified)
+        add_to_counters(
+            connection,
+            {f"{name}:registered": -1, f"{name}:verified": -int(bool(verified))},
+        )
+
+    @event.listens_for(model, "before_update")
+    def count_updated(mapper, connection, target):
+        if not _is_modified(target, "verified"):
+            return
+        (verified,) = _get_stored_values(connection, target, model.verified)
+        if bool(verified) != bool(target.verified):
+            add_to_counters(
+                connection, {f"{name}:verified": 1 if target.verified else -1}
+            )
+
+
+_listen_for_verified_counters(Teacher, "teachers")
+_listen_for_verified_counters(Specialist, "experts")
+
+
+@event.listens_for(User, "after_insert")
+def count_inserted_user(mapper, connection, target):
+    role_name = get_role_name(target.role_id)
+    add_to_counters(
+        connection,
+        {
+            users_counter(role_name, "registered"): 1,
+            users_counter(role_name, "verified"): int(bool(target.email_confirmed)),
+        },
+    )
+
+
+@event.listens_for(User, "before_delete")
+def count_deleted_user(mapper, connection, target):
+    role_id, email_confirmed = _get_stored_values(
+        connection, target, User.role_id, User.email_confirmed
+    )
+    role_name = get_role_name(role_id)
+    add_to_counters(
+        connection,
+        {
+            users_counter(role_name, "registered"): -1,
+            users_counter(role_name, "verified"): -int(bool(email_confirmed)),
+        },
+    )
+
+
+@event.listens_for(User, "before_update")
+def count_updated_user(mapper, connection, target):
+    if not _is_modified(target, "role_id", "email_confirmed"):
+        return
+    old_role_id, old_confirmed = _get_stored_values(
+        connection, target, User.role_id, User.email_confirmed
+    )
+    if old_role_id == target.role_id and bool(old_confirmed) == bool(
+        target.email_confirmed
+    ):
+        return
+
+    old_role = get_role_name(old_role_id)
+    new_role = (
+        old_role if target.role_id == old_role_id else get_role_name(target.role_id)
+    )
+    deltas = Counter()
+    deltas[users_counter(old_role, "registered")] -= 1
+    deltas[users_counter(old_role, "verified")] -= int(bool(old_confirmed))
+    deltas[users_counter(new_role, "registered")] += 1
+    deltas[users_counter(new_role, "verified")] += int(bool(target.email_confirmed))
+    add_to_counters(connection, deltas)
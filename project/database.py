@@ -0,0 +1,154 @@
+from collections import Counter
+from os import environ
+from threading import Lock
+from time import perf_counter
+
+from flask import g, has_request_context
+from sqlalchemy import event
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
+
+_pool_events = Counter()
+_pool_events_lock = Lock()
+
+
+def get_engine_options(database_uri):
+    """SQLAlchemy engine options for one worker process, read from the environment.
+
+    The pool is sized for the threads of a gunicorn worker (GUNICORN_THREADS),
+    so that every thread can hold a connection. With DB_MAX_CONNECTIONS set it
+    is shrunk to fit all workers (WEB_CONCURRENCY) into the database limit.
+    """
+    options = {
+        "pool_pre_ping": environ.get("DB_POOL_PRE_PING", "true").lower() == "true",
+        # Hosted MySQL closes connections idle for 300s
+        "pool_recycle": int(environ.get("DB_POOL_RECYCLE", 280)),
+    }
+
+    url = make_url(database_uri) if database_uri else None
+    if url is None or url.get_backend_name() == "sqlite":
+        return options
+
+    workers = int(environ.get("WEB_CONCURRENCY", 1))
+    threads = int(environ.get("GUNICORN_THREADS", 1))
+    pool_size = int(environ.get("DB_POOL_SIZE", threads))
+    max_overflow = int(environ.get("DB_MAX_OVERFLOW", max(pool_size // 2, 1)))
+
+    max_connections = environ.get("DB_MAX_CONNECTIONS")
+    if max_connections:
+        per_worker = max(int(max_connections) // workers, 1)
+        pool_size = min(pool_size, per_worker)
+        max_overflow = min(max_overflow, per_worker - pool_size)
+
+    connect_timeout = int(environ.get("DB_CONNECT_TIMEOUT", 10))
+    return {
+        **options,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": int(environ.get("DB_POOL_TIMEOUT", 30)),
+        "connect_args": {"connect_timeout": connect_timeout},
+    }
+
+
+def increment_rows(connection, table, key, column, increments):
+    """Add {key value: increment} to the column of the table, inserting missing rows.
+
+    Runs one upsert (INSERT ... ON DUPLICATE KEY UPDATE on MySQL, ON CONFLICT
+    on SQLite and PostgreSQL), so concurrent transactions adding to a row
+    which doesn't exist yet don't race on its primary key.
+    """
+    rows = [{key: name, column: value} for name, value in increments.items()]
+    if not rows:
+        return
+
+    dialect = connection.dialect.name
+    if dialect == "mysql":
+        statement = mysql.insert(table)
+        statement = statement.on_duplicate_key_update(
+            {column: table.c[column] + statement.inserted[column]}
+        )
+    else:
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        statement = insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[key],
+            set_={column: table.c[column] + statement.excluded[column]},
+        )
+    connection.execute(statement, rows)
+
+
+def record_request_queries(app, engine):
+    """Record the SQL statements run in the app's requests, see get_request_queries().
+
+    The metrics and the query counter both read the same records, so every
+    statement goes through a single pair of cursor listeners.
+    """
+    if "request_queries" in app.extensions:
+        return
+    app.extensions["request_queries"] = engine
+    app.before_request(_start_request_queries)
+    event.listen(engine, "before_cursor_execute", _start_query)
+    event.listen(engine, "after_cursor_execute", _record_query)
+    event.listen(engine, "handle_error", _forget_failed_query)
+
+
+def get_request_queries():
+    """(statement, parameters, seconds) of the SQL statements run in the request"""
+    return g.get("sql_queries", [])
+
+
+def _start_request_queries():
+    g.sql_queries = []
+
+
+def _start_query(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(perf_counter())
+
+
+def _record_query(conn, cursor, statement, parameters, context, executemany):
+    started_at = conn.info["query_started_at"].pop()
+    if has_request_context() and "sql_queries" in g:
+        g.sql_queries.append((statement, parameters, perf_counter() - started_at))
+
+
+def _forget_failed_query(exception_context):
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started_at"):
+        connection.info["query_started_at"].pop()
+
+
+def watch_pool(engine):
+    """Count connects, checkouts and invalidations of the engine's pool"""
+
+    def count(name):
+        def listener(*args):
+            with _pool_events_lock:
+                _pool_events[name] += 1
+
+        return listener
+
+    for event_name, name in (
+        ("connect", "connects"),
+        ("checkout", "checkouts"),
+        ("checkin", "checkins"),
+        ("invalidate", "invalidations"),
+    ):
+        event.listen(engine, event_name, count(name))
+
+
+def get_pool_stats(engine):
+    """Current state of the engine's pool and its event counters in this process"""
+    pool = engine.pool
+    stats = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+            max_overflow=pool._max_overflow,
+        )
+    with _pool_events_lock:
+        stats.update(_pool_events)
+    return stats
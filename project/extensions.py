@@ -5,6 +5,12 @@ from flask_restx import Api
 from flask_rest_paginate import Pagination
 from flask_jwt_extended import JWTManager
 
+from project.mail_dispatcher import MailDispatcher
+from project.mail_pool import SMTPConnectionPool
+from project.metrics import Metrics
+from project.passwords import PasswordHasher
+from project.query_counter import QueryCounter
+
 api = Api(
     title="API ITClusterPython",
     version="1.0",
@@ -15,3 +21,8 @@ migrate = Migrate()
 pagination = Pagination()
 jwt = JWTManager()
 mail = Mail()
+mail_dispatcher = MailDispatcher()
+mail_pool = SMTPConnectionPool()
+password_hasher = PasswordHasher()
+metrics = Metrics()
+query_counter = QueryCounter()
@@ -0,0 +1,156 @@
+import atexit
+import os
+from queue import Full, Queue
+from smtplib import SMTPException
+from threading import Lock, Thread
+from time import monotonic, sleep
+
+_STOP = object()
+
+
+class MailDispatcher:
+    """Send Flask-Mail messages from a bounded queue in background threads.
+
+    Request handlers only put the messages in the queue. Worker threads send
+    the messages put together over one connection of the SMTP connection pool,
+    retrying failed sends with exponential backoff. The queue is drained when
+    the process exits.
+
+    Config:
+        MAIL_DISPATCH_WORKERS: number of worker threads (default 2)
+        MAIL_DISPATCH_QUEUE_SIZE: max number of waiting messages (default 100)
+        MAIL_DISPATCH_MAX_RETRIES: retries of a failed send (default 3)
+        MAIL_DISPATCH_BACKOFF: seconds before the first retry (default 1)
+        MAIL_DISPATCH_ENQUEUE_TIMEOUT: seconds to wait for a place in a full
+            queue before the message is dropped (default 5)
+        MAIL_DISPATCH_SHUTDOWN_TIMEOUT: seconds to drain the queue on exit
+            (default 30)
+        MAIL_DISPATCH_SYNC: send in the calling thread (default False)
+    """
+
+    def __init__(self, app=None):
+        self.app = None
+        self._queue = None
+        self._threads = []
+        self._pid = None
+        self._lock = Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("MAIL_DISPATCH_WORKERS", 2)
+        app.config.setdefault("MAIL_DISPATCH_QUEUE_SIZE", 100)
+        app.config.setdefault("MAIL_DISPATCH_MAX_RETRIES", 3)
+        app.config.setdefault("MAIL_DISPATCH_BACKOFF", 1)
+        app.config.setdefault("MAIL_DISPATCH_ENQUEUE_TIMEOUT", 5)
+        app.config.setdefault("MAIL_DISPATCH_SHUTDOWN_TIMEOUT", 30)
+        app.config.setdefault("MAIL_DISPATCH_SYNC", False)
+
+        self.app = app
+        app.extensions["mail_dispatcher"] = self
+        atexit.register(self.shutdown)
+
+    def send(self, *messages):
+        """Put the messages in the queue to be sent in the background"""
+        if self.app.config["MAIL_DISPATCH_SYNC"]:
+            self._send_with_retries(messages)
+            return
+
+        self._start()
+        try:
+            self._queue.put(
+                messages, timeout=self.app.config["MAIL_DISPATCH_ENQUEUE_TIMEOUT"]
+            )
+        except Full:
+            for message in messages:
+                self.app.logger.error(
+                    f"Mail queue is full, message '{message.subject}' "
+                    f"to {message.recipients} is dropped"
+                )
+
+    def join(self):
+        """Wait until all messages in the queue are sent"""
+        if self._queue is not None:
+            self._queue.join()
+
+    def shutdown(self, timeout=None):
+        """Stop the workers after they have sent the queued messages"""
+        with self._lock:
+            if self._pid != os.getpid():
+                return
+            threads, self._threads, self._pid = self._threads, [], None
+
+        if timeout is None:
+            timeout = self.app.config["MAIL_DISPATCH_SHUTDOWN_TIMEOUT"]
+        for _ in threads:
+            self._queue.put(_STOP)
+
+        deadline = monotonic() + timeout
+        for thread in threads:
+            thread.join(max(deadline - monotonic(), 0))
+        if any(thread.is_alive() for thread in threads):
+            self.app.logger.error(
+                f"Mail queue is not drained in {timeout}s, "
+                f"~{self._queue.qsize()} messages are not sent"
+            )
+
+    def _start(self):
+        # Threads do not survive a fork, so each worker process starts its own
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = Queue(maxsize=self.app.config["MAIL_DISPATCH_QUEUE_SIZE"])
+            self._threads = [
+                Thread(target=self._work, name=f"mail-dispatcher-{i}", daemon=True)
+                for i in range(self.app.config["MAIL_DISPATCH_WORKERS"])
+            ]
+            for thread in self._threads:
+                thread.start()
+            self._pid = os.getpid()
+
+    def _work(self):
+        queue = self._queue
+        while True:
+            messages = queue.get()
+            try:
+                if messages is _STOP:
+                    return
+                self._send_with_retries(messages)
+            except Exception:
+                # A worker which dies leaves the queue to fill up until every
+                # message is dropped, so it only logs the error and goes on
+                self.app.logger.exception(
+                    f"Failed to send {len(messages)} messages from the queue"
+                )
+            finally:
+                queue.task_done()
+
+    def _send_with_retries(self, messages):
+        pool = self.app.extensions["mail_pool"]
+        retries = self.app.config["MAIL_DISPATCH_MAX_RETRIES"]
+        backoff = self.app.config["MAIL_DISPATCH_BACKOFF"]
+
+        unsent = list(messages)
+        with self.app.app_context():
+            for attempt in range(retries + 1):
+                try:
+                    with pool.connect() as connection:
+                        while unsent:
+                            connection.send(unsent[0])
+                            unsent.pop(0)
+                    return
+                except (SMTPException, OSError) as e:
+                    if attempt == retries:
+                        for message in unsent:
+                            self.app.logger.error(
+                                f"Failed to send '{message.subject}' "
+                                f"to {message.recipients}: {e}"
+                            )
+                        return
+                    self.app.logger.warning(
+                        f"Failed to send '{unsent[0].subject}', "
+                        f"retry {attempt + 1} of {retries}: {e}"
+                    )
+                    sleep(backoff * 2**attempt)
@@ -0,0 +1,176 @@
+import atexit
+import os
+from collections import deque
+from contextlib import contextmanager
+from smtplib import SMTPException, SMTPServerDisconnected
+from threading import Lock
+from time import monotonic, perf_counter
+
+from flask_mail import Connection
+
+from project.metrics import MAIL_CONNECTIONS, MAIL_SEND_LATENCY, MAIL_SENDS
+
+LATENCY_SAMPLES = 1000
+
+
+class PooledConnection(Connection):
+    """Flask-Mail connection over an already authenticated SMTP host"""
+
+    def __init__(self, mail, host, pool):
+        super().__init__(mail)
+        self.host = host
+        self.num_emails = 0
+        self.pool = pool
+        self.broken = False
+
+    def send(self, message, envelope_from=None):
+        started = perf_counter()
+        try:
+            super().send(message, envelope_from)
+        except Exception as e:
+            # Unlike a refused message, these leave the connection unusable
+            if isinstance(e, (SMTPServerDisconnected, OSError)):
+                self.broken = True
+            self.pool.record_send(perf_counter() - started, failed=True)
+            raise
+        self.pool.record_send(perf_counter() - started)
+
+
+class SMTPConnectionPool:
+    """Keep a few authenticated SMTP connections of the app's Mail extension.
+
+    ``connect()`` is used like ``mail.connect()``, but the connection is put
+    back into the pool instead of being closed, so the TCP, STARTTLS and
+    login handshakes are done once for many messages. Connections idle for
+    longer than the timeout, not answering a NOOP when reused or broken by a
+    failed send are closed. ``stats()`` returns the counters and
+    the latency of the sends in this process, which are also exported on
+    /metrics (see project/metrics.py).
+
+    Config:
+        MAIL_POOL_SIZE: max number of idle connections kept (default 2)
+        MAIL_POOL_IDLE_TIMEOUT: seconds an idle connection is kept (default 30)
+    """
+
+    def __init__(self, app=None):
+        self.app = None
+        self._idle = []
+        self._pid = None
+        self._lock = Lock()
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+        self._counters = dict.fromkeys(
+            ("sent", "failed", "connections_opened", "connections_reused"), 0
+        )
+        self._send_seconds_total = 0.0
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("MAIL_POOL_SIZE", 2)
+        app.config.setdefault("MAIL_POOL_IDLE_TIMEOUT", 30)
+
+        self.app = app
+        app.extensions["mail_pool"] = self
+        atexit.register(self.close_all)
+
+    @contextmanager
+    def connect(self):
+        """Get a pooled connection for sending one or more messages"""
+        mail = self.app.extensions["mail"]
+        host = self._acquire(mail)
+        connection = PooledConnection(mail, host, self)
+        try:
+            yield connection
+        except BaseException:
+            self._close(connection.host)
+            raise
+        self._release(connection)
+
+    def close_all(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for host, _ in idle:
+            self._close(host)
+
+    def record_send(self, seconds, failed=False):
+        with self._lock:
+            self._counters["failed" if failed else "sent"] += 1
+            self._send_seconds_total += seconds
+            self._latencies.append(seconds)
+        MAIL_SENDS.labels(result="failed" if failed else "sent").inc()
+        MAIL_SEND_LATENCY.observe(seconds)
+
+    def stats(self):
+        """Counters of the pool and the send latency in seconds"""
+        with self._lock:
+            latencies = sorted(self._latencies)
+            stats = {
+                **self._counters,
+                "idle_connections": len(self._idle),
+                "send_seconds_total": self._send_seconds_total,
+            }
+
+        def percentile(p):
+            return latencies[int(p * (len(latencies) - 1))] if latencies else None
+
+        return {
+            **stats,
+            "send_seconds_p50": percentile(0.5),
+            "send_seconds_p95": percentile(0.95),
+            "send_seconds_max": latencies[-1] if latencies else None,
+        }
+
+    def _acquire(self, mail):
+        if mail.suppress:
+            return None
+
+        timeout = self.app.config["MAIL_POOL_IDLE_TIMEOUT"]
+        while True:
+            with self._lock:
+                # Connections of the parent process can't be used after a fork
+                if self._pid != os.getpid():
+                    self._idle, self._pid = [], os.getpid()
+                if not self._idle:
+                    self._counters["connections_opened"] += 1
+                    MAIL_CONNECTIONS.labels(origin="opened").inc()
+                    break
+                host, released_at = self._idle.pop()
+
+            # The server may have closed an idle connection on its side
+            if monotonic() - released_at < timeout and self._is_alive(host):
+                with self._lock:
+                    self._counters["connections_reused"] += 1
+                MAIL_CONNECTIONS.labels(origin="reused").inc()
+                return host
+            self._close(host)
+
+        return Connection(mail).configure_host()
+
+    def _release(self, connection):
+        host = connection.host
+        if host is None:
+            return
+        if not connection.broken:
+            with self._lock:
+                if self._pid == os.getpid() and (
+                    len(self._idle) < self.app.config["MAIL_POOL_SIZE"]
+                ):
+                    self._idle.append((host, monotonic()))
+                    return
+        self._close(host)
+
+    @staticmethod
+    def _is_alive(host):
+        try:
+            return host.noop()[0] == 250
+        except (SMTPException, OSError):
+            return False
+
+    @staticmethod
+    def _close(host):
+        if host is None:
+            return
+        try:
+            host.quit()
+        except (SMTPException, OSError):
+            host.close()
@@ -0,0 +1,144 @@
+import os
+from time import perf_counter
+
+from flask import current_app, g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+from project.database import get_request_queries, record_request_queries
+
+LABELS = ("namespace", "resource", "method")
+
+REQUESTS = Counter(
+    "http_requests_total",
+    "Number of handled requests",
+    (*LABELS, "status"),
+)
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time spent handling a request",
+    LABELS,
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Size of the response body",
+    LABELS,
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+)
+REQUEST_DB_TIME = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent in database queries during a request",
+    LABELS,
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Number of database queries during a request",
+    LABELS,
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 200),
+)
+
+MAIL_SENDS = Counter(
+    "mail_sends_total",
+    "Number of emails sent over pooled SMTP connections",
+    ("result",),
+)
+MAIL_SEND_LATENCY = Histogram(
+    "mail_send_duration_seconds",
+    "Time spent sending an email over a pooled SMTP connection",
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+MAIL_CONNECTIONS = Counter(
+    "mail_pool_connections_total",
+    "Number of SMTP connections taken from the pool, opened or reused",
+    ("origin",),
+)
+
+
+class Metrics:
+    """Record per-endpoint request metrics and serve them at /metrics.
+
+    Requests are labelled with the RESTX namespace and resource, so urls with
+    different ids are counted together. With PROMETHEUS_MULTIPROC_DIR set,
+    every gunicorn worker writes its metrics to that directory and /metrics
+    aggregates all of them (see gunicorn.conf.py).
+    """
+
+    def __init__(self, app=None, api=None, db=None):
+        self.api = None
+        self._resource_namespaces = None
+        if app is not None:
+            self.init_app(app, api, db)
+
+    def init_app(self, app, api, db):
+        self.api = api
+        self._resource_namespaces = None
+
+        app.before_request(self._start_request)
+        app.after_request(self._record_request)
+        app.add_url_rule("/metrics", "metrics", self.metrics_view)
+
+        with app.app_context():
+            record_request_queries(app, db.engine)
+
+    def get_labels(self):
+        """Namespace, resource and method of the current request"""
+        view = request.url_rule and self._get_view_class()
+        if view is None:
+            resource = request.endpoint or "unmatched"
+            return {"namespace": "", "resource": resource, "method": request.method}
+        return {
+            "namespace": self._get_resource_namespaces().get(view, ""),
+            "resource": view.__name__,
+            "method": request.method,
+        }
+
+    @staticmethod
+    def metrics_view():
+        registry = REGISTRY
+        if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+
+        return generate_latest(registry), 200, {"Content-Type": CONTENT_TYPE_LATEST}
+
+    @staticmethod
+    def _get_view_class():
+        view = current_app.view_functions.get(request.endpoint)
+        return getattr(view, "view_class", None)
+
+    def _get_resource_namespaces(self):
+        if self._resource_namespaces is None:
+            self._resource_namespaces = {
+                resource.resource: namespace.name
+                for namespace in self.api.namespaces
+                for resource in namespace.resources
+            }
+        return self._resource_namespaces
+
+    @staticmethod
+    def _start_request():
+        g.metrics_started_at = perf_counter()
+
+    def _record_request(self, response):
+        if request.endpoint == "metrics" or "metrics_started_at" not in g:
+            return response
+
+        labels = self.get_labels()
+        REQUESTS.labels(**labels, status=response.status_code).inc()
+        REQUEST_LATENCY.labels(**labels).observe(perf_counter() - g.metrics_started_at)
+        size = response.calculate_content_length()
+        if size is not None:
+            RESPONSE_SIZE.labels(**labels).observe(size)
+        queries = get_request_queries()
+        REQUEST_DB_TIME.labels(**labels).observe(sum(query[2] for query in queries))
+        REQUEST_DB_QUERIES.labels(**labels).observe(len(queries))
+        return response
@@ -7,7 +7,9 @@ from project.extensions import db
 class Assessment(db.Model):
     __tablename__ = "assessment"
     id: int = db.Column(db.Integer, primary_key=True)
-    syllabus_id: int = db.Column(db.ForeignKey("syllabuses.id"), nullable=False)
+    syllabus_id: int = db.Column(
+        db.ForeignKey("syllabuses.id"), nullable=False, index=True
+    )
     object: str = db.Column(db.String(255), nullable=False)
     method: str = db.Column(db.String(255), nullable=False)
     tool: str = db.Column(db.String(255), nullable=False)
@@ -19,7 +21,9 @@ class Department(db.Model):
     __tablename__ = "department"
     id: int = db.Column(db.Integer, primary_key=True)
     name: str = db.Column(db.String(100), nullable=False)
-    university_id: int = db.Column(db.ForeignKey("university.id"), nullable=False)
+    university_id: int = db.Column(
+        db.ForeignKey("university.id"), nullable=False, index=True
+    )
     description: str = db.Column(db.Text, nullable=False)
     address: str = db.Column(db.String(255), nullable=False)
     email: str = db.Column(db.String(45), nullable=False)
@@ -59,12 +63,14 @@ class Discipline(db.Model):
     __tablename__ = "disciplines"
     id: int = db.Column(db.Integer, primary_key=True)
     name: str = db.Column(db.String(100), nullable=False)
-    teacher_id: int = db.Column(db.ForeignKey("teachers.id"), nullable=False)
+    teacher_id: int = db.Column(
+        db.ForeignKey("teachers.id"), nullable=False, index=True
+    )
     discipline_group_id: int = db.Column(
-        db.ForeignKey("discipline_groups.id"), nullable=False
+        db.ForeignKey("discipline_groups.id"), nullable=False, index=True
     )
     education_program_id: int = db.Column(
-        db.ForeignKey("education_programs.id"), nullable=False
+        db.ForeignKey("education_programs.id"), nullable=False, index=True
     )
     syllabus_url: str = db.Column(db.String(255))
     education_plan_url: str = db.Column(db.String(255))
@@ -99,7 +105,9 @@ class DisciplineGroup(db.Model):
     id: int = db.Column(db.Integer, primary_key=True)
     name: str = db.Column(db.String(100), nullable=False)
     description: str = db.Column(db.Text)
-    block_id: int = db.Column(db.ForeignKey("discipline_blocks.id"), nullable=False)
+    block_id: int = db.Column(
+        db.ForeignKey("discipline_blocks.id"), nullable=False, index=True
+    )
     discipline_url: str = db.Column(db.String(255))
 
     disciplines = db.relationship(
@@ -145,7 +153,9 @@ class DisciplineInfo(db.Model):
 class DisciplineStructure(db.Model):
     __tablename__ = "structure_of_discipline"
     id: int = db.Column(db.Integer, primary_key=True)
-    module_id: int = db.Column(db.ForeignKey("syllabus_module.id"), nullable=False)
+    module_id: int = db.Column(
+        db.ForeignKey("syllabus_module.id"), nullable=False, index=True
+    )
     theoretical_topic: str = db.Column(db.Text, nullable=False)
     theoretical_hours: int = db.Column(db.Integer)
     practice_topics: str = db.Column(db.Text)
@@ -171,13 +181,17 @@ class EducationProgram(db.Model):
     id: int = db.Column(db.Integer, primary_key=True)
     name: str = db.Column(db.String(255), nullable=False)
     education_level_id: int = db.Column(
-        db.ForeignKey("education_levels.id"), nullable=False
+        db.ForeignKey("education_levels.id"), nullable=False, index=True
     )
     guarantor: str = db.Column(db.String(100), nullable=False)
-    department_id: int = db.Column(db.ForeignKey("department.id"), nullable=False)
+    department_id: int = db.Column(
+        db.ForeignKey("department.id"), nullable=False, index=True
+    )
     program_url: str = db.Column(db.String(255), nullable=False)
     syllabus_url: str = db.Column(db.String(255), nullable=False)
-    specialty_id: str = db.Column(db.ForeignKey("specialty.id"), nullable=False)
+    specialty_id: str = db.Column(
+        db.ForeignKey("specialty.id"), nullable=False, index=True
+    )
 
     disciplines = db.relationship(
         "Discipline", back_populates="education_program", cascade="all, delete"
@@ -196,7 +210,9 @@ class EducationProgram(db.Model):
 class GraduateTask(db.Model):
     __tablename__ = "graduate_task"
     id: int = db.Column(db.Integer, primary_key=True)
-    syllabus_id: int = db.Column(db.ForeignKey("syllabuses.id"), nullable=False)
+    syllabus_id: int = db.Column(
+        db.ForeignKey("syllabuses.id"), nullable=False, index=True
+    )
     name: str = db.Column(db.String(255), nullable=False)
     controls: str = db.Column(db.Text)
     deadlines: str = db.Column(db.String(255))
@@ -207,16 +223,31 @@ class GraduateTask(db.Model):
 class MarketRelation(db.Model):
     __tablename__ = "stakeholder"
     id: int = db.Column(db.Integer, primary_key=True)
-    syllabus_id: int = db.Column(db.ForeignKey("syllabuses.id"), nullable=False)
+    syllabus_id: int = db.Column(
+        db.ForeignKey("syllabuses.id"), nullable=False, index=True
+    )
     specialty: str = db.Column(db.String(255))
     vacancies: str = db.Column(db.Text)
     skills: str = db.Column(db.Text)
     relevant_materials: str = db.Column(db.Text)
     borrowed_materials: str = db.Column(db.Text)
 
-    syllabus = db.relationship(
-        "Syllabus", back_populates="market_relations", uselist=False
+    syllabus = db.relationship("Syllabus", back_populates="market_relations")
+
+
+class OutboxMessage(db.Model):
+    __tablename__ = "outbox"
+    id: int = db.Column(db.Integer, primary_key=True)
+    subject: str = db.Column(db.String(255), nullable=False)
+    recipients: str = db.Column(db.Text, nullable=False)
+    html: str = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    attempts: int = db.Column(db.Integer, default=0, nullable=False)
+    last_error: str = db.Column(db.Text)
+    next_attempt_at = db.Column(
+        db.DateTime, default=datetime.utcnow, nullable=False, index=True
     )
+    sent_at = db.Column(db.DateTime, index=True)
 
 
 class Position(db.Model):
@@ -254,7 +285,9 @@ class Roles(str, Enum):
 class SelfStudyTopic(db.Model):
     __tablename__ = "topic_for_self_study"
     id: int = db.Column(db.Integer, primary_key=True)
-    syllabus_id: int = db.Column(db.ForeignKey("syllabuses.id"), nullable=False)
+    syllabus_id: int = db.Column(
+        db.ForeignKey("syllabuses.id"), nullable=False, index=True
+    )
     name: str = db.Column(db.Text, nullable=False)
     controls: str = db.Column(db.Text)
     hours: int = db.Column(db.Integer)
@@ -274,7 +307,7 @@ class Specialist(db.Model):
     discipline_type: str = db.Column(db.String(100), nullable=False)
     experience: int = db.Column(db.Integer, nullable=False)
     url_cv: str = db.Column(db.String(255))
-    role_id: int = db.Column(db.ForeignKey("role.id"), nullable=False)
+    role_id: int = db.Column(db.ForeignKey("role.id"), nullable=False, index=True)
     verified: bool = db.Column(db.Boolean, nullable=False, default=False)
 
     role = db.relationship("Role", back_populates="specialists")
@@ -295,11 +328,23 @@ class Specialty(db.Model):
     )
 
 
+class StatisticsCounter(db.Model):
+    __tablename__ = "statistics_counter"
+    name: str = db.Column(db.String(100), primary_key=True)
+    value: int = db.Column(db.Integer, nullable=False, default=0)
+
+
+class TableVersion(db.Model):
+    __tablename__ = "table_version"
+    name: str = db.Column(db.String(100), primary_key=True)
+    version: int = db.Column(db.Integer, nullable=False, default=0)
+
+
 class Syllabus(db.Model):
     __tablename__ = "syllabuses"
     id: int = db.Column(db.Integer, primary_key=True)
     name: str = db.Column(db.String(255), nullable=False)
-    status: str = db.Column(db.String(45), nullable=False)
+    status: str = db.Column(db.String(45), nullable=False, index=True)
     discipline_id: int = db.Column(
         db.ForeignKey("disciplines.id"), nullable=False, unique=True
     )
@@ -326,7 +371,6 @@ class Syllabus(db.Model):
     market_relations = db.relationship(
         "MarketRelation",
         back_populates="syllabus",
-        uselist=False,
         cascade="all, delete",
     )
     modules = db.relationship(
@@ -349,7 +393,9 @@ class SyllabusBaseInfo(db.Model):
     syllabus_id: int = db.Column(
         db.ForeignKey("syllabuses.id"), nullable=False, unique=True
     )
-    specialty_id: int = db.Column(db.ForeignKey("specialty.id"), nullable=False)
+    specialty_id: int = db.Column(
+        db.ForeignKey("specialty.id"), nullable=False, index=True
+    )
     student_count: int = db.Column(db.Integer, default=None)
     course: int = db.Column(db.Integer, default=None)
     semester: int = db.Column(db.Integer, default=None)
@@ -377,7 +423,9 @@ class SyllabusBaseInfo(db.Model):
 class SyllabusModule(db.Model):
     __tablename__ = "syllabus_module"
     id: int = db.Column(db.Integer, primary_key=True)
-    syllabus_id: int = db.Column(db.ForeignKey("syllabuses.id"), nullable=False)
+    syllabus_id: int = db.Column(
+        db.ForeignKey("syllabuses.id"), nullable=False, index=True
+    )
     name: str = db.Column(db.String(255), nullable=False)
 
     topics = db.relationship(
@@ -399,12 +447,16 @@ class Teacher(db.Model):
     __tablename__ = "teachers"
     id: int = db.Column(db.Integer, primary_key=True)
     name: str = db.Column(db.String(50), nullable=False)
-    position_id: int = db.Column(db.ForeignKey("position.id"), nullable=False)
+    position_id: int = db.Column(
+        db.ForeignKey("position.id"), nullable=False, index=True
+    )
     email: str = db.Column(db.String(100), nullable=False, unique=True)
-    department_id: int = db.Column(db.ForeignKey("department.id"), nullable=False)
+    department_id: int = db.Column(
+        db.ForeignKey("department.id"), nullable=False, index=True
+    )
     comments: str = db.Column(db.Text)
     degree_level: str = db.Column(db.String(50))
-    role_id: int = db.Column(db.ForeignKey("role.id"), nullable=False)
+    role_id: int = db.Column(db.ForeignKey("role.id"), nullable=False, index=True)
     verified: bool = db.Column(db.Boolean, nullable=False, default=False)
 
     disciplines = db.relationship(
@@ -442,7 +494,7 @@ class User(db.Model):
     password_hash: str = db.Column(db.String(255), nullable=False)
     phone: str = db.Column(db.String(45), nullable=False)
     created_at = db.Column(db.Date, default=datetime.utcnow())
-    role_id: int = db.Column(db.ForeignKey("role.id"), nullable=False)
+    role_id: int = db.Column(db.ForeignKey("role.id"), nullable=False, index=True)
     email_confirmed: bool = db.Column(db.Boolean, default=False, nullable=False)
     active_status: bool = db.Column(db.Boolean, default=True, nullable=False)
 
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+from smtplib import SMTPException, SMTPRecipientsRefused, SMTPResponseException
+from time import sleep
+
+import click
+from flask.cli import AppGroup
+from flask_mail import Message
+from sqlalchemy import select
+
+from project.extensions import db, mail_pool
+from project.models import OutboxMessage
+
+outbox_cli = AppGroup("outbox", help="Outgoing emails.")
+
+
+def add_to_outbox(subject, html, recipients):
+    """Add the email to the session, so it is sent only if the transaction commits"""
+    message = OutboxMessage(subject=subject, html=html, recipients=",".join(recipients))
+    db.session.add(message)
+    return message
+
+
+def drain_outbox(batch_size, max_attempts, backoff=60):
+    """Send one batch of due unsent emails over a single pooled SMTP connection.
+
+    Emails are sent at least once: if the process dies after sending and
+    before the commit, the batch is sent again. A failed email is retried
+    after BACKOFF seconds, doubled on each attempt. Returns the number of
+    sent emails.
+    """
+    now = datetime.utcnow()
+    messages = db.session.scalars(
+        select(OutboxMessage)
+        .where(
+            OutboxMessage.sent_at.is_(None),
+            OutboxMessage.attempts < max_attempts,
+            OutboxMessage.next_attempt_at <= now,
+        )
+        .order_by(OutboxMessage.attempts, OutboxMessage.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    ).all()
+    if not messages:
+        db.session.commit()
+        return 0
+
+    for message in messages:
+        message.attempts += 1
+        message.last_error = None
+
+    try:
+        with mail_pool.connect() as connection:
+            for message in messages:
+                try:
+                    connection.send(
+                        Message(
+                            subject=message.subject,
+                            recipients=message.recipients.split(","),
+                            html=message.html,
+                        )
+                    )
+                    message.sent_at = datetime.utcnow()
+                except (SMTPRecipientsRefused, SMTPResponseException) as e:
+                    # The server refused this email, but the connection is
+                    # still usable unless the server is closing it (421)
+                    message.last_error = str(e)
+                    if getattr(e, "smtp_code", None) == 421:
+                        raise
+    except (SMTPException, OSError) as e:
+        # The connection is broken and closed by the pool, the rest of the
+        # batch is retried later
+        for message in messages:
+            if message.sent_at is None and message.last_error is None:
+                message.last_error = str(e)
+
+    for message in messages:
+        if message.sent_at is None:
+            delay = backoff * 2 ** (message.attempts - 1)
+            message.next_attempt_at = now + timedelta(seconds=delay)
+
+    db.session.commit()
+    return sum(message.sent_at is not None for message in messages)
+
+
+@outbox_cli.command("drain")
+@click.option("--batch-size", default=50, show_default=True)
+@click.option("--max-attempts", default=5, show_default=True)
+@click.option(
+    "--backoff",
+    default=60.0,
+    show_default=True,
+    help="Seconds before the first retry of a failed email, doubled on each retry.",
+)
+@click.option(
+    "--interval",
+    default=0.0,
+    show_default=True,
+    help="Keep polling the outbox every INTERVAL seconds, 0 to exit when it is empty.",
+)
+def drain_outbox_command(batch_size, max_attempts, backoff, interval):
+    """Send the emails waiting in the outbox."""
+    while True:
+        if drain_outbox(batch_size, max_attempts, backoff):
+            continue
+        if not interval:
+            return
+        sleep(interval)
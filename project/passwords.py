@@ -0,0 +1,85 @@
+import atexit
+import os
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class PasswordHasher:
+    """Hash and check passwords with the method and cost set in the config.
+
+    With PASSWORD_HASH_PROCESSES > 0 the key derivation runs in a process
+    pool, so the request thread only waits for the result and doesn't hold
+    the GIL while hashing.
+
+    Config:
+        PASSWORD_HASH_METHOD: werkzeug hash method with its cost, e.g.
+            ``scrypt:32768:8:1`` or ``pbkdf2:sha256:600000`` (default scrypt)
+        PASSWORD_SALT_LENGTH: length of the salt (default 16)
+        PASSWORD_HASH_PROCESSES: size of the process pool, 0 to hash in the
+            calling thread (default 0)
+    """
+
+    def __init__(self, app=None):
+        self.app = None
+        self._method = None
+        self._executor = None
+        self._pid = None
+        self._lock = Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.config.setdefault("PASSWORD_HASH_METHOD", "scrypt")
+        app.config.setdefault("PASSWORD_SALT_LENGTH", 16)
+        app.config.setdefault("PASSWORD_HASH_PROCESSES", 0)
+
+        self.app = app
+        self._method = None
+        app.extensions["password_hasher"] = self
+        atexit.register(self.shutdown)
+
+    def hash(self, password):
+        return self._run(
+            generate_password_hash,
+            password,
+            self.app.config["PASSWORD_HASH_METHOD"],
+            self.app.config["PASSWORD_SALT_LENGTH"],
+        )
+
+    def check(self, password_hash, password):
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        """Check if the hash was made with other method or cost than configured"""
+        return password_hash.split("$", 1)[0] != self.method
+
+    @property
+    def method(self):
+        """Configured method with all its parameters, as it is stored in hashes"""
+        configured = self.app.config["PASSWORD_HASH_METHOD"]
+        if self._method is None or self._method[0] != configured:
+            # werkzeug fills in the default cost, e.g. "scrypt" -> "scrypt:32768:8:1"
+            method = generate_password_hash("", configured, 1).split("$", 1)[0]
+            self._method = (configured, method)
+        return self._method[1]
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self._pid == os.getpid():
+            executor.shutdown()
+
+    def _run(self, func, *args):
+        processes = self.app.config["PASSWORD_HASH_PROCESSES"]
+        if not processes:
+            return func(*args)
+
+        # The pool of the parent process can't be used after a fork
+        with self._lock:
+            if self._executor is None or self._pid != os.getpid():
+                self._executor = ProcessPoolExecutor(max_workers=processes)
+                self._pid = os.getpid()
+            executor = self._executor
+        return executor.submit(func, *args).result()
@@ -0,0 +1,93 @@
+from collections import defaultdict
+from functools import wraps
+
+from flask import current_app, request
+
+from project.database import get_request_queries, record_request_queries
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def query_budget(max_queries: int):
+    """Set the max number of SQL statements the method may run in a request.
+
+    Must be the outermost decorator of the method.
+    """
+
+    def wrapper(func):
+        @wraps(func)
+        def decorator(*args, **kwargs):
+            return func(*args, **kwargs)
+
+        decorator.query_budget = max_queries
+        return decorator
+
+    return wrapper
+
+
+class QueryCounter:
+    """Count the SQL statements of each request and report N+1 patterns.
+
+    A statement run QUERY_N_PLUS_ONE_THRESHOLD times or more with different
+    parameters in one request is logged as N+1 with the endpoint name. With
+    QUERY_BUDGET_RAISE (e.g. in tests) a request running more statements than
+    its budget raises QueryBudgetExceeded, otherwise it is logged.
+
+    Config:
+        QUERY_COUNTER_ENABLED: count statements (default True)
+        QUERY_N_PLUS_ONE_THRESHOLD: repeats of a statement to report (default 5)
+        QUERY_BUDGETS: {endpoint: max statements} for endpoints without
+            the query_budget decorator (default {})
+        QUERY_BUDGET_RAISE: raise instead of logging (default False)
+    """
+
+    def __init__(self, app=None, db=None):
+        if app is not None:
+            self.init_app(app, db)
+
+    def init_app(self, app, db):
+        app.config.setdefault("QUERY_COUNTER_ENABLED", True)
+        app.config.setdefault("QUERY_N_PLUS_ONE_THRESHOLD", 5)
+        app.config.setdefault("QUERY_BUDGETS", {})
+        app.config.setdefault("QUERY_BUDGET_RAISE", False)
+        if not app.config["QUERY_COUNTER_ENABLED"]:
+            return
+
+        app.after_request(self._check_request)
+        with app.app_context():
+            record_request_queries(app, db.engine)
+
+    @staticmethod
+    def get_budget():
+        view = current_app.view_functions.get(request.endpoint)
+        view_class = getattr(view, "view_class", None)
+        method = getattr(view_class, request.method.lower(), None)
+        budget = getattr(method, "query_budget", None)
+        if budget is None:
+            budget = current_app.config["QUERY_BUDGETS"].get(request.endpoint)
+        return budget
+
+    def _check_request(self, response):
+        statements = defaultdict(list)
+        for statement, parameters, _ in get_request_queries():
+            statements[statement].append(repr(parameters))
+
+        endpoint = f"{request.method} {request.endpoint}"
+        threshold = current_app.config["QUERY_N_PLUS_ONE_THRESHOLD"]
+        for statement, parameters in statements.items():
+            if len(set(parameters)) >= threshold:
+                current_app.logger.warning(
+                    f"N+1 in {endpoint}: {len(parameters)} x "
+                    f"{' '.join(statement.split())}"
+                )
+
+        total = sum(len(parameters) for parameters in statements.values())
+        budget = self.get_budget()
+        if budget is not None and total > budget:
+            message = f"{endpoint} ran {total} SQL statements, the budget is {budget}"
+            if current_app.config["QUERY_BUDGET_RAISE"]:
+                raise QueryBudgetExceeded(message)
+            current_app.logger.warning(message)
+        return response
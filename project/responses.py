@@ -0,0 +1,83 @@
+from functools import wraps
+
+from flask import request
+from sqlalchemy import inspect
+
+from project.serializers import marshal
+
+RETURN_MINIMAL = "minimal"
+RETURN_ENTITY = "entity"
+
+
+def get_return_preference():
+    """Get the response the client asked for with ?return= or the Prefer header"""
+    preference = request.args.get("return")
+    if not preference:
+        for token in request.headers.get("Prefer", "").split(","):
+            name, _, value = token.split(";")[0].partition("=")
+            if name.strip().lower() == "return":
+                preference = value.strip().strip('"')
+                break
+
+    if preference == "representation":
+        return RETURN_ENTITY
+    if preference in (RETURN_MINIMAL, RETURN_ENTITY):
+        return preference
+    return None
+
+
+def mutation_response(namespace, list_model, entity_model, get_list_response):
+    """Decorator for POST/PATCH/DELETE methods returning the affected entity.
+
+    By default the whole list built by get_list_response is returned, as before.
+    With ``Prefer: return=representation`` or ``?return=entity`` only the entity
+    is returned, and with ``Prefer: return=minimal`` or ``?return=minimal`` the
+    response is 204 with the entity's url in the Location header, so the list
+    is not reloaded. DELETE answers 204 to both preferences.
+    """
+
+    def wrapper(func):
+        @namespace.doc(
+            params={
+                "return": {
+                    "in": "query",
+                    "description": "'entity' or 'minimal' to skip returning the list",
+                    "enum": [RETURN_ENTITY, RETURN_MINIMAL],
+                },
+                "Prefer": {
+                    "in": "header",
+                    "description": "'return=representation' or 'return=minimal'",
+                },
+            }
+        )
+        @namespace.response(200, "Success", list_model)
+        @namespace.response(204, "Success, nothing is returned for return=minimal")
+        @wraps(func)
+        def decorator(*args, **kwargs):
+            preference = get_return_preference()
+            entity = func(*args, **kwargs)
+
+            if preference == RETURN_MINIMAL or (
+                preference and request.method == "DELETE"
+            ):
+                headers = {"Preference-Applied": "return=minimal"}
+                if request.method == "POST":
+                    entity_id = inspect(entity).identity[0]
+                    headers["Location"] = f"{request.base_url.rstrip('/')}/{entity_id}"
+                elif request.method != "DELETE":
+                    headers["Location"] = request.base_url
+                return None, 204, headers
+
+            if preference == RETURN_ENTITY:
+                status = 201 if request.method == "POST" else 200
+                return (
+                    marshal(entity, entity_model),
+                    status,
+                    {"Preference-Applied": "return=representation"},
+                )
+
+            return marshal(get_list_response(), list_model)
+
+        return decorator
+
+    return wrapper
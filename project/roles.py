@@ -0,0 +1,29 @@
+from sqlalchemy import select
+
+from project.cache import versioned_cache
+from project.extensions import db
+from project.models import Role, Roles
+
+
+@versioned_cache(Role)
+def get_role_registry():
+    """Map role names to ids and ids to names, reloaded after Role writes"""
+    roles = db.session.execute(select(Role.id, Role.name)).all()
+    return {name: id for id, name in roles}, {id: name for id, name in roles}
+
+
+def _lookup(index, key):
+    registry = get_role_registry()[index]
+    if key not in registry:
+        # The role may be added by another process after the registry was loaded
+        get_role_registry.cache.clear()
+        registry = get_role_registry()[index]
+    return registry[key]
+
+
+def get_role_id(role: Roles) -> int:
+    return _lookup(0, Roles(role).value)
+
+
+def get_role_name(role_id: int) -> str:
+    return _lookup(1, role_id)
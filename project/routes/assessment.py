@@ -15,7 +15,7 @@ assessment_ns = Namespace(
 
 
 def create_assessments(syllabus_id, assessments):
-
+    """Add the assessments to the session, committed with the syllabus status"""
     for fields in assessments:
         assessment = Assessment(
             syllabus_id=syllabus_id,
@@ -25,8 +25,6 @@ def create_assessments(syllabus_id, assessments):
         )
         db.session.add(assessment)
 
-    db.session.commit()
-
 
 def get_assessment_or_404(id):
     assessment = Assessment.query.get(id)
@@ -90,8 +88,6 @@ class TeachersDetail(Resource):
             if key in plain_params:
                 setattr(assessment, key, value)
 
-        db.session.commit()
-
         set_syllabus_filling_status(syllabus.id)
 
         return get_assessment_response(syllabus.id)
@@ -106,8 +102,6 @@ class TeachersDetail(Resource):
         verify_teacher(syllabus)
 
         db.session.delete(assessment)
-        db.session.commit()
-
         set_syllabus_filling_status(syllabus.id)
 
         return get_assessment_response(syllabus.id)
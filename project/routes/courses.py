@@ -1,12 +1,13 @@
-from flask_jwt_extended import get_jwt_identity
-from flask_restx import Resource, Namespace, abort
-from sqlalchemy import desc
-from sqlalchemy.orm import joinedload
+from flask_jwt_extended import get_jwt_identity, jwt_required
+from flask_restx import Resource, abort
+from sqlalchemy.orm import contains_eager
 
 from project.models import Discipline, Teacher, Roles
 from project.extensions import db
 from project.schemas.authorization import authorizations
-from project.schemas.service_info import serviced_course_model
+from project.schemas.courses import paginated_course_model
+from project.schemas.pagination import cursor_pagination_parser, paginate_query_by_id
+from project.serializers import Namespace
 from project.validators import allowed_roles
 
 courses_ns = Namespace(name="courses",
@@ -16,15 +17,16 @@ courses_ns = Namespace(name="courses",
 
 def get_courses(teacher_id: int):
     """Get list of courses"""
-    disciplines = db.session.query(Discipline) \
-        .options(joinedload(Discipline.syllabus)) \
-        .filter_by(teacher_id=teacher_id) \
-        .order_by(desc("id")).all()
+    page = paginate_query_by_id(
+        db.session.query(Discipline)
+        .join(Discipline.syllabus)
+        .options(contains_eager(Discipline.syllabus))
+        .filter(Discipline.teacher_id == teacher_id),
+        Discipline.id,
+    )
     result = []
-    for discipline in disciplines:
+    for discipline in page["content"]:
         syllabus = discipline.syllabus
-        if not syllabus:
-            continue
         result.append({
             "teacher_id": teacher_id,
             "discipline": {
@@ -37,17 +39,15 @@ def get_courses(teacher_id: int):
                 "status": syllabus.status
             }
         })
-    return {
-        "content": result,
-        "totalElements": len(result)
-    }
+    return {**page, "content": result}
 
 
 @courses_ns.route("/<int:teacher_id>")
 class CoursesList(Resource):
     """Shows a list of all courses of a given teacher"""
 
-    @courses_ns.marshal_with(serviced_course_model)
+    @courses_ns.expect(cursor_pagination_parser)
+    @courses_ns.marshal_with(paginated_course_model)
     def get(self, teacher_id):
         """Get list of courses by given teacher_id"""
         return get_courses(teacher_id)
@@ -59,7 +59,9 @@ class CoursesListMy(Resource):
     @courses_ns.doc(security="jsonWebToken",
                     description="Shows all courses of the logged teacher")
     @courses_ns.response(400, "Teacher with email <email> does not exist")
-    @courses_ns.marshal_with(serviced_course_model)
+    @courses_ns.expect(cursor_pagination_parser)
+    @courses_ns.marshal_with(paginated_course_model)
+    @jwt_required()
     @allowed_roles([Roles.TEACHER])
     def get(self):
         email = get_jwt_identity()
@@ -1,14 +1,17 @@
-from flask_restx import Resource, Namespace, abort
+from flask_restx import Resource, abort
 
 from project.extensions import db
 from project.models import Department, University, Roles
+from project.responses import mutation_response
 from project.schemas.authorization import authorizations
 from project.schemas.departments import (
     department_model,
     department_query_model,
     contacts_model,
 )
+from project.schemas.pagination import pagination_parser, paginate_query
 from project.schemas.service_info import serviced_department_model
+from project.serializers import Namespace
 from project.validators import validate_site, allowed_roles
 
 departments_ns = Namespace(
@@ -20,23 +23,19 @@ departments_ns = Namespace(
 
 def get_department_or_404(id):
     department = Department.query.get(id)
-    department.phone = department.phone.split(", ")
     if not department:
         abort(404, "Department not found")
     return department
 
 
 def get_department_response():
-    departments = Department.query.all()
-    for department in departments:
-        department.phone = department.phone.split(", ")
+    page = paginate_query(Department.query.order_by(Department.id))
     universities = University.query.all()
     return {
-        "content": departments,
+        **page,
         "service_info": {
             "university": universities,
         },
-        "totalElements": len(departments),
     }
 
 
@@ -44,13 +43,19 @@ def get_department_response():
 class DepartmentsList(Resource):
     """Shows a list of all departments, and lets you POST to add new department"""
 
+    @departments_ns.expect(pagination_parser)
     @departments_ns.marshal_with(serviced_department_model)
     def get(self):
         """List all departments"""
         return get_department_response()
 
     @departments_ns.expect(department_query_model)
-    @departments_ns.marshal_with(serviced_department_model)
+    @mutation_response(
+        departments_ns,
+        serviced_department_model,
+        department_model,
+        get_department_response,
+    )
     @validate_site("http", ["url"])
     @departments_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
@@ -69,7 +74,7 @@ class DepartmentsList(Resource):
         }
         db.session.add(department)
         db.session.commit()
-        return get_department_response()
+        return department
 
 
 @departments_ns.route("/<int:id>")
@@ -84,7 +89,12 @@ class DepartmentDetail(Resource):
         return get_department_or_404(id)
 
     @departments_ns.expect(department_query_model, validate=False)
-    @departments_ns.marshal_with(serviced_department_model)
+    @mutation_response(
+        departments_ns,
+        serviced_department_model,
+        department_model,
+        get_department_response,
+    )
     @validate_site("http", ["url"])
     @departments_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
@@ -102,9 +112,14 @@ class DepartmentDetail(Resource):
             key: departments_ns.payload.get(key) for key in contacts_model.keys()
         }
         db.session.commit()
-        return get_department_response()
+        return department
 
-    @departments_ns.marshal_with(serviced_department_model)
+    @mutation_response(
+        departments_ns,
+        serviced_department_model,
+        department_model,
+        get_department_response,
+    )
     @departments_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def delete(self, id):
@@ -112,4 +127,4 @@ class DepartmentDetail(Resource):
         department = get_department_or_404(id)
         db.session.delete(department)
         db.session.commit()
-        return get_department_response()
+        return department
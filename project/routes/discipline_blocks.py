@@ -2,9 +2,13 @@ from flask_restx import Resource, Namespace, abort
 
 from project.extensions import db
 from project.models import DisciplineBlock, Roles
+from project.responses import mutation_response
 from project.schemas.authorization import authorizations
-from project.schemas.discipline_blocks import discipline_blocks_model
-from project.schemas.service_info import serviced_discipline_blocks_model
+from project.schemas.discipline_blocks import (
+    discipline_blocks_model,
+    paginated_discipline_blocks_model,
+)
+from project.schemas.pagination import pagination_parser, paginate_query
 from project.validators import allowed_roles
 
 discipline_blocks_ns = Namespace(
@@ -22,21 +26,26 @@ def get_discipline_block_or_404(id):
 
 
 def get_discipline_block_response():
-    discipline_blocks = DisciplineBlock.query.all()
-    return {"content": discipline_blocks, "totalElements": len(discipline_blocks)}
+    return paginate_query(DisciplineBlock.query.order_by(DisciplineBlock.id))
 
 
 @discipline_blocks_ns.route("")
 class DisciplineBlocksList(Resource):
     """Shows a list of all discipline blocks, and lets you POST to add new discipline block"""
 
-    @discipline_blocks_ns.marshal_with(serviced_discipline_blocks_model)
+    @discipline_blocks_ns.expect(pagination_parser)
+    @discipline_blocks_ns.marshal_with(paginated_discipline_blocks_model)
     def get(self):
         """List all discipline blocks"""
         return get_discipline_block_response()
 
     @discipline_blocks_ns.expect(discipline_blocks_model)
-    @discipline_blocks_ns.marshal_with(serviced_discipline_blocks_model)
+    @mutation_response(
+        discipline_blocks_ns,
+        paginated_discipline_blocks_model,
+        discipline_blocks_model,
+        get_discipline_block_response,
+    )
     @discipline_blocks_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def post(self):
@@ -46,7 +55,7 @@ class DisciplineBlocksList(Resource):
             setattr(discipline_block, key, value)
         db.session.add(discipline_block)
         db.session.commit()
-        return get_discipline_block_response()
+        return discipline_block
 
 
 @discipline_blocks_ns.route("/<int:id>")
@@ -61,7 +70,12 @@ class DisciplineBlocksDetail(Resource):
         return get_discipline_block_or_404(id)
 
     @discipline_blocks_ns.expect(discipline_blocks_model, validate=False)
-    @discipline_blocks_ns.marshal_with(serviced_discipline_blocks_model)
+    @mutation_response(
+        discipline_blocks_ns,
+        paginated_discipline_blocks_model,
+        discipline_blocks_model,
+        get_discipline_block_response,
+    )
     @discipline_blocks_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def patch(self, id):
@@ -72,9 +86,14 @@ class DisciplineBlocksDetail(Resource):
             if key in discipline_block_keys:
                 setattr(discipline_block, key, value)
         db.session.commit()
-        return get_discipline_block_response()
+        return discipline_block
 
-    @discipline_blocks_ns.marshal_with(serviced_discipline_blocks_model)
+    @mutation_response(
+        discipline_blocks_ns,
+        paginated_discipline_blocks_model,
+        discipline_blocks_model,
+        get_discipline_block_response,
+    )
     @discipline_blocks_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def delete(self, id):
@@ -82,4 +101,4 @@ class DisciplineBlocksDetail(Resource):
         discipline_block = get_discipline_block_or_404(id)
         db.session.delete(discipline_block)
         db.session.commit()
-        return get_discipline_block_response()
+        return discipline_block
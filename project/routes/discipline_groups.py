@@ -1,13 +1,16 @@
-from flask_restx import Resource, Namespace, abort
+from flask_restx import Resource, abort
 
 from project.extensions import db
 from project.models import DisciplineGroup, DisciplineBlock, Roles
+from project.responses import mutation_response
 from project.schemas.authorization import authorizations
 from project.schemas.discipline_groups import (
     discipline_groups_model,
     discipline_groups_query_model,
 )
+from project.schemas.pagination import pagination_parser, paginate_query
 from project.schemas.service_info import serviced_discipline_groups_model
+from project.serializers import Namespace
 from project.validators import validate_site, allowed_roles
 
 discipline_groups_ns = Namespace(
@@ -25,14 +28,13 @@ def get_discipline_group_or_404(id):
 
 
 def get_discipline_group_response():
-    discipline_groups = DisciplineGroup.query.all()
+    page = paginate_query(DisciplineGroup.query.order_by(DisciplineGroup.id))
     discipline_blocks = DisciplineBlock.query.all()
     return {
-        "content": discipline_groups,
+        **page,
         "service_info": {
             "disciplineBlocks": discipline_blocks,
         },
-        "totalElements": len(discipline_groups),
     }
 
 
@@ -40,13 +42,19 @@ def get_discipline_group_response():
 class DisciplineGroupsList(Resource):
     """Shows a list of all discipline groups, and lets you POST to add new discipline group"""
 
+    @discipline_groups_ns.expect(pagination_parser)
     @discipline_groups_ns.marshal_with(serviced_discipline_groups_model)
     def get(self):
         """List all discipline groups"""
         return get_discipline_group_response()
 
     @discipline_groups_ns.expect(discipline_groups_query_model)
-    @discipline_groups_ns.marshal_with(serviced_discipline_groups_model)
+    @mutation_response(
+        discipline_groups_ns,
+        serviced_discipline_groups_model,
+        discipline_groups_model,
+        get_discipline_group_response,
+    )
     @validate_site("http", ["discipline_url"])
     @discipline_groups_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
@@ -63,7 +71,7 @@ class DisciplineGroupsList(Resource):
 
         db.session.add(discipline_group)
         db.session.commit()
-        return get_discipline_group_response()
+        return discipline_group
 
 
 @discipline_groups_ns.route("/<int:id>")
@@ -78,7 +86,12 @@ class DisciplineGroupsDetail(Resource):
         return get_discipline_group_or_404(id)
 
     @discipline_groups_ns.expect(discipline_groups_query_model, validate=False)
-    @discipline_groups_ns.marshal_with(serviced_discipline_groups_model)
+    @mutation_response(
+        discipline_groups_ns,
+        serviced_discipline_groups_model,
+        discipline_groups_model,
+        get_discipline_group_response,
+    )
     @validate_site("http", ["discipline_url"])
     @discipline_groups_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
@@ -93,9 +106,14 @@ class DisciplineGroupsDetail(Resource):
             elif key in nested_ids:
                 setattr(discipline_group, key + "_id", value.get("id"))
         db.session.commit()
-        return get_discipline_group_response()
-
-    @discipline_groups_ns.marshal_with(serviced_discipline_groups_model)
+        return discipline_group
+
+    @mutation_response(
+        discipline_groups_ns,
+        serviced_discipline_groups_model,
+        discipline_groups_model,
+        get_discipline_group_response,
+    )
     @discipline_groups_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def delete(self, id):
@@ -103,4 +121,4 @@ class DisciplineGroupsDetail(Resource):
         discipline_block = get_discipline_group_or_404(id)
         db.session.delete(discipline_block)
         db.session.commit()
-        return get_discipline_group_response()
+        return discipline_block
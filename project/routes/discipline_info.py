@@ -60,15 +60,12 @@ class DisciplineInfoList(Resource):
         if not discipline_info:
             discipline_info = DisciplineInfo(syllabus_id=syllabus_id)
             db.session.add(discipline_info)
-            db.session.commit()
 
         params = discipline_info_model.keys()
         for key, value in discipline_info_ns.payload.items():
             if key in params:
                 setattr(discipline_info, key, value)
 
-        db.session.commit()
-
         set_syllabus_filling_status(syllabus_id)
 
         return get_discipline_info_response(syllabus_id)
@@ -88,8 +85,6 @@ class DisciplineInfoList(Resource):
         for key, value in discipline_info_ns.payload.items():
             if key in params:
                 setattr(discipline_info, key, value)
-        db.session.commit()
-
         set_syllabus_filling_status(syllabus_id)
 
         return get_discipline_info_response(syllabus_id)
@@ -105,8 +100,6 @@ class DisciplineInfoList(Resource):
         verify_teacher(syllabus)
 
         db.session.delete(discipline_info)
-        db.session.commit()
-
         set_syllabus_filling_status(syllabus_id)
 
         return get_discipline_info_response(syllabus_id)
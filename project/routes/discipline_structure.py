@@ -1,4 +1,6 @@
 from flask_restx import Resource, Namespace, abort
+from sqlalchemy import insert
+from sqlalchemy.orm import selectinload
 
 from project.extensions import db
 from project.models import SyllabusModule, DisciplineStructure, Roles
@@ -22,31 +24,36 @@ discipline_structure_ns = Namespace(
 
 
 def add_syllabus_modules(syllabus_id):
+    """Add the modules with their topics to the session without committing.
+
+    Module ids are assigned by a flush and all topics are inserted with a single
+    executemany, so the caller's commit writes the whole structure or nothing.
+    """
     modules = discipline_structure_ns.payload.get("modules")
     if not modules:
         abort(400, "Modules are required")
 
-    for module in modules:
-        syllabus_module = SyllabusModule(
-            syllabus_id=syllabus_id,
-            name=module.get("name"),
-        )
-        db.session.add(syllabus_module)
-        db.session.commit()
-
-        module_id = syllabus_module.id
-        topics = module.get("topics")
-        for topic in topics:
-            syllabus_topic = DisciplineStructure(
-                module_id=module_id,
-                theoretical_topic=topic.get("theoretical_topic"),
-                theoretical_hours=topic.get("theoretical_hours"),
-                practice_topics=topic.get("practice_topics"),
-                practice_hours=topic.get("practice_hours"),
-                technologies=topic.get("technologies"),
-            )
-            db.session.add(syllabus_topic)
-        db.session.commit()
+    syllabus_modules = [
+        SyllabusModule(syllabus_id=syllabus_id, name=module.get("name"))
+        for module in modules
+    ]
+    db.session.add_all(syllabus_modules)
+    db.session.flush()
+
+    topics = [
+        {
+            "module_id": syllabus_module.id,
+            "theoretical_topic": topic.get("theoretical_topic"),
+            "theoretical_hours": topic.get("theoretical_hours"),
+            "practice_topics": topic.get("practice_topics"),
+            "practice_hours": topic.get("practice_hours"),
+            "technologies": topic.get("technologies"),
+        }
+        for syllabus_module, module in zip(syllabus_modules, modules)
+        for topic in module.get("topics") or []
+    ]
+    if topics:
+        db.session.execute(insert(DisciplineStructure), topics)
 
 
 def delete_modules(syllabus_id):
@@ -59,7 +66,6 @@ def delete_modules(syllabus_id):
 def delete_module(module_id):
     module = SyllabusModule.query.get(module_id)
     db.session.delete(module)
-    db.session.commit()
 
 
 def get_syllabus_module_or_404(module_id):
@@ -71,7 +77,11 @@ def get_syllabus_module_or_404(module_id):
 
 def get_syllabus_modules_response(syllabus_id):
     """Get list of syllabus modules"""
-    modules = SyllabusModule.query.filter_by(syllabus_id=syllabus_id).all()
+    modules = (
+        SyllabusModule.query.options(selectinload(SyllabusModule.topics))
+        .filter_by(syllabus_id=syllabus_id)
+        .all()
+    )
     return {
         "modules": modules,
         "syllabus_id": syllabus_id,
@@ -131,6 +141,7 @@ class DisciplineStructureList(Resource):
         verify_teacher(syllabus)
         add_syllabus_modules(syllabus_id)
 
+        # commits the new modules together with the status
         set_syllabus_filling_status(syllabus_id)
 
         return get_syllabus_modules_response(syllabus_id)
@@ -158,8 +169,6 @@ class DisciplineStructureModuleDetail(Resource):
             if key in params:
                 setattr(syllabus_topic, key, value)
         db.session.add(syllabus_topic)
-        db.session.commit()
-
         set_syllabus_filling_status(syllabus.id)
 
         return get_syllabus_modules_response(syllabus.id)
@@ -176,7 +185,6 @@ class DisciplineStructureModuleDetail(Resource):
         syllabus = module.syllabus
         verify_teacher(syllabus)
         module.name = discipline_structure_ns.payload.get("name")
-        db.session.commit()
         set_syllabus_filling_status(syllabus.id)
 
         return get_syllabus_modules_response(syllabus.id)
@@ -216,7 +224,6 @@ class DisciplineStructureTopicDetail(Resource):
         for key, value in discipline_structure_ns.payload.items():
             if key in topic_params:
                 setattr(topic, key, value)
-        db.session.commit()
         set_syllabus_filling_status(syllabus.id)
 
         return get_syllabus_modules_response(syllabus.id)
@@ -232,7 +239,6 @@ class DisciplineStructureTopicDetail(Resource):
         syllabus = topic.module.syllabus
         verify_teacher(syllabus)
         db.session.delete(topic)
-        db.session.commit()
         set_syllabus_filling_status(syllabus.id)
 
         return get_syllabus_modules_response(syllabus.id)
@@ -1,19 +1,26 @@
-from flask_restx import Resource, Namespace, abort
+from flask_restx import Resource, abort
+from sqlalchemy.orm import joinedload, selectinload
 
+from project.cache import conditional_get
 from project.extensions import db
 from project.models import (
     Discipline,
     Teacher,
     EducationProgram,
     DisciplineBlock,
+    DisciplineGroup,
     Syllabus,
     SyllabusBaseInfo,
     SyllabusStatus,
     Roles,
 )
+from project.query_counter import query_budget
+from project.responses import mutation_response
 from project.schemas.authorization import authorizations
 from project.schemas.disciplines import discipline_model, discipline_query_model
+from project.schemas.pagination import pagination_parser, paginate_query
 from project.schemas.service_info import serviced_discipline_model
+from project.serializers import Namespace
 from project.validators import validate_site, allowed_roles
 
 disciplines_ns = Namespace(
@@ -23,26 +30,45 @@ disciplines_ns = Namespace(
 )
 
 
+discipline_tables = (
+    Discipline,
+    Teacher,
+    EducationProgram,
+    DisciplineBlock,
+    DisciplineGroup,
+)
+
+discipline_load_options = (
+    joinedload(Discipline.teacher),
+    joinedload(Discipline.discipline_group).joinedload(DisciplineGroup.block),
+    joinedload(Discipline.education_program),
+)
+
+
 def get_discipline_or_404(id):
-    discipline = Discipline.query.get(id)
+    discipline = db.session.get(Discipline, id, options=discipline_load_options)
     if not discipline:
         abort(404, "Discipline not found")
     return discipline
 
 
 def get_discipline_response():
-    disciplines = Discipline.query.all()
+    """Load disciplines with everything discipline_model nests in a fixed number of queries"""
+    page = paginate_query(
+        Discipline.query.options(*discipline_load_options).order_by(Discipline.id)
+    )
     teachers = Teacher.query.all()
     education_programs = EducationProgram.query.all()
-    discipline_blocks = DisciplineBlock.query.all()
+    discipline_blocks = DisciplineBlock.query.options(
+        selectinload(DisciplineBlock.disciplineGroups)
+    ).all()
     return {
-        "content": disciplines,
+        **page,
         "service_info": {
             "teachers": teachers,
             "education_program": education_programs,
             "disciplineBlocks": discipline_blocks,
         },
-        "totalElements": len(disciplines),
     }
 
 
@@ -50,6 +76,9 @@ def get_discipline_response():
 class DisciplinesList(Resource):
     """Shows a list of all disciplines, and lets you POST to add new education discipline"""
 
+    @query_budget(6)
+    @disciplines_ns.expect(pagination_parser)
+    @conditional_get(*discipline_tables)
     @disciplines_ns.marshal_with(serviced_discipline_model)
     def get(self):
         """List all education disciplines"""
@@ -57,7 +86,12 @@ class DisciplinesList(Resource):
 
     # @disciplines_ns.doc(security="jsonWebToken")
     @disciplines_ns.expect(discipline_query_model)
-    @disciplines_ns.marshal_with(serviced_discipline_model)
+    @mutation_response(
+        disciplines_ns,
+        serviced_discipline_model,
+        discipline_model,
+        get_discipline_response,
+    )
     @validate_site("http", ["syllabus_url", "education_plan_url"])
     @disciplines_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
@@ -89,7 +123,7 @@ class DisciplinesList(Resource):
         db.session.add(syllabus_base_info)
         db.session.commit()
 
-        return get_discipline_response()
+        return discipline
 
 
 @disciplines_ns.route("/<int:id>")
@@ -98,13 +132,19 @@ class DisciplinesList(Resource):
 class DisciplinesDetail(Resource):
     """Show a discipline and lets you delete him"""
 
+    @conditional_get(*discipline_tables)
     @disciplines_ns.marshal_with(discipline_model)
     def get(self, id):
         """Fetch the discipline with a given id"""
         return get_discipline_or_404(id)
 
     @disciplines_ns.expect(discipline_query_model, validate=False)
-    @disciplines_ns.marshal_with(serviced_discipline_model)
+    @mutation_response(
+        disciplines_ns,
+        serviced_discipline_model,
+        discipline_model,
+        get_discipline_response,
+    )
     @validate_site("http", ["syllabus_url", "education_plan_url"])
     @disciplines_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
@@ -128,9 +168,14 @@ class DisciplinesDetail(Resource):
 
         db.session.commit()
 
-        return get_discipline_response()
+        return discipline
 
-    @disciplines_ns.marshal_with(serviced_discipline_model)
+    @mutation_response(
+        disciplines_ns,
+        serviced_discipline_model,
+        discipline_model,
+        get_discipline_response,
+    )
     @disciplines_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def delete(self, id):
@@ -139,7 +184,7 @@ class DisciplinesDetail(Resource):
         db.session.delete(discipline)
         db.session.commit()
         # TODO: add logic to delete syllabus and syllabus_base_info
-        return get_discipline_response()
+        return discipline
 
 
 # TODO: delete or hide this endpoint after using it
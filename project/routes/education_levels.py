@@ -2,9 +2,13 @@ from flask_restx import Resource, Namespace, abort
 
 from project.extensions import db
 from project.models import EducationLevel, Roles
+from project.responses import mutation_response
 from project.schemas.authorization import authorizations
-from project.schemas.education_levels import education_level_model
-from project.schemas.service_info import serviced_education_level_model
+from project.schemas.education_levels import (
+    education_level_model,
+    paginated_education_level_model,
+)
+from project.schemas.pagination import pagination_parser, paginate_query
 from project.validators import allowed_roles
 
 education_levels_ns = Namespace(
@@ -22,21 +26,26 @@ def get_education_level_or_404(id):
 
 
 def get_education_level_response():
-    education_levels = EducationLevel.query.all()
-    return {"content": education_levels, "totalElements": len(education_levels)}
+    return paginate_query(EducationLevel.query.order_by(EducationLevel.id))
 
 
 @education_levels_ns.route("")
 class EducationLevelsList(Resource):
     """Shows a list of all education levels, and lets you POST to add new education level"""
 
-    @education_levels_ns.marshal_with(serviced_education_level_model)
+    @education_levels_ns.expect(pagination_parser)
+    @education_levels_ns.marshal_with(paginated_education_level_model)
     def get(self):
         """List all education levels"""
         return get_education_level_response()
 
     @education_levels_ns.expect(education_level_model)
-    @education_levels_ns.marshal_with(serviced_education_level_model)
+    @mutation_response(
+        education_levels_ns,
+        paginated_education_level_model,
+        education_level_model,
+        get_education_level_response,
+    )
     @education_levels_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def post(self):
@@ -46,7 +55,7 @@ class EducationLevelsList(Resource):
             setattr(education_level, key, value)
         db.session.add(education_level)
         db.session.commit()
-        return get_education_level_response()
+        return education_level
 
 
 @education_levels_ns.route("/<int:id>")
@@ -61,7 +70,12 @@ class EducationLevelsDetail(Resource):
         return get_education_level_or_404(id)
 
     @education_levels_ns.expect(education_level_model, validate=False)
-    @education_levels_ns.marshal_with(serviced_education_level_model)
+    @mutation_response(
+        education_levels_ns,
+        paginated_education_level_model,
+        education_level_model,
+        get_education_level_response,
+    )
     @education_levels_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def patch(self, id):
@@ -72,9 +86,14 @@ class EducationLevelsDetail(Resource):
             if key in education_level_keys:
                 setattr(education_level, key, value)
         db.session.commit()
-        return get_education_level_response()
+        return education_level
 
-    @education_levels_ns.marshal_with(serviced_education_level_model)
+    @mutation_response(
+        education_levels_ns,
+        paginated_education_level_model,
+        education_level_model,
+        get_education_level_response,
+    )
     @education_levels_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def delete(self, id):
@@ -82,4 +101,4 @@ class EducationLevelsDetail(Resource):
         education_level = get_education_level_or_404(id)
         db.session.delete(education_level)
         db.session.commit()
-        return get_education_level_response()
+        return education_level
@@ -1,20 +1,24 @@
-from flask_restx import Resource, Namespace, abort
-from sqlalchemy import desc
+from flask_restx import Resource, abort
 
+from project.cache import conditional_get
 from project.extensions import db
 from project.models import (
+    Department,
     EducationProgram,
     Specialty,
     EducationLevel,
     University,
     Roles,
 )
+from project.responses import mutation_response
 from project.schemas.authorization import authorizations
 from project.schemas.education_programs import (
     education_program_model,
     education_program_query_model,
 )
+from project.schemas.pagination import cursor_pagination_parser, paginate_query_by_id
 from project.schemas.service_info import serviced_education_program_model
+from project.serializers import Namespace
 from project.validators import validate_site, allowed_roles
 
 education_programs_ns = Namespace(
@@ -24,6 +28,15 @@ education_programs_ns = Namespace(
 )
 
 
+education_program_tables = (
+    EducationProgram,
+    Specialty,
+    EducationLevel,
+    Department,
+    University,
+)
+
+
 def get_education_program_or_404(id):
     education_program = EducationProgram.query.get(id)
     if not education_program:
@@ -32,18 +45,17 @@ def get_education_program_or_404(id):
 
 
 def get_education_program_response():
-    education_programs = EducationProgram.query.order_by(desc("id")).all()
+    page = paginate_query_by_id(EducationProgram.query, EducationProgram.id)
     specialties = Specialty.query.all()
     universities = University.query.all()
     education_levels = EducationLevel.query.all()
     return {
-        "content": education_programs,
+        **page,
         "service_info": {
             "specialty": specialties,
             "university": universities,
             "education_levels": education_levels,
         },
-        "totalElements": len(education_programs),
     }
 
 
@@ -51,13 +63,20 @@ def get_education_program_response():
 class EducationProgramsList(Resource):
     """Shows a list of all education programs, and lets you POST to add new education program"""
 
+    @education_programs_ns.expect(cursor_pagination_parser)
+    @conditional_get(*education_program_tables)
     @education_programs_ns.marshal_with(serviced_education_program_model)
     def get(self):
         """List all education programs"""
         return get_education_program_response()
 
     @education_programs_ns.expect(education_program_query_model)
-    @education_programs_ns.marshal_with(serviced_education_program_model)
+    @mutation_response(
+        education_programs_ns,
+        serviced_education_program_model,
+        education_program_model,
+        get_education_program_response,
+    )
     @validate_site("http", ["syllabus_url", "program_url"])
     @education_programs_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
@@ -73,7 +92,7 @@ class EducationProgramsList(Resource):
                 setattr(education_program, key + "_id", value.get("id"))
         db.session.add(education_program)
         db.session.commit()
-        return get_education_program_response()
+        return education_program
 
 
 @education_programs_ns.route("/<int:id>")
@@ -82,13 +101,19 @@ class EducationProgramsList(Resource):
 class EducationProgramsDetail(Resource):
     """Show a education program and lets you delete him"""
 
+    @conditional_get(*education_program_tables)
     @education_programs_ns.marshal_with(education_program_model)
     def get(self, id):
         """Fetch the education program with a given id"""
         return get_education_program_or_404(id)
 
     @education_programs_ns.expect(education_program_query_model, validate=False)
-    @education_programs_ns.marshal_with(serviced_education_program_model)
+    @mutation_response(
+        education_programs_ns,
+        serviced_education_program_model,
+        education_program_model,
+        get_education_program_response,
+    )
     @validate_site("http", ["syllabus_url", "program_url"])
     @education_programs_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
@@ -103,9 +128,14 @@ class EducationProgramsDetail(Resource):
             elif key in nested_ids:
                 setattr(education_program, key + "_id", value.get("id"))
         db.session.commit()
-        return get_education_program_response()
+        return education_program
 
-    @education_programs_ns.marshal_with(serviced_education_program_model)
+    @mutation_response(
+        education_programs_ns,
+        serviced_education_program_model,
+        education_program_model,
+        get_education_program_response,
+    )
     @education_programs_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def delete(self, id):
@@ -113,4 +143,4 @@ class EducationProgramsDetail(Resource):
         education_program = get_education_program_or_404(id)
         db.session.delete(education_program)
         db.session.commit()
-        return get_education_program_response()
+        return education_program
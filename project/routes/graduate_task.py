@@ -18,7 +18,7 @@ graduate_tasks_ns = Namespace(
 
 
 def create_graduate_tasks(syllabus_id, tasks):
-
+    """Add the graduate tasks to the session, committed with the syllabus status"""
     for fields in tasks:
         graduate_task = GraduateTask(
             syllabus_id=syllabus_id,
@@ -28,8 +28,6 @@ def create_graduate_tasks(syllabus_id, tasks):
         )
         db.session.add(graduate_task)
 
-    db.session.commit()
-
 
 def get_graduate_task_or_404(id):
     graduate_task = GraduateTask.query.get(id)
@@ -97,8 +95,6 @@ class GraduateTaskDetail(Resource):
             if key in plain_params:
                 setattr(graduate_task, key, value)
 
-        db.session.commit()
-
         set_syllabus_filling_status(syllabus.id)
 
         return get_graduate_task_response(syllabus.id)
@@ -113,8 +109,6 @@ class GraduateTaskDetail(Resource):
         verify_teacher(syllabus)
 
         db.session.delete(graduate_task)
-        db.session.commit()
-
         set_syllabus_filling_status(syllabus.id)
 
         return get_graduate_task_response(syllabus.id)
@@ -18,7 +18,7 @@ market_relation_ns = Namespace(
 
 
 def create_market_relations(syllabus_id, market_relations):
-
+    """Add the market relations to the session, committed with the syllabus status"""
     for fields in market_relations:
         market_relation = MarketRelation(
             syllabus_id=syllabus_id,
@@ -30,8 +30,6 @@ def create_market_relations(syllabus_id, market_relations):
         )
         db.session.add(market_relation)
 
-    db.session.commit()
-
 
 def get_market_relation_or_404(relation_id):
     market_relation = MarketRelation.query.get(relation_id)
@@ -98,8 +96,6 @@ class MarketRelationsDetail(Resource):
         for key, value in market_relation_ns.payload.items():
             if key in params:
                 setattr(market_relation, key, value)
-        db.session.commit()
-
         set_syllabus_filling_status(syllabus.id)
 
         return get_market_relation_response(syllabus.id)
@@ -115,8 +111,6 @@ class MarketRelationsDetail(Resource):
         verify_teacher(syllabus)
 
         db.session.delete(market_relation)
-        db.session.commit()
-
         set_syllabus_filling_status(syllabus.id)
 
         return get_market_relation_response(syllabus.id)
@@ -2,9 +2,10 @@ from flask_restx import Resource, Namespace, abort
 
 from project.extensions import db
 from project.models import Position, Roles
+from project.responses import mutation_response
 from project.schemas.authorization import authorizations
-from project.schemas.position import position_model
-from project.schemas.service_info import serviced_position_model
+from project.schemas.pagination import pagination_parser, paginate_query
+from project.schemas.position import position_model, paginated_position_model
 from project.validators import allowed_roles
 
 position_ns = Namespace(
@@ -20,21 +21,23 @@ def get_position_or_404(id):
 
 
 def get_position_response():
-    positions = Position.query.all()
-    return {"content": positions, "totalElements": len(positions)}
+    return paginate_query(Position.query.order_by(Position.id))
 
 
 @position_ns.route("")
 class PositionList(Resource):
     """Shows a list of all positions, and lets you POST to add new position"""
 
-    @position_ns.marshal_with(serviced_position_model)
+    @position_ns.expect(pagination_parser)
+    @position_ns.marshal_with(paginated_position_model)
     def get(self):
         """List all positions"""
         return get_position_response()
 
     @position_ns.expect(position_model)
-    @position_ns.marshal_with(serviced_position_model)
+    @mutation_response(
+        position_ns, paginated_position_model, position_model, get_position_response
+    )
     @position_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def post(self):
@@ -44,7 +47,7 @@ class PositionList(Resource):
             setattr(position, key, value)
         db.session.add(position)
         db.session.commit()
-        return get_position_response()
+        return position
 
 
 @position_ns.route("/<int:id>")
@@ -59,7 +62,9 @@ class PositionsDetail(Resource):
         return get_position_or_404(id)
 
     @position_ns.expect(position_model, validate=False)
-    @position_ns.marshal_with(serviced_position_model)
+    @mutation_response(
+        position_ns, paginated_position_model, position_model, get_position_response
+    )
     @position_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def patch(self, id):
@@ -70,9 +75,11 @@ class PositionsDetail(Resource):
             if key in position_keys:
                 setattr(position, key, value)
         db.session.commit()
-        return get_position_response()
+        return position
 
-    @position_ns.marshal_with(serviced_position_model)
+    @mutation_response(
+        position_ns, paginated_position_model, position_model, get_position_response
+    )
     @position_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def delete(self, id):
@@ -80,4 +87,4 @@ class PositionsDetail(Resource):
         position = get_position_or_404(id)
         db.session.delete(position)
         db.session.commit()
-        return get_position_response()
+        return position
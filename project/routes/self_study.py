@@ -18,7 +18,7 @@ self_study_topics_ns = Namespace(
 
 
 def create_self_study_topics(syllabus_id, topics):
-
+    """Add the self-study topics to the session, committed with the syllabus status"""
     for fields in topics:
         self_study_topic = SelfStudyTopic(
             syllabus_id=syllabus_id,
@@ -28,8 +28,6 @@ def create_self_study_topics(syllabus_id, topics):
         )
         db.session.add(self_study_topic)
 
-    db.session.commit()
-
 
 def get_self_study_topic_or_404(id):
     topic = SelfStudyTopic.query.get(id)
@@ -101,7 +99,6 @@ class SelfStudyTopicDetail(Resource):
             if key in plain_params:
                 setattr(topic, key, value)
 
-        db.session.commit()
         set_syllabus_filling_status(syllabus.id)
 
         return get_self_study_response(syllabus.id)
@@ -119,7 +116,6 @@ class SelfStudyTopicDetail(Resource):
         verify_teacher(syllabus)
 
         db.session.delete(topic)
-        db.session.commit()
         set_syllabus_filling_status(syllabus.id)
 
         return get_self_study_response(syllabus.id)
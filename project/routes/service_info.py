@@ -1,8 +1,12 @@
-from flask_restx import Resource, Namespace
+from flask_restx import Resource
+from sqlalchemy.orm import selectinload
 
+from project.cache import conditional_get, versioned_cache
 from project.models import (
+    Department,
     Discipline,
     DisciplineBlock,
+    DisciplineGroup,
     EducationLevel,
     Position,
     Specialty,
@@ -11,24 +15,41 @@ from project.models import (
     EducationProgram,
 )
 from project.schemas.service_info import service_info_model
+from project.serializers import Namespace, marshal
 
 service_info_ns = Namespace(name="service_info", description="Service information")
 
 
-@service_info_ns.route("")
-class ServiceInfo(Resource):
-    @service_info_ns.marshal_with(service_info_model)
-    def get(self):
-        positions = Position.query.all()
-        universities = University.query.all()
-        specialties = Specialty.query.all()
-        education_levels = EducationLevel.query.all()
-        disciplines = Discipline.query.all()
-        discipline_blocks = DisciplineBlock.query.all()
-        teachers = Teacher.query.all()
-        education_program = EducationProgram.query.all()
-
-        return {
+service_info_tables = (
+    Position,
+    University,
+    Department,
+    Specialty,
+    EducationLevel,
+    Discipline,
+    DisciplineBlock,
+    DisciplineGroup,
+    Teacher,
+    EducationProgram,
+)
+
+
+@versioned_cache(*service_info_tables)
+def get_service_info_response():
+    """Get marshalled service info, cached until one of its tables is changed"""
+    positions = Position.query.all()
+    universities = University.query.options(selectinload(University.department)).all()
+    specialties = Specialty.query.all()
+    education_levels = EducationLevel.query.all()
+    disciplines = Discipline.query.all()
+    discipline_blocks = DisciplineBlock.query.options(
+        selectinload(DisciplineBlock.disciplineGroups)
+    ).all()
+    teachers = Teacher.query.all()
+    education_program = EducationProgram.query.all()
+
+    return marshal(
+        {
             "position": positions,
             "education_levels": education_levels,
             "teachers": teachers,
@@ -37,4 +58,14 @@ class ServiceInfo(Resource):
             "discipline": disciplines,
             "disciplineBlocks": discipline_blocks,
             "education_program": education_program,
-        }, 200
+        },
+        service_info_model,
+    )
+
+
+@service_info_ns.route("")
+class ServiceInfo(Resource):
+    @service_info_ns.response(200, "Success", service_info_model)
+    @conditional_get(*service_info_tables)
+    def get(self):
+        return get_service_info_response(), 200
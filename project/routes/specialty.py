@@ -2,9 +2,10 @@ from flask_restx import Resource, Namespace, abort
 
 from project.extensions import db
 from project.models import Specialty, Roles
+from project.responses import mutation_response
 from project.schemas.authorization import authorizations
-from project.schemas.service_info import serviced_specialty_model
-from project.schemas.specialty import specialty_model
+from project.schemas.pagination import pagination_parser, paginate_query
+from project.schemas.specialty import specialty_model, paginated_specialty_model
 from project.validators import validate_site, allowed_roles
 
 specialty_ns = Namespace(
@@ -20,21 +21,23 @@ def get_specialty_or_404(id):
 
 
 def get_specialty_response():
-    specialties = Specialty.query.all()
-    return {"content": specialties, "totalElements": len(specialties)}
+    return paginate_query(Specialty.query.order_by(Specialty.id))
 
 
 @specialty_ns.route("")
 class SpecialtyList(Resource):
     """Shows a list of all specialties, and lets you POST to add new specialties"""
 
-    @specialty_ns.marshal_with(serviced_specialty_model)
+    @specialty_ns.expect(pagination_parser)
+    @specialty_ns.marshal_with(paginated_specialty_model)
     def get(self):
         """List all specialties"""
         return get_specialty_response()
 
     @specialty_ns.expect(specialty_model)
-    @specialty_ns.marshal_with(serviced_specialty_model)
+    @mutation_response(
+        specialty_ns, paginated_specialty_model, specialty_model, get_specialty_response
+    )
     @validate_site("http", ["standard_url"])
     @specialty_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
@@ -45,7 +48,7 @@ class SpecialtyList(Resource):
             setattr(specialty, key, value)
         db.session.add(specialty)
         db.session.commit()
-        return get_specialty_response()
+        return specialty
 
 
 @specialty_ns.route("/<int:id>")
@@ -60,7 +63,9 @@ class SpecialtyDetail(Resource):
         return get_specialty_or_404(id)
 
     @specialty_ns.expect(specialty_model, validate=False)
-    @specialty_ns.marshal_with(serviced_specialty_model)
+    @mutation_response(
+        specialty_ns, paginated_specialty_model, specialty_model, get_specialty_response
+    )
     @validate_site("http", ["standard_url"])
     @specialty_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
@@ -72,9 +77,11 @@ class SpecialtyDetail(Resource):
             if key in specialty_keys:
                 setattr(specialty, key, value)
         db.session.commit()
-        return get_specialty_response()
+        return specialty
 
-    @specialty_ns.marshal_with(serviced_specialty_model)
+    @mutation_response(
+        specialty_ns, paginated_specialty_model, specialty_model, get_specialty_response
+    )
     @specialty_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def delete(self, id):
@@ -82,4 +89,4 @@ class SpecialtyDetail(Resource):
         specialty = get_specialty_or_404(id)
         db.session.delete(specialty)
         db.session.commit()
-        return get_specialty_response()
+        return specialty
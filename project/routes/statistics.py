@@ -1,10 +1,18 @@
 from flask_restx import Resource, Namespace
 
-from project import Teacher
-from project.models import Specialist
+from project.counters import get_counters, syllabus_status_counter, users_counter
+from project.database import get_pool_stats
+from project.extensions import db
+from project.models import Roles, SyllabusStatus
+from project.schemas.authorization import authorizations
 from project.schemas.statistics import user_statistics_model, syllabus_statistics_model
+from project.validators import allowed_roles
 
-statistics_ns = Namespace(name="statistics", description="statistics information")
+statistics_ns = Namespace(
+    name="statistics",
+    description="statistics information",
+    authorizations=authorizations,
+)
 
 
 @statistics_ns.route("/users")
@@ -13,29 +21,20 @@ class StatisticsUsers(Resource):
     @statistics_ns.marshal_with(user_statistics_model)
     def get(self):
         """Show users statistics"""
-
-        total_teachers = Teacher.query.count()
-        verified_teachers = Teacher.query.filter_by(verified=True).count()
-
-        total_experts = Specialist.query.count()
-        verified_experts = Specialist.query.filter_by(verified=True).count()
-
-        # TODO: add students statistics
-        total_students = 5
-        verified_students = 3
+        counters = get_counters()
 
         return {
             "teachers": {
-                "registered": total_teachers,
-                "verified": verified_teachers,
+                "registered": counters.get("teachers:registered", 0),
+                "verified": counters.get("teachers:verified", 0),
             },
             "experts": {
-                "registered": total_experts,
-                "verified": verified_experts,
+                "registered": counters.get("experts:registered", 0),
+                "verified": counters.get("experts:verified", 0),
             },
             "students": {
-                "registered": total_students,
-                "verified": verified_students,
+                "registered": counters.get(users_counter(Roles.STUDENT, "registered"), 0),
+                "verified": counters.get(users_counter(Roles.STUDENT, "verified"), 0),
             },
         }
 
@@ -46,16 +45,36 @@ class StatisticsSyllabuses(Resource):
     @statistics_ns.marshal_with(syllabus_statistics_model)
     def get(self):
         """Show syllabuses statistics"""
+        counters = get_counters()
+        statuses = {
+            status: counters.get(syllabus_status_counter(status), 0)
+            for status in SyllabusStatus
+        }
 
+        # Review results are not stored yet, so they are always 0
         return {
-            "total_syllabuses": 51,
-            "on_filling": 6,
-            "filled": 18,
-            "proposed": 15,
-            "accepted": 9,
-            "reviewed": 5,
+            "total_syllabuses": sum(
+                value
+                for name, value in counters.items()
+                if name.startswith(syllabus_status_counter(""))
+            ),
+            "on_filling": statuses[SyllabusStatus.ON_FILLING],
+            "filled": statuses[SyllabusStatus.FILLED],
+            "proposed": statuses[SyllabusStatus.PROPOSED],
+            "accepted": statuses[SyllabusStatus.ACCEPTED],
+            "reviewed": statuses[SyllabusStatus.REVIEWED],
             "negative": 0,
-            "conditionally_negative": 20,
-            "conditionally_positive": 40,
-            "positive": 40,
+            "conditionally_negative": 0,
+            "conditionally_positive": 0,
+            "positive": 0,
         }
+
+
+@statistics_ns.route("/database-pool")
+class StatisticsDatabasePool(Resource):
+
+    @statistics_ns.doc(security="jsonWebToken")
+    @allowed_roles([Roles.ADMIN])
+    def get(self):
+        """Show the database connection pool state of this worker process"""
+        return get_pool_stats(db.engine)
@@ -1,6 +1,8 @@
 from flask import jsonify
 from flask_restx import Resource, Namespace, abort
+from sqlalchemy import and_, case, exists, or_, select, update
 
+from project.counters import count_syllabus_status_changes
 from project.extensions import db
 from project.models import (
     Syllabus,
@@ -50,31 +52,70 @@ def get_syllabus_base_info_response(syllabus_id):
     }
 
 
-def set_syllabus_filling_status(syllabus_id):
-    """Set the syllabus status ot FILLED if all tables are filled. Else set it to ON_FILLING"""
-
-    syllabus = get_syllabus_or_404(syllabus_id)
+syllabus_filling_tables = [
+    MarketRelation,
+    DisciplineInfo,
+    SyllabusModule,
+    SelfStudyTopic,
+    GraduateTask,
+    Assessment,
+]
+
+
+def get_filling_status_expression():
+    """SQL expression of the filling status of the syllabus it is evaluated for"""
+    filled_tables = [
+        exists().where(table.syllabus_id == Syllabus.id)
+        for table in syllabus_filling_tables
+    ]
+    return case(
+        (and_(*filled_tables), SyllabusStatus.FILLED.value),
+        (or_(*filled_tables), SyllabusStatus.ON_FILLING.value),
+        else_=SyllabusStatus.NOT_FILLED.value,
+    )
 
-    tables = [MarketRelation, DisciplineInfo, SyllabusModule, SelfStudyTopic, GraduateTask, Assessment]
 
-    not_filled_table_exists = False
-    filled_table_exists = False
+def set_syllabus_filling_status(syllabus_id):
+    """Set the syllabus status to FILLED if all tables are filled, to NOT_FILLED if
+    none of them is filled, else to ON_FILLING, and commit.
+
+    The session doesn't autoflush, so the pending writes of the caller are
+    flushed first for the status to see them. The old status is read from the
+    database with a row lock rather than taken from a possibly stale loaded
+    syllabus, and the UPDATE writes only when the status changes. The new
+    status is returned by the UPDATE where the database supports RETURNING
+    and read back after a change otherwise, for the statistics counters.
+    """
+    db.session.flush()
+    old_status = db.session.scalar(
+        select(Syllabus.status).where(Syllabus.id == syllabus_id).with_for_update()
+    )
+    if old_status is None:
+        abort(404, f"Syllabus with id {syllabus_id} not found")
 
-    for table in tables:
-        if table.query.filter_by(syllabus_id=syllabus_id).first():
-            filled_table_exists = True
-        else:
-            not_filled_table_exists = True
-        if filled_table_exists and not_filled_table_exists:
-            syllabus.status = SyllabusStatus.ON_FILLING
-            db.session.commit()
-            return
+    status = get_filling_status_expression()
+    statement = (
+        update(Syllabus)
+        .where(
+            Syllabus.id == syllabus_id,
+            Syllabus.status == old_status,
+            Syllabus.status != status,
+        )
+        .values(status=status)
+        .execution_options(synchronize_session=False)
+    )
 
-    if filled_table_exists:
-        syllabus.status = SyllabusStatus.FILLED
+    if db.session.get_bind().dialect.update_returning:
+        new_status = db.session.scalar(statement.returning(Syllabus.status))
+    elif db.session.execute(statement).rowcount:
+        new_status = db.session.scalar(
+            select(Syllabus.status).where(Syllabus.id == syllabus_id)
+        )
     else:
-        syllabus.status = SyllabusStatus.NOT_FILLED
+        new_status = None
 
+    if new_status is not None:
+        count_syllabus_status_changes([(old_status, new_status)])
     db.session.commit()
 
 
@@ -116,19 +157,38 @@ class SetAllFillingStatuses(Resource):
     @allowed_roles([Roles.ADMIN])
     def post(self):
         """Set all filling statuses"""
-        response = []
-
-        syllabuses = Syllabus.query.all()
-        for syllabus in syllabuses:
-            status_before = syllabus.status
-            set_syllabus_filling_status(syllabus.id)
-            response.append(
-                {
-                    "syllabus_id": syllabus.id,
-                    "status_before": status_before,
-                    "status_after": syllabus.status,
-                    "name": syllabus.name,
-                }
+        syllabuses = db.session.execute(
+            select(
+                Syllabus.id,
+                Syllabus.name,
+                Syllabus.status,
+                get_filling_status_expression().label("new_status"),
             )
+        ).all()
+
+        # One statement for all rows, instead of an IN list of every changed id
+        status = get_filling_status_expression()
+        db.session.execute(
+            update(Syllabus)
+            .where(Syllabus.status != status)
+            .values(status=status)
+            .execution_options(synchronize_session=False)
+        )
+        count_syllabus_status_changes(
+            (syllabus.status, syllabus.new_status)
+            for syllabus in syllabuses
+            if syllabus.status != syllabus.new_status
+        )
+        db.session.commit()
+
+        response = [
+            {
+                "syllabus_id": syllabus.id,
+                "status_before": syllabus.status,
+                "status_after": syllabus.new_status,
+                "name": syllabus.name,
+            }
+            for syllabus in syllabuses
+        ]
 
         return jsonify({"syllabuses": response})
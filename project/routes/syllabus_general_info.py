@@ -1,22 +1,65 @@
-from flask_restx import Resource, Namespace
+from flask_restx import Resource, Namespace, abort
+from sqlalchemy.orm import joinedload, selectinload
 
-from project.routes.assessment import get_assessment_response
-from project.routes.discipline_info import get_discipline_info_response
-from project.routes.discipline_structure import get_syllabus_structure_three_response
-from project.routes.market_relation import get_market_relation_response
-from project.routes.syllabus import get_syllabus_base_info_response, syllabuses_ns
+from project.models import (
+    Discipline,
+    DisciplineGroup,
+    Syllabus,
+    SyllabusBaseInfo,
+    SyllabusModule,
+)
+from project.query_counter import query_budget
+from project.routes.syllabus import syllabuses_ns
 from project.schemas.syllabus_general_info import syllabus_general_info_response_model
 
 gen_info_ns = Namespace("general-info", description="General info about the syllabus")
 
 
+def get_syllabus_document_or_404(syllabus_id):
+    """Load the syllabus with everything its general info shows in a fixed number of queries"""
+    syllabus = (
+        Syllabus.query.options(
+            joinedload(Syllabus.base_information_syllabus).options(
+                # base info properties reach the discipline through its syllabus
+                joinedload(SyllabusBaseInfo.syllabus),
+                joinedload(SyllabusBaseInfo.specialty),
+            ),
+            joinedload(Syllabus.discipline).options(
+                joinedload(Discipline.discipline_group).joinedload(
+                    DisciplineGroup.block
+                ),
+                joinedload(Discipline.education_program),
+            ),
+            joinedload(Syllabus.discipline_info),
+            selectinload(Syllabus.market_relations),
+            selectinload(Syllabus.modules).selectinload(SyllabusModule.topics),
+            selectinload(Syllabus.self_study_topics),
+            selectinload(Syllabus.graduate_tasks),
+            selectinload(Syllabus.assessments),
+        )
+        .filter(Syllabus.id == syllabus_id)
+        .first()
+    )
+
+    if not syllabus or not syllabus.base_information_syllabus:
+        abort(404, f"Syllabus with id {syllabus_id} not found")
+    return syllabus
+
+
 def get_syllabus_general_info_response(syllabus_id):
+    syllabus = get_syllabus_document_or_404(syllabus_id)
     return {
-        **get_syllabus_base_info_response(syllabus_id),
-        **get_market_relation_response(syllabus_id),
-        **get_discipline_info_response(syllabus_id),
-        "discipline_structure": {**get_syllabus_structure_three_response(syllabus_id)},
-        **get_assessment_response(syllabus_id),
+        "base_info": syllabus.base_information_syllabus,
+        "syllabus_id": syllabus_id,
+        "market_relations": syllabus.market_relations,
+        "discipline_info": syllabus.discipline_info,
+        "discipline_structure": {
+            "modules": syllabus.modules,
+            "syllabus_id": syllabus_id,
+            "self_study_topics": syllabus.self_study_topics,
+            "graduate_tasks": syllabus.graduate_tasks,
+        },
+        "assessments": syllabus.assessments,
     }
 
 
@@ -24,6 +67,7 @@ def get_syllabus_general_info_response(syllabus_id):
 @syllabuses_ns.param("syllabus_id", "The syllabus unique identifier")
 class GeneralSyllabusInfo(Resource):
 
+    @query_budget(7)
     @syllabuses_ns.marshal_with(
         syllabus_general_info_response_model, envelope="content"
     )
@@ -1,10 +1,22 @@
-from flask_restx import Resource, Namespace, abort
+from flask_restx import Resource, abort
 
+from project.cache import conditional_get
 from project.extensions import db
-from project.models import Teacher, Position, University, Role, Roles
+from project.models import (
+    Department,
+    Teacher,
+    Position,
+    University,
+    Role,
+    Roles,
+)
+from project.responses import mutation_response
+from project.roles import get_role_id
 from project.schemas.authorization import authorizations
+from project.schemas.pagination import pagination_parser, paginate_query
 from project.schemas.service_info import serviced_teacher_model
 from project.schemas.teachers import teacher_model, teacher_query_model
+from project.serializers import Namespace
 from project.validators import allowed_roles
 
 teachers_ns = Namespace(
@@ -12,6 +24,9 @@ teachers_ns = Namespace(
 )
 
 
+teacher_tables = (Teacher, Position, University, Department, Role)
+
+
 def get_teacher_or_404(id):
     teacher = Teacher.query.get(id)
     if not teacher:
@@ -20,14 +35,13 @@ def get_teacher_or_404(id):
 
 
 def get_teacher_response():
-    teachers = Teacher.query.all()
+    page = paginate_query(Teacher.query.order_by(Teacher.id))
     positions = Position.query.all()
     university = University.query.all()
 
     return {
-        "content": teachers,
+        **page,
         "service_info": {"position": positions, "university": university},
-        "totalElements": len(teachers),
     }
 
 
@@ -35,13 +49,17 @@ def get_teacher_response():
 class TeachersList(Resource):
     """Shows a list of all teachers, and lets you POST to add new teacher"""
 
+    @teachers_ns.expect(pagination_parser)
+    @conditional_get(*teacher_tables)
     @teachers_ns.marshal_with(serviced_teacher_model)
     def get(self):
         """List all teachers"""
         return get_teacher_response()
 
     @teachers_ns.expect(teacher_query_model)
-    @teachers_ns.marshal_with(serviced_teacher_model)
+    @mutation_response(
+        teachers_ns, serviced_teacher_model, teacher_model, get_teacher_response
+    )
     @teachers_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def post(self):
@@ -54,10 +72,10 @@ class TeachersList(Resource):
                 setattr(teacher, key, value)
             elif key in nested_ids:
                 setattr(teacher, key + "_id", value.get("id"))
-        teacher.role_id = Role.query.filter_by(name=Roles.TEACHER).first().id
+        teacher.role_id = get_role_id(Roles.TEACHER)
         db.session.add(teacher)
         db.session.commit()
-        return get_teacher_response()
+        return teacher
 
 
 @teachers_ns.route("/<int:id>")
@@ -66,13 +84,16 @@ class TeachersList(Resource):
 class TeachersDetail(Resource):
     """Show a teacher and lets you delete him"""
 
+    @conditional_get(*teacher_tables)
     @teachers_ns.marshal_with(teacher_model)
     def get(self, id):
         """Fetch the teacher with a given id"""
         return get_teacher_or_404(id)
 
     @teachers_ns.expect(teacher_query_model, validate=False)
-    @teachers_ns.marshal_with(serviced_teacher_model)
+    @mutation_response(
+        teachers_ns, serviced_teacher_model, teacher_model, get_teacher_response
+    )
     @teachers_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def patch(self, id):
@@ -86,9 +107,11 @@ class TeachersDetail(Resource):
             elif key in nested_ids:
                 setattr(teacher, key + "_id", value.get("id"))
         db.session.commit()
-        return get_teacher_response()
+        return teacher
 
-    @teachers_ns.marshal_with(serviced_teacher_model)
+    @mutation_response(
+        teachers_ns, serviced_teacher_model, teacher_model, get_teacher_response
+    )
     @teachers_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def delete(self, id):
@@ -96,4 +119,4 @@ class TeachersDetail(Resource):
         teacher = get_teacher_or_404(id)
         db.session.delete(teacher)
         db.session.commit()
-        return get_teacher_response()
+        return teacher
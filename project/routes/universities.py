@@ -2,9 +2,10 @@ from flask_restx import Resource, Namespace, abort
 
 from project.extensions import db
 from project.models import University, Roles
+from project.responses import mutation_response
 from project.schemas.authorization import authorizations
-from project.schemas.service_info import serviced_university_model
-from project.schemas.universities import university_model
+from project.schemas.pagination import pagination_parser, paginate_query
+from project.schemas.universities import university_model, paginated_university_model
 from project.validators import validate_site, allowed_roles
 
 university_ns = Namespace(
@@ -22,22 +23,27 @@ def get_university_or_404(id):
 
 
 def get_university_response():
-    universities = University.query.all()
-    return {"content": universities, "totalElements": len(universities)}
+    return paginate_query(University.query.order_by(University.id))
 
 
 @university_ns.route("")
 class UniversitylList(Resource):
     """Shows a list of all universities, available in our site"""
 
-    @university_ns.marshal_with(serviced_university_model)
+    @university_ns.expect(pagination_parser)
+    @university_ns.marshal_with(paginated_university_model)
     def get(self):
         """List of all universities"""
 
         return get_university_response()
 
     @university_ns.expect(university_model)
-    @university_ns.marshal_with(serviced_university_model)
+    @mutation_response(
+        university_ns,
+        paginated_university_model,
+        university_model,
+        get_university_response,
+    )
     @validate_site("http", ["url", "programs_list_url"])
     @university_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
@@ -51,7 +57,7 @@ class UniversitylList(Resource):
         )
         db.session.add(university)
         db.session.commit()
-        return get_university_response()
+        return university
 
 
 @university_ns.route("/<int:id>")
@@ -66,7 +72,12 @@ class UniversityDetail(Resource):
         return get_university_or_404(id)
 
     @university_ns.expect(university_model, validate=False)
-    @university_ns.marshal_with(serviced_university_model)
+    @mutation_response(
+        university_ns,
+        paginated_university_model,
+        university_model,
+        get_university_response,
+    )
     @validate_site("http", ["url", "programs_list_url"])
     @university_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
@@ -80,9 +91,14 @@ class UniversityDetail(Resource):
                 setattr(university, key, value)
 
         db.session.commit()
-        return get_university_response()
-
-    @university_ns.marshal_with(serviced_university_model)
+        return university
+
+    @mutation_response(
+        university_ns,
+        paginated_university_model,
+        university_model,
+        get_university_response,
+    )
     @university_ns.doc(security="jsonWebToken")
     @allowed_roles([Roles.ADMIN, Roles.CONTENT_MANAGER])
     def delete(self, id: int):
@@ -90,4 +106,4 @@ class UniversityDetail(Resource):
         university = get_university_or_404(id)
         db.session.delete(university)
         db.session.commit()
-        return get_university_response()
+        return university
@@ -21,9 +21,9 @@ from flask_jwt_extended import (
 from flask_mail import Message
 from flask_restx import Namespace, Resource, abort
 from jwt import ExpiredSignatureError
-from werkzeug.security import generate_password_hash, check_password_hash
+from sqlalchemy import select
 
-from project.extensions import db, mail
+from project.extensions import db, mail_dispatcher, password_hasher
 from project.schemas.authorization import authorizations
 from project.schemas.service_info import service_info_for_teacher
 from project.schemas.users import (
@@ -38,7 +38,18 @@ from project.schemas.users import (
     token_parser,
     teacher_register_request_model,
 )
-from project.models import User, Teacher, Role, Roles, Specialist, Position, University
+from project.models import (
+    User,
+    Teacher,
+    Role,
+    Roles,
+    Specialist,
+    Position,
+    University,
+)
+from project.outbox import add_to_outbox
+from project.query_counter import query_budget
+from project.roles import get_role_id
 
 user_ns = Namespace(
     name="user", description="User related endpoints", authorizations=authorizations
@@ -70,7 +81,7 @@ def create_expert(args):
         discipline_type=args.get("discipline_type"),
         experience=args.get("experience"),
         url_cv=args.get("url_cv") or "",
-        role_id=Role.query.filter_by(name=Roles.SPECIALIST).first().id,
+        role_id=get_role_id(Roles.SPECIALIST),
     )
 
     return expert
@@ -98,7 +109,7 @@ def create_teacher(args):
         department_id=args.get("department_id"),
         comments=args.get("comments") or "",
         degree_level=args.get("degree_level") or "",
-        role_id=Role.query.filter_by(name=Roles.TEACHER).first().id,
+        role_id=get_role_id(Roles.TEACHER),
     )
 
     return teacher
@@ -114,12 +125,12 @@ def create_user(args, role: Roles):
 
     user = User(
         email=email,
-        password_hash=generate_password_hash(args.get("password")),
+        password_hash=password_hasher.hash(args.get("password")),
         first_name=args.get("first_name"),
         last_name=args.get("last_name"),
         parent_name=args.get("parent_name") or "",
         phone=args.get("phone") or "",
-        role_id=Role.query.filter_by(name=role).first().id,
+        role_id=get_role_id(role),
     )
 
     return user
@@ -161,22 +172,76 @@ class SecurityUtils:
         confirm_mail = render_template(
             "confirm_email.html", confirm_url=url_confirm, user=user
         )
-        SecurityUtils.send_mail(
+        add_to_outbox(
             subject="Education UA - Confirm email",
-            template=confirm_mail,
+            html=confirm_mail,
             recipients=[user.email],
         )
 
     @staticmethod
-    def send_mail(subject: str, template, recipients: List) -> None:
-
-        msg = Message(
+    def create_mail(subject: str, template, recipients: List) -> Message:
+        return Message(
             subject=subject,
             recipients=recipients,
             html=template,
         )
 
-        mail.send(msg)
+    @staticmethod
+    def send_mail(subject: str, template, recipients: List) -> None:
+        mail_dispatcher.send(SecurityUtils.create_mail(subject, template, recipients))
+
+
+def get_login_user(email):
+    """Get the user with the role name and the teacher or expert with the same
+    email in one query"""
+    return db.session.execute(
+        select(
+            User,
+            Role.name.label("role"),
+            Teacher.id.label("teacher_id"),
+            Teacher.verified.label("teacher_verified"),
+            Specialist.id.label("expert_id"),
+            Specialist.verified.label("expert_verified"),
+        )
+        .join(User.role)
+        .outerjoin(Teacher, Teacher.email == User.email)
+        .outerjoin(Specialist, Specialist.email == User.email)
+        .where(User.email == email)
+    ).first()
+
+
+def get_login_response(login_user):
+    """Create the tokens and the response for the user found by get_login_user"""
+    user, user_role = login_user.User, login_user.role
+    response = {
+        "access_token": "Bearer "
+        + create_access_token(
+            identity=user.email,
+            additional_claims={"role": user_role, "tokenType": "access"},
+        ),
+        "refresh_token": "Bearer "
+        + create_refresh_token(
+            identity=user.email,
+            additional_claims={"role": user_role, "tokenType": "refresh"},
+        ),
+        "role": user_role,
+        "id": user.id,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "parent_name": user.parent_name,
+        "email": user.email,
+        "phone": user.phone,
+        "verified": user.email_confirmed,
+    }
+
+    if user_role == Roles.TEACHER and login_user.teacher_id is not None:
+        response["id"] = login_user.teacher_id
+        response["verified"] = login_user.teacher_verified
+    elif user_role == Roles.SPECIALIST and login_user.expert_id is not None:
+        response["id"] = login_user.expert_id
+        response["verified"] = login_user.expert_verified
+
+    return response
 
 
 @user_ns.route("/register/user")
@@ -248,6 +313,8 @@ class RegisterTeacher(Resource):
 @user_ns.route("/login")
 class Login(Resource):
 
+    # The user, and the update of a password hash with outdated parameters
+    @query_budget(2)
     @user_ns.response(
         401,
         "One of: \n"
@@ -262,49 +329,22 @@ class Login(Resource):
         args = user_login_parser.parse_args()
         email = args.get("email")
         password = args.get("password")
-        user = User.query.filter_by(email=email).first()
-        if not user:
+        login_user = get_login_user(email)
+        if not login_user:
             abort(401, f"User with email '{email}' does not exist")
-        if not check_password_hash(user.password_hash, password):
+        user = login_user.User
+        if not password_hasher.check(user.password_hash, password):
             abort(401, "Incorrect password")
         if not user.email_confirmed:
             abort(401, f"Email '{email}' is not confirmed. Please check your email")
         if not user.active_status:
             abort(401, f"User with email '{email}' is banned")
 
-        user_role = user.role.name
+        if password_hasher.needs_rehash(user.password_hash):
+            user.password_hash = password_hasher.hash(password)
+            db.session.commit()
 
-        response = {
-            "access_token": "Bearer "
-            + create_access_token(
-                identity=email,
-                additional_claims={"role": user_role, "tokenType": "access"},
-            ),
-            "refresh_token": "Bearer "
-            + create_refresh_token(
-                identity=email,
-                additional_claims={"role": user_role, "tokenType": "refresh"},
-            ),
-            "role": user_role,
-            "id": user.id,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "parent_name": user.parent_name,
-            "email": user.email,
-            "phone": user.phone,
-            "verified": user.email_confirmed,
-        }
-
-        if user_role == Roles.TEACHER:
-            teacher = Teacher.query.filter_by(email=email).first()
-            response["id"] = teacher.id
-            response["verified"] = teacher.verified
-        elif user_role == Roles.SPECIALIST:
-            expert = Specialist.query.filter_by(email=email).first()
-            response["id"] = expert.id
-            response["verified"] = expert.verified
-
-        return response
+        return get_login_response(login_user)
 
 
 @user_ns.route("/confirm_mail/<string:token>")
@@ -353,6 +393,7 @@ class ResendConfirmEmail(Resource):
             return abort(400, f"User with {email} is already confirmed")
 
         SecurityUtils.send_confirm_token(user, request.headers.get("Origin"))
+        db.session.commit()
 
         return {"message": "The email was sent successfully"}, 201
 
@@ -384,7 +425,8 @@ class ResetPassword(Resource):
         reset_url = url_for("user_reset_password", token=token, _external=True)
         subject = "Education UA - Reset Password"
         body = render_template("reset_password.html", reset_url=reset_url, user=user)
-        SecurityUtils.send_mail(subject=subject, template=body, recipients=[user.email])
+        add_to_outbox(subject=subject, html=body, recipients=[user.email])
+        db.session.commit()
 
         return {"message": "The email with instructions was sent successfully"}, 201
 
@@ -406,21 +448,22 @@ class ResetPassword(Resource):
             return abort(404, f"User with email '{email}' does not exist")
 
         password = generate_password()
-        user.password_hash = generate_password_hash(password)
-        db.session.commit()
+        user.password_hash = password_hasher.hash(password)
 
         front_url = decrypted_data.get("front_url") + "/auth"
         subject = "Education UA - New Password"
         body = render_template(
             "new_password.html", front_url=front_url, user=user, password=password
         )
-        SecurityUtils.send_mail(subject=subject, template=body, recipients=[user.email])
+        add_to_outbox(subject=subject, html=body, recipients=[user.email])
+        db.session.commit()
 
         return make_response(render_template("new_password_page.html", user=user), 200)
 
 
 @user_ns.route("/refresh")
 class Refresh(Resource):
+    @query_budget(1)
     @user_ns.doc(security="jsonWebToken")
     @user_ns.doc(
         description="Refresh the access and refresh tokens (refresh token is required)"
@@ -429,39 +472,10 @@ class Refresh(Resource):
     @user_ns.marshal_with(user_login_response)
     def post(self):
         email = get_jwt_identity()
-        user = User.query.filter_by(email=email).first()
-        user_role = user.role.name
-        response = {
-            "access_token": "Bearer "
-            + create_access_token(
-                identity=email,
-                additional_claims={"role": user_role, "tokenType": "access"},
-            ),
-            "refresh_token": "Bearer "
-            + create_refresh_token(
-                identity=email,
-                additional_claims={"role": user_role, "tokenType": "refresh"},
-            ),
-            "role": user_role,
-            "id": user.id,
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "parent_name": user.parent_name,
-            "email": user.email,
-            "phone": user.phone,
-            "verified": user.email_confirmed,
-        }
-
-        if user_role == Roles.TEACHER:
-            teacher = Teacher.query.filter_by(email=email).first()
-            response["id"] = teacher.id
-            response["verified"] = teacher.verified
-        elif user_role == Roles.SPECIALIST:
-            expert = Specialist.query.filter_by(email=email).first()
-            response["id"] = expert.id
-            response["verified"] = expert.verified
-
-        return response
+        login_user = get_login_user(email)
+        if not login_user:
+            abort(401, f"User with email '{email}' does not exist")
+        return get_login_response(login_user)
 
 
 @user_ns.route("/change-password")
@@ -483,11 +497,11 @@ class ChangePassword(Resource):
         args = user_change_password_parser.parse_args()
         old_password = args.get("old_password")
 
-        if not check_password_hash(user.password_hash, old_password):
+        if not password_hasher.check(user.password_hash, old_password):
             abort(401, "Incorrect old password")
 
         new_password = args.get("new_password")
-        user.password_hash = generate_password_hash(new_password)
+        user.password_hash = password_hasher.hash(new_password)
         db.session.commit()
         return {"message": "Password changed"}, 200
 
@@ -539,20 +553,21 @@ class TeacherRegisterRequestOnMail(Resource):
         admin_email = current_app.config["MAIL_USERNAME"]
         teacher_email = user_ns.payload.get("email")
 
-        SecurityUtils.send_mail(
-            subject="Education UA - Request for teacher registration",
-            template=render_template(
-                "teacher_register_request_for_admin.html", data=user_ns.payload
+        mail_dispatcher.send(
+            SecurityUtils.create_mail(
+                subject="Education UA - Request for teacher registration",
+                template=render_template(
+                    "teacher_register_request_for_admin.html", data=user_ns.payload
+                ),
+                recipients=[admin_email],
             ),
-            recipients=[admin_email],
-        )
-
-        SecurityUtils.send_mail(
-            subject="Education UA - Request for teacher registration",
-            template=render_template(
-                "teacher_register_request_for_teacher.html", data=user_ns.payload
+            SecurityUtils.create_mail(
+                subject="Education UA - Request for teacher registration",
+                template=render_template(
+                    "teacher_register_request_for_teacher.html", data=user_ns.payload
+                ),
+                recipients=[teacher_email],
             ),
-            recipients=[teacher_email],
         )
 
         return {
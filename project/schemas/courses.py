@@ -2,6 +2,7 @@ from flask_restx import fields
 
 from project.extensions import api
 from project.schemas.disciplines import short_discipline_model
+from project.schemas.pagination import get_pagination_schema_for
 from project.schemas.syllabus import base_syllabus_model
 
 base_course_model = api.model(
@@ -23,3 +24,6 @@ course_model = api.model(
         **base_course_model
     }
 )
+
+
+paginated_course_model = get_pagination_schema_for(course_model, with_cursor=True)
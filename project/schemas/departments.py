@@ -84,6 +84,10 @@ department_model = api.model(
     "Department",
     {
         **base_department_model,
+        "phone": fields.List(
+            fields.String(description="phone number of the department"),
+            attribute="contacts.phone",
+        ),
         "university": fields.Nested(short_university_model, required=True),
     }
 )
@@ -97,4 +97,6 @@ education_program_query_model = api.model(
 # )
 
 
-paginated_education_program_model = get_pagination_schema_for(education_program_model)
+paginated_education_program_model = get_pagination_schema_for(
+    education_program_model, with_cursor=True
+)
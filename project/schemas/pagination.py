@@ -1,23 +1,95 @@
+import base64
+import binascii
 import re
 
-from flask_restx import fields
+from flask import request
+from flask_restx import abort, fields
+from sqlalchemy import desc
 
 from project.extensions import api
 
 
 pagination_parser = api.parser()
 pagination_parser.add_argument(
-    "page", type=int, required=False, default=1, help="Page number"
+    "page", type=int, required=False, default=1, help="Page number", location="args"
 )
 pagination_parser.add_argument(
     "size",
     type=int,
     required=False,
     default=20,
-    help="Page size (number of items per page)",
+    help="Page size (number of items per page, at most 100)",
+    location="args",
 )
 
 
+cursor_pagination_parser = pagination_parser.copy()
+cursor_pagination_parser.add_argument(
+    "after",
+    type=str,
+    required=False,
+    help="Cursor returned as 'next' by the previous page. "
+    "Switches the list to keyset pagination, pass it empty for the first page",
+    location="args",
+)
+
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(id: int) -> str:
+    return base64.urlsafe_b64encode(f"id:{id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        prefix, id = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        if prefix != "id":
+            raise ValueError
+        return int(id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        abort(400, f"Invalid cursor '{cursor}'")
+
+
+def paginate_query(query):
+    """Fetch the requested page of the query with LIMIT/OFFSET and a COUNT query"""
+    args = pagination_parser.parse_args()
+    page_obj = query.paginate(
+        page=args["page"],
+        per_page=args["size"],
+        max_per_page=MAX_PAGE_SIZE,
+        error_out=False,
+    )
+    return {
+        "content": page_obj.items,
+        "pageNumber": page_obj.page,
+        "totalElements": page_obj.total,
+    }
+
+
+def paginate_query_by_id(query, id_column):
+    """Paginate the query in descending id order.
+
+    Uses page/size unless the request has ``after``, in which case the page is
+    found by seeking ``id < cursor`` on the primary key, so deep pages cost as
+    much as the first one. The next page cursor is returned as ``next``.
+    """
+    query = query.order_by(desc(id_column))
+    if "after" not in request.args:
+        return paginate_query(query)
+
+    args = cursor_pagination_parser.parse_args()
+    size = min(max(args["size"] or 1, 1), MAX_PAGE_SIZE)
+    if args["after"]:
+        query = query.filter(id_column < decode_cursor(args["after"]))
+
+    items = query.limit(size + 1).all()
+    next_cursor = None
+    if len(items) > size:
+        items = items[:size]
+        next_cursor = encode_cursor(items[-1].id)
+    return {"content": items, "next": next_cursor}
+
+
 def custom_schema_pagination(current_page, page_obj):
     schema_pagination = {
         # "next": page_obj.has_next,
@@ -33,11 +105,17 @@ def custom_schema_pagination(current_page, page_obj):
     return schema_pagination
 
 
-def get_pagination_schema_for(response_model: api.model):
+def get_pagination_schema_for(response_model: api.model, with_cursor: bool = False):
+    cursor_fields = {
+        "next": fields.String(
+            description="Cursor of the next page, pass it as 'after' to get it",
+        ),
+    } if with_cursor else {}
     return api.model(
         f"Pagination({response_model.name})",
         {
             "content": fields.List(fields.Nested(response_model)),
+            **cursor_fields,
             # "next": fields.String(
             #     requred=True,
             #     description="Link to the next page",
@@ -48,12 +126,17 @@ def get_pagination_schema_for(response_model: api.model):
             #     description="Link to the previous page",
             #     default='link/to/the/previous/page'
             # ),
+            # Cursor pages have no number, so it is null there instead of 1
             "pageNumber": fields.Integer(
-                required=True,
-                description="Current page number",
-                default=1),
+                required=not with_cursor,
+                description="Current page number, null with 'after'"
+                if with_cursor else "Current page number",
+                default=None if with_cursor else 1),
             # "pages": fields.Integer(required=True, description="Total number of pages"),
             # "per_page": fields.Integer(required=True, description="Number of items per page"),
-            "totalElements": fields.Integer(required=True, description="Total number of items"),
+            "totalElements": fields.Integer(
+                required=not with_cursor,
+                description="Total number of items, null with 'after'"
+                if with_cursor else "Total number of items"),
         },
     )
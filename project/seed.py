@@ -0,0 +1,461 @@
+import random
+from collections import Counter, defaultdict
+from itertools import count
+from time import perf_counter
+
+import click
+from flask.cli import with_appcontext
+from sqlalchemy import exists, insert, select
+
+from project.counters import recount_counters
+from project.extensions import db, password_hasher
+from project.models import (
+    Assessment,
+    Department,
+    Discipline,
+    DisciplineBlock,
+    DisciplineGroup,
+    DisciplineInfo,
+    DisciplineStructure,
+    EducationLevel,
+    EducationProgram,
+    GraduateTask,
+    MarketRelation,
+    Position,
+    Role,
+    Roles,
+    SelfStudyTopic,
+    Specialist,
+    Specialty,
+    Syllabus,
+    SyllabusBaseInfo,
+    SyllabusModule,
+    SyllabusStatus,
+    Teacher,
+    University,
+    User,
+)
+
+# Disciplines inserted at once, to keep the generated rows in memory bounded
+CHUNK_SIZE = 10_000
+
+POSITIONS = ["Асистент", "Викладач", "Старший викладач", "Доцент", "Професор"]
+EDUCATION_LEVELS = [
+    ("Бакалавр", "Перший (бакалаврський)"),
+    ("Магістр", "Другий (магістерський)"),
+    ("Доктор філософії", "Третій (освітньо-науковий)"),
+]
+DISCIPLINE_BLOCKS = ["Обов'язкові дисципліни", "Вибіркові дисципліни"]
+
+SYLLABUS_STATUS_WEIGHTS = {
+    SyllabusStatus.NOT_FILLED: 30,
+    SyllabusStatus.ON_FILLING: 30,
+    SyllabusStatus.FILLED: 20,
+    SyllabusStatus.PROPOSED: 10,
+    SyllabusStatus.ACCEPTED: 5,
+    SyllabusStatus.REVIEWED: 5,
+}
+MODULES_PER_SYLLABUS = 2
+TOPICS_PER_MODULE = 3
+SELF_STUDY_TOPICS_PER_SYLLABUS = 2
+ASSESSMENTS_PER_SYLLABUS = 3
+
+
+def get_seed_sizes(scale):
+    """Number of rows of each kind generated for SCALE disciplines"""
+    return {
+        "universities": max(scale // 10_000, 1),
+        "departments": max(scale // 1_000, 1),
+        "specialties": max(scale // 2_000, 1),
+        "education_programs": max(scale // 100, 1),
+        "discipline_groups": max(scale // 200, 1),
+        "teachers": max(scale // 10, 1),
+        "specialists": max(scale // 100, 1),
+        "admins": max(scale // 50_000, 1),
+        "content_managers": max(scale // 5_000, 1),
+        "students": max(scale // 2, 1),
+        "users": max(scale // 20, 1),
+        "disciplines": scale,
+    }
+
+
+class _Seeder:
+    def __init__(self, scale, seed, password):
+        self.sizes = get_seed_sizes(scale)
+        self.rng = random.Random(seed)
+        self.password_hash = password_hasher.hash(password)
+        self.rows = Counter()
+        self.ids = {}
+
+    def next_id(self, model):
+        return next(self.ids.setdefault(model, count(1)))
+
+    def bulk(self, model, rows):
+        rows = list(rows)
+        if rows:
+            db.session.execute(insert(model), rows)
+            self.rows[model.__tablename__] += len(rows)
+
+    def seed(self):
+        self.seed_roles()
+        self.seed_structure()
+        self.seed_people()
+        disciplines = self.sizes["disciplines"]
+        for first_id in range(1, disciplines + 1, CHUNK_SIZE):
+            last_id = min(first_id + CHUNK_SIZE - 1, disciplines)
+            self.seed_disciplines(range(first_id, last_id + 1))
+        db.session.commit()
+        return dict(self.rows)
+
+    def seed_roles(self):
+        existing = set(db.session.scalars(select(Role.name)))
+        self.bulk(
+            Role, ({"name": role.value} for role in Roles if role not in existing)
+        )
+        self.role_ids = dict(db.session.execute(select(Role.name, Role.id)).all())
+
+    def seed_structure(self):
+        rng, sizes = self.rng, self.sizes
+
+        self.bulk(
+            University,
+            (
+                {
+                    "id": i,
+                    "name": f"Університет {i}",
+                    "abbr": f"У{i}",
+                    "programs_list_url": f"https://university{i}.example.com/programs",
+                    "url": f"https://university{i}.example.com",
+                }
+                for i in range(1, sizes["universities"] + 1)
+            ),
+        )
+        self.bulk(
+            Department,
+            (
+                {
+                    "id": i,
+                    "name": f"Кафедра {i}",
+                    "university_id": (i - 1) % sizes["universities"] + 1,
+                    "description": f"Опис кафедри {i}",
+                    "address": f"вул. Університетська, {i}",
+                    "email": f"department{i}@example.com",
+                    "phone": f"+380440000{i % 1000:03}, +380670000{i % 1000:03}",
+                    "url": f"https://department{i}.example.com",
+                }
+                for i in range(1, sizes["departments"] + 1)
+            ),
+        )
+        self.bulk(
+            Position,
+            ({"id": i, "name": name} for i, name in enumerate(POSITIONS, 1)),
+        )
+        self.bulk(
+            Specialty,
+            (
+                {"id": i, "code": str(100 + i), "name": f"Спеціальність {i}"}
+                for i in range(1, sizes["specialties"] + 1)
+            ),
+        )
+        self.bulk(
+            EducationLevel,
+            (
+                {"id": i, "name": name, "education_level": level}
+                for i, (name, level) in enumerate(EDUCATION_LEVELS, 1)
+            ),
+        )
+
+        self.program_specialties = {}
+        programs = []
+        for i in range(1, sizes["education_programs"] + 1):
+            self.program_specialties[i] = rng.randint(1, sizes["specialties"])
+            programs.append(
+                {
+                    "id": i,
+                    "name": f"Освітня програма {i}",
+                    "education_level_id": rng.randint(1, len(EDUCATION_LEVELS)),
+                    "guarantor": f"Гарант {i}",
+                    "department_id": rng.randint(1, sizes["departments"]),
+                    "program_url": f"https://example.com/programs/{i}",
+                    "syllabus_url": f"https://example.com/programs/{i}/syllabuses",
+                    "specialty_id": self.program_specialties[i],
+                }
+            )
+        self.bulk(EducationProgram, programs)
+
+        self.bulk(
+            DisciplineBlock,
+            ({"id": i, "name": name} for i, name in enumerate(DISCIPLINE_BLOCKS, 1)),
+        )
+        self.bulk(
+            DisciplineGroup,
+            (
+                {
+                    "id": i,
+                    "name": f"Група дисциплін {i}",
+                    "block_id": rng.randint(1, len(DISCIPLINE_BLOCKS)),
+                }
+                for i in range(1, sizes["discipline_groups"] + 1)
+            ),
+        )
+
+    def seed_people(self):
+        rng, sizes = self.rng, self.sizes
+
+        teachers = [
+            {
+                "id": i,
+                "name": f"Викладач {i}",
+                "position_id": rng.randint(1, len(POSITIONS)),
+                "email": f"teacher{i}@example.com",
+                "department_id": rng.randint(1, sizes["departments"]),
+                "role_id": self.role_ids[Roles.TEACHER],
+                "verified": rng.random() < 0.8,
+            }
+            for i in range(1, sizes["teachers"] + 1)
+        ]
+        self.bulk(Teacher, teachers)
+
+        specialists = [
+            {
+                "id": i,
+                "company": f"Компанія {rng.randint(1, 100)}",
+                "name": f"Експерт {i}",
+                "position": "Senior Developer",
+                "email": f"specialist{i}@example.com",
+                "professional_field": "IT",
+                "discipline_type": "Фахова",
+                "experience": rng.randint(1, 20),
+                "role_id": self.role_ids[Roles.SPECIALIST],
+                "verified": rng.random() < 0.8,
+            }
+            for i in range(1, sizes["specialists"] + 1)
+        ]
+        self.bulk(Specialist, specialists)
+
+        # Teachers and experts log in with the email of their Teacher/Specialist
+        emails = [
+            *(
+                (Roles.ADMIN, f"admin{i}@example.com")
+                for i in range(1, sizes["admins"] + 1)
+            ),
+            *(
+                (Roles.CONTENT_MANAGER, f"content_manager{i}@example.com")
+                for i in range(1, sizes["content_managers"] + 1)
+            ),
+            *((Roles.TEACHER, teacher["email"]) for teacher in teachers),
+            *((Roles.SPECIALIST, specialist["email"]) for specialist in specialists),
+            *(
+                (Roles.STUDENT, f"student{i}@example.com")
+                for i in range(1, sizes["students"] + 1)
+            ),
+            *(
+                (Roles.USER, f"user{i}@example.com")
+                for i in range(1, sizes["users"] + 1)
+            ),
+        ]
+        self.bulk(
+            User,
+            (
+                {
+                    "id": i,
+                    "first_name": f"Ім'я {i}",
+                    "last_name": f"Прізвище {i}",
+                    "email": email,
+                    "password_hash": self.password_hash,
+                    "phone": f"+38050{i:07}",
+                    "role_id": self.role_ids[role],
+                    "email_confirmed": rng.random() < 0.9,
+                    "active_status": True,
+                }
+                for i, (role, email) in enumerate(emails, 1)
+            ),
+        )
+
+    def seed_disciplines(self, discipline_ids):
+        rng, sizes = self.rng, self.sizes
+        statuses = list(SYLLABUS_STATUS_WEIGHTS)
+        weights = list(SYLLABUS_STATUS_WEIGHTS.values())
+        # The tables checked by get_filling_status_expression
+        filling_tables = {
+            DisciplineInfo: self.discipline_info_rows,
+            MarketRelation: self.market_relation_rows,
+            SyllabusModule: self.module_rows,
+            SelfStudyTopic: self.self_study_topic_rows,
+            GraduateTask: self.graduate_task_rows,
+            Assessment: self.assessment_rows,
+        }
+
+        rows = defaultdict(list)
+        for i in discipline_ids:
+            program_id = rng.randint(1, sizes["education_programs"])
+            rows[Discipline].append(
+                {
+                    "id": i,
+                    "name": f"Дисципліна {i}",
+                    "teacher_id": rng.randint(1, sizes["teachers"]),
+                    "discipline_group_id": rng.randint(1, sizes["discipline_groups"]),
+                    "education_program_id": program_id,
+                }
+            )
+
+            # The status agrees with the filled parts, as in set_syllabus_filling_status
+            status = rng.choices(statuses, weights)[0]
+            rows[Syllabus].append(
+                {
+                    "id": i,
+                    "name": f"Дисципліна {i}",
+                    "status": status.value,
+                    "discipline_id": i,
+                }
+            )
+            rows[SyllabusBaseInfo].append(
+                {
+                    "id": i,
+                    "syllabus_id": i,
+                    "specialty_id": self.program_specialties[program_id],
+                    "student_count": rng.randint(10, 120),
+                    "course": rng.randint(1, 4),
+                    "semester": rng.randint(1, 8),
+                }
+            )
+
+            if status == SyllabusStatus.NOT_FILLED:
+                continue
+            models = list(filling_tables)
+            if status == SyllabusStatus.ON_FILLING:
+                models = rng.sample(models, rng.randint(1, len(models) - 1))
+            for model in models:
+                rows[model].extend(filling_tables[model](i))
+            if SyllabusModule in models:
+                for module in rows[SyllabusModule][-MODULES_PER_SYLLABUS:]:
+                    rows[DisciplineStructure].extend(self.topic_rows(module["id"]))
+
+        for model in (
+            Discipline,
+            Syllabus,
+            SyllabusBaseInfo,
+            *filling_tables,
+            DisciplineStructure,
+        ):
+            self.bulk(model, rows[model])
+
+    def discipline_info_rows(self, syllabus_id):
+        rng = self.rng
+        yield {
+            "id": self.next_id(DisciplineInfo),
+            "syllabus_id": syllabus_id,
+            "program_url": f"https://example.com/disciplines/{syllabus_id}",
+            "abstract": f"Анотація дисципліни {syllabus_id}",
+            "goal": f"Мета дисципліни {syllabus_id}",
+            "competencies_list": "ЗК1, ЗК2, ФК1",
+            "technologies_list": "Python, SQL",
+            "graduate_task": "Курсова робота",
+            "lecture": rng.randint(8, 32),
+            "laboratory": rng.randint(0, 32),
+            "practice": rng.randint(0, 32),
+            "self_study": rng.randint(30, 90),
+            "required_skills": "Основи програмування",
+            "university_logistics": "Комп'ютерний клас",
+            "self_logistics": "Ноутбук",
+        }
+
+    def market_relation_rows(self, syllabus_id):
+        yield {
+            "id": self.next_id(MarketRelation),
+            "syllabus_id": syllabus_id,
+            "specialty": "Software Engineer",
+            "vacancies": "https://example.com/vacancies",
+            "skills": "Python, SQL, Git",
+            "relevant_materials": "Документація",
+            "borrowed_materials": "Відкриті курси",
+        }
+
+    def module_rows(self, syllabus_id):
+        for number in range(1, MODULES_PER_SYLLABUS + 1):
+            yield {
+                "id": self.next_id(SyllabusModule),
+                "syllabus_id": syllabus_id,
+                "name": f"Модуль {number}",
+            }
+
+    def topic_rows(self, module_id):
+        rng = self.rng
+        for number in range(1, TOPICS_PER_MODULE + 1):
+            yield {
+                "id": self.next_id(DisciplineStructure),
+                "module_id": module_id,
+                "theoretical_topic": f"Тема {number}",
+                "theoretical_hours": rng.randint(2, 6),
+                "practice_topics": f"Практична робота {number}",
+                "practice_hours": rng.randint(2, 6),
+                "technologies": "Python",
+            }
+
+    def self_study_topic_rows(self, syllabus_id):
+        rng = self.rng
+        for number in range(1, SELF_STUDY_TOPICS_PER_SYLLABUS + 1):
+            yield {
+                "id": self.next_id(SelfStudyTopic),
+                "syllabus_id": syllabus_id,
+                "name": f"Тема для самостійного вивчення {number}",
+                "controls": "Опитування",
+                "hours": rng.randint(4, 12),
+            }
+
+    def graduate_task_rows(self, syllabus_id):
+        yield {
+            "id": self.next_id(GraduateTask),
+            "syllabus_id": syllabus_id,
+            "name": "Курсова робота",
+            "controls": "Захист",
+            "deadlines": "Кінець семестру",
+        }
+
+    def assessment_rows(self, syllabus_id):
+        for number in range(1, ASSESSMENTS_PER_SYLLABUS + 1):
+            yield {
+                "id": self.next_id(Assessment),
+                "syllabus_id": syllabus_id,
+                "object": f"Лабораторна робота {number}",
+                "method": "Захист роботи",
+                "tool": "Звіт",
+            }
+
+
+def seed_database(scale, seed=0, password="password"):
+    """Fill an empty database with a consistent graph of SCALE disciplines.
+
+    The same scale and seed always give the same rows (apart from the salt of
+    the password hash), so timings taken on different revisions can be
+    compared. Every user can log in with the given password. Returns the
+    number of inserted rows by table.
+    """
+    if db.session.scalar(select(exists().select_from(Discipline))) or (
+        db.session.scalar(select(exists().select_from(University)))
+    ):
+        raise ValueError("The database is not empty")
+
+    rows = _Seeder(scale, seed, password).seed()
+    recount_counters()
+    return rows
+
+
+@click.command("seed")
+@click.option("--scale", default=1000, show_default=True, help="Number of disciplines.")
+@click.option("--seed", default=0, show_default=True, help="Random seed.")
+@click.option(
+    "--password", default="password", show_default=True, help="Password of all users."
+)
+@with_appcontext
+def seed_cli(scale, seed, password):
+    """Fill an empty database with generated data for benchmarks."""
+    started = perf_counter()
+    try:
+        rows = seed_database(scale, seed, password)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    for table, count in sorted(rows.items()):
+        click.echo(f"{table}: {count}")
+    click.echo(f"Seeded {sum(rows.values())} rows in {perf_counter() - started:.1f}s")
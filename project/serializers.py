@@ -0,0 +1,236 @@
+from functools import wraps
+from http import HTTPStatus
+
+import flask_restx
+from flask import current_app, has_request_context, request
+from flask_restx import fields
+from flask_restx.fields import get_value
+from flask_restx.marshalling import make
+from flask_restx.model import RawModel
+from flask_restx.utils import unpack
+
+# Field classes whose format() is replaced by a builtin in the generated code
+_INLINE_FORMATS = {fields.String: "str", fields.Integer: "int", fields.Raw: ""}
+
+_serializers = {}
+
+
+class _Compiler:
+    """Generate the source of functions marshalling objects like flask_restx.marshal.
+
+    Every model is compiled into a function of one object returning the dict
+    flask_restx.marshal would return for it, and a function also accepting
+    lists, like marshal does. Field lookups, None defaults and nested models
+    are inlined; fields which can't be inlined are output with their own
+    output() method, so the result stays the same. Models with a mask or
+    Wildcard fields can't be compiled.
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.constants = {"_get_value": get_value, "_sequence_types": (list, tuple)}
+        self.functions = {}
+
+    def constant(self, value):
+        name = f"_c{len(self.constants)}"
+        self.constants[name] = value
+        return name
+
+    def compile_model(self, model):
+        """Name of the function marshalling one object or a list of them"""
+        if id(model) in self.functions:
+            return self.functions[id(model)]
+
+        if getattr(model, "__mask__", None):
+            raise TypeError("Models with a mask are not compiled")
+        resolved = getattr(model, "resolved", model)
+        number = len(self.functions)
+        one, many = f"_one{number}", f"_many{number}"
+        self.functions[id(model)] = many
+
+        plain, generic = [], []
+        for index, (key, field) in enumerate(resolved.items()):
+            if isinstance(field, dict):
+                nested = self.compile_model(field)
+                plain.append(f"    v{index} = {nested}(obj)")
+                generic.append(f"    v{index} = {nested}(obj)")
+                continue
+            field = make(field)
+            if isinstance(field, fields.Wildcard):
+                raise TypeError("Wildcard fields are not compiled")
+            plain.extend(self.compile_field(index, key, field, plain=True))
+            generic.extend(self.compile_field(index, key, field, plain=False))
+
+        result = ", ".join(
+            f"{key!r}: v{index}" for index, key in enumerate(resolved.keys())
+        )
+        self.lines += [
+            f"def {one}(obj):",
+            # Objects without __iter__ (e.g. models) are read with getattr only
+            '    if not hasattr(obj, "__iter__"):',
+            *(f"    {line}" for line in plain),
+            f"        return {{{result}}}",
+            *generic,
+            f"    return {{{result}}}",
+            "",
+            f"def {many}(data):",
+            "    if isinstance(data, _sequence_types):",
+            f"        return [{many}(item) for item in data]",
+            f"    return {one}(data)",
+            "",
+        ]
+        return many
+
+    def get_value(self, key, field, plain):
+        attribute = key if field.attribute is None else field.attribute
+        if plain and isinstance(attribute, str) and "." not in attribute:
+            return f"getattr(obj, {attribute!r}, None)"
+        return f"_get_value({self.constant(attribute)}, obj)"
+
+    def compile_field(self, index, key, field, plain):
+        value = self.get_value(key, field, plain)
+        output = f"    v{index} = {self.constant(field)}.output({key!r}, obj)"
+        field_class = type(field)
+
+        if field_class.output is fields.Raw.output:
+            default = field.default
+            if field.mask or callable(default):
+                return [output]
+            try:
+                default = field.format(default) if default else default
+            except Exception:
+                return [output]
+            if field_class in _INLINE_FORMATS:
+                formatted = f"{_INLINE_FORMATS[field_class]}(v)"
+            else:
+                formatted = f"{self.constant(field.format)}(v)"
+            return [
+                f"    v = {value}",
+                f"    v{index} = {self.constant(default)} if v is None else {formatted}",
+            ]
+
+        if field_class.output is fields.Nested.output:
+            return [
+                f"    v = {value}",
+                f"    v{index} = {self.compile_nested(field, 'v')}",
+            ]
+
+        if (
+            field_class.output is fields.List.output
+            and field_class.format is fields.List.format
+            and type(field.container).output is fields.Nested.output
+            and field.container.attribute is None
+            and not callable(field.default)
+        ):
+            item = self.compile_nested(field.container, "item")
+            return [
+                f"    v = {value}",
+                "    if v is None:",
+                f"        v{index} = {self.constant(field.default)}",
+                "    elif isinstance(v, _sequence_types):",
+                f"        v{index} = [{item} for item in v]",
+                "    else:",
+                f"    {output}",
+            ]
+
+        return [output]
+
+    def compile_nested(self, field, name):
+        """Expression marshalling the value in the variable like Nested.output"""
+        if field.skip_none:
+            raise TypeError("Nested fields with skip_none are not compiled")
+        marshalled = f"{self.compile_model(field.nested)}({name})"
+        if field.allow_null:
+            return f"None if {name} is None else {marshalled}"
+        if field.default is not None:
+            default = self.constant(field.default)
+            return f"{default} if {name} is None else {marshalled}"
+        return marshalled
+
+
+def compile_serializer(model):
+    """Compile the model into a function marshalling data like flask_restx.marshal.
+
+    Returns None when the model can't be compiled. The function is generated
+    once per model and kept for the lifetime of the process, so only models
+    declared with api.model are compiled, not plain dicts of fields.
+    """
+    if not isinstance(model, RawModel):
+        return None
+    if id(model) in _serializers:
+        return _serializers[id(model)][1]
+
+    compiler = _Compiler()
+    try:
+        name = compiler.compile_model(model)
+    except TypeError:
+        serializer = None
+    else:
+        source = "\n".join(compiler.lines)
+        namespace = dict(compiler.constants)
+        exec(
+            compile(source, f"<serializer {getattr(model, 'name', '')}>", "exec"),
+            namespace,
+        )
+        serializer = namespace[name]
+        serializer.source = source
+
+    # The model is kept with the serializer, so that its id is not reused
+    _serializers[id(model)] = (model, serializer)
+    return serializer
+
+
+def marshal(data, fields, envelope=None, skip_none=False, mask=None, ordered=False):
+    """flask_restx.marshal using the compiled serializer of the fields if possible"""
+    serializer = None
+    if not (skip_none or mask or ordered):
+        serializer = compile_serializer(fields)
+    if serializer is None:
+        return flask_restx.marshal(data, fields, envelope, skip_none, mask, ordered)
+
+    try:
+        out = serializer(data)
+    except Exception:
+        # Raise the error flask_restx raises for the data
+        return flask_restx.marshal(data, fields, envelope, skip_none, mask, ordered)
+    return {envelope: out} if envelope else out
+
+
+class marshal_with(flask_restx.marshal_with):
+    """flask_restx.marshal_with using the compiled serializer of the fields"""
+
+    def __init__(self, fields, *args, **kwargs):
+        super().__init__(fields, *args, **kwargs)
+        compile_serializer(fields)
+
+    def __call__(self, f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            resp = f(*args, **kwargs)
+            mask = self.mask
+            if has_request_context():
+                mask_header = current_app.config["RESTX_MASK_HEADER"]
+                mask = request.headers.get(mask_header) or mask
+            options = (self.envelope, self.skip_none, mask, self.ordered)
+            if isinstance(resp, tuple):
+                data, code, headers = unpack(resp)
+                return marshal(data, self.fields, *options), code, headers
+            return marshal(resp, self.fields, *options)
+
+        return wrapper
+
+
+class Namespace(flask_restx.Namespace):
+    """Namespace whose marshal_with serializes with compiled serializers"""
+
+    def marshal_with(
+        self, fields, as_list=False, code=HTTPStatus.OK, description=None, **kwargs
+    ):
+        def wrapper(func):
+            # Documents the response on func, its own marshalling is not used
+            super(Namespace, self).marshal_with(
+                fields, as_list, code, description, **kwargs
+            )(func)
+            return marshal_with(fields, ordered=self.ordered, **kwargs)(func)
+
+        return wrapper
@@ -0,0 +1,97 @@
+import socketserver
+from contextlib import contextmanager
+from threading import Thread
+
+import pytest
+from sqlalchemy import event
+
+from benchmarks import MIGRATIONS_DIRECTORY, create_benchmark_app
+
+
+@pytest.fixture(scope="session")
+def make_app(tmp_path_factory):
+    """Create an app on a new SQLite database seeded with SCALE disciplines"""
+    from flask_migrate import upgrade
+
+    from project.seed import seed_database
+
+    def make(scale, **config):
+        app = create_benchmark_app(tmp_path_factory.mktemp("db") / "test.db")
+        app.config.update(config)
+        with app.app_context():
+            upgrade(directory=MIGRATIONS_DIRECTORY)
+            if scale:
+                seed_database(scale)
+        return app
+
+    return make
+
+
+@pytest.fixture
+def count_statements():
+    """Collect the SQL statements run on the engine of the app in the block"""
+    from project.extensions import db
+
+    @contextmanager
+    def count(app):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        with app.app_context():
+            engine = db.engine
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    return count
+
+
+class SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough of an SMTP server for smtplib: EHLO, AUTH, mail and NOOP"""
+
+    def reply(self, *lines):
+        self.wfile.write("".join(f"{line}\r\n" for line in lines).encode())
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self.reply("220 localhost ESMTP")
+        for line in self.rfile:
+            command = line.decode().strip()
+            verb = command.split(" ", 1)[0].upper()
+            server.commands.append(verb)
+            if verb == "EHLO":
+                self.reply("250-localhost", "250 AUTH PLAIN LOGIN")
+            elif verb == "AUTH":
+                self.reply("235 2.7.0 Authentication successful")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = []
+                for data_line in self.rfile:
+                    if data_line == b".\r\n":
+                        break
+                    data.append(data_line)
+                server.messages.append(b"".join(data).decode())
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+@pytest.fixture
+def smtp_server():
+    """A local SMTP server keeping the received messages and commands"""
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), SMTPHandler)
+    server.daemon_threads = True
+    server.connections, server.commands, server.messages = 0, [], []
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
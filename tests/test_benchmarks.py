@@ -0,0 +1,42 @@
+import sys
+
+
+def test_index_benchmark_runs_on_the_old_revision(monkeypatch, tmp_path, capsys):
+    from benchmarks import indexes
+
+    output = tmp_path / "indexes.json"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["indexes", "--scale", "20", "--repeat", "2", "--output", str(output)],
+    )
+    indexes.main()
+
+    assert "syllabuses.status" in capsys.readouterr().out
+    assert output.exists()
+
+
+def test_failing_endpoint_is_a_regression_not_an_improvement():
+    from benchmarks.endpoints import find_regressions, measure
+
+    class Client:
+        def __init__(self, statuses):
+            self.statuses = iter(statuses)
+
+        def open(self, **request):
+            return type("Response", (), {"status_code": next(self.statuses)})
+
+    # Fails during the warmup only
+    current = measure(Client([500, 200, 200, 200]), lambda number: {}, 2, 1, [0])
+    assert current["status"] == 200 and current["error_statuses"] == [500]
+
+    before = {**current, "error_statuses": [], "p95_ms": 1000, "queries": 100}
+    baseline = {"scales": {"10": {"endpoints": {"GET /x": before}}}}
+    results = {"scales": {"10": {"endpoints": {"GET /x": current}}}}
+    (regression,) = find_regressions(baseline, results, tolerance=1.25)
+    assert "[] -> [500]" in regression
+
+    current = {**before, "status": 404, "p95_ms": 1}
+    results = {"scales": {"10": {"endpoints": {"GET /x": current}}}}
+    (regression,) = find_regressions(baseline, results, tolerance=1.25)
+    assert "status 200 -> 404" in regression
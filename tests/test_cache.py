@@ -0,0 +1,77 @@
+from project import cache
+
+
+def test_remembered_etag_is_answered_with_one_query(make_app, count_statements):
+    client = make_app(100).test_client()
+    etag = client.get("/teachers/1").headers["ETag"]
+    client.get("/teachers/1", headers={"If-None-Match": etag})
+
+    with count_statements(client.application) as statements:
+        response = client.get("/teachers/1", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert len(statements) == 1
+
+
+def test_write_committed_by_another_worker_changes_the_etag(make_app):
+    from project.extensions import db
+    from project.models import Teacher
+
+    app = make_app(100)
+    client = app.test_client()
+    etag = client.get("/teachers/1").headers["ETag"]
+    assert client.get("/teachers/1", headers={"If-None-Match": etag}).status_code == 304
+
+    # This worker doesn't see the write in its own table versions
+    local_versions = dict(cache._table_versions)
+    with app.app_context():
+        db.session.get(Teacher, 1).name = "Renamed teacher"
+        db.session.commit()
+    cache._table_versions.clear()
+    cache._table_versions.update(local_versions)
+
+    response = client.get("/teachers/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json["name"] == "Renamed teacher"
+
+
+def test_etag_of_cached_service_info_is_computed_once(make_app, monkeypatch):
+    hashed = []
+    hash_payload = cache.hash_payload
+    monkeypatch.setattr(
+        cache, "hash_payload", lambda data: hashed.append(data) or hash_payload(data)
+    )
+    client = make_app(100).test_client()
+
+    etags = {client.get("/service_info").headers["ETag"] for _ in range(3)}
+
+    assert len(etags) == 1
+    assert len(hashed) == 1
+
+
+def test_service_info_sees_a_write_committed_by_another_worker(make_app):
+    from project.extensions import db
+    from project.models import Position
+
+    app = make_app(100)
+    client = app.test_client()
+    etag = client.get("/service_info").headers["ETag"]
+    assert (
+        client.get("/service_info", headers={"If-None-Match": etag}).status_code == 304
+    )
+
+    # Neither the local table versions nor the cached service info of this
+    # worker see the write
+    local_versions = dict(cache._table_versions)
+    with app.app_context():
+        db.session.get(Position, 1).name = "Renamed position"
+        db.session.commit()
+    cache._table_versions.clear()
+    cache._table_versions.update(local_versions)
+
+    for headers in ({"If-None-Match": etag}, {}, {"If-None-Match": etag}):
+        response = client.get("/service_info", headers=headers)
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        names = [position["name"] for position in response.json["position"]]
+        assert "Renamed position" in names
@@ -0,0 +1,35 @@
+from sqlalchemy import func, select
+
+
+def test_counters_of_existing_database_follow_writes(make_app):
+    from flask_migrate import downgrade, upgrade
+
+    from benchmarks import MIGRATIONS_DIRECTORY
+    from project.counters import get_counters, recount_counters
+    from project.extensions import db
+    from project.models import Syllabus, SyllabusStatus
+
+    app = make_app(20)
+    with app.app_context():
+        syllabus_id = db.session.scalar(select(func.min(Syllabus.id)))
+        db.session.get(Syllabus, syllabus_id).status = SyllabusStatus.PROPOSED.value
+        db.session.commit()
+        # The rows of a database from before the counters, which are counted
+        # by the migration and must be right without a recount afterwards
+        downgrade(directory=MIGRATIONS_DIRECTORY, revision="0001")
+        upgrade(directory=MIGRATIONS_DIRECTORY)
+
+    client = app.test_client()
+    response = client.post(
+        f"/syllabuses/assessments/{syllabus_id}",
+        json={"assessments": [{"object": "Тест", "method": "Тест", "tool": "Тест"}]},
+    )
+    assert response.status_code == 200
+    missing = client.post("/syllabuses/assessments/0", json={"assessments": []})
+    assert missing.status_code == 404
+
+    with app.app_context():
+        status = db.session.get(Syllabus, syllabus_id).status
+        assert status != SyllabusStatus.PROPOSED.value
+        counters = get_counters()
+        assert counters == recount_counters()
@@ -0,0 +1,40 @@
+import pytest
+
+
+@pytest.mark.parametrize("path", ["/disciplines", "/service_info"])
+def test_list_query_count_does_not_grow_with_rows(make_app, count_statements, path):
+    counts = []
+    for scale in (10, 100):
+        app = make_app(scale)
+        with count_statements(app) as statements:
+            response = app.test_client().get(path, query_string={"size": 100})
+        assert response.status_code == 200
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1]
+
+
+def test_discipline_load_options_cover_discipline_model(make_app, count_statements):
+    from flask_restx import marshal
+
+    from project.models import Discipline
+    from project.routes.disciplines import discipline_load_options
+    from project.schemas.disciplines import discipline_model
+    from project.schemas.pagination import paginate_query
+
+    app = make_app(100)
+    # Without the service info of the endpoint, whose queries fill the identity
+    # map, a relationship left out of the options is a query per row
+    with app.test_request_context("/disciplines?size=100"):
+        with count_statements(app) as statements:
+            page = paginate_query(
+                Discipline.query.options(*discipline_load_options).order_by(
+                    Discipline.id
+                )
+            )
+            disciplines = marshal(page["content"], discipline_model)
+
+    assert len(disciplines) == 100
+    assert all(discipline["discipline_block"]["id"] for discipline in disciplines)
+    # The page and its count
+    assert len(statements) == 2
@@ -0,0 +1,67 @@
+def test_worker_survives_an_unexpected_error(make_app, monkeypatch):
+    from project.mail_dispatcher import MailDispatcher
+
+    app = make_app(0, MAIL_DISPATCH_WORKERS=1)
+    dispatcher = MailDispatcher(app)
+    sent = []
+
+    def send_with_retries(messages):
+        if not sent:
+            sent.append(None)
+            raise RuntimeError("not an SMTP error")
+        sent.extend(messages)
+
+    monkeypatch.setattr(dispatcher, "_send_with_retries", send_with_retries)
+    dispatcher.send("first")
+    dispatcher.send("second")
+    dispatcher.join()
+    dispatcher.shutdown()
+
+    assert sent == [None, "second"]
+
+
+def test_messages_are_sent_to_a_local_smtp_server(make_app, smtp_server, monkeypatch):
+    from flask_mail import Message
+
+    from project.extensions import mail_pool
+    from project.mail_dispatcher import MailDispatcher
+
+    app = make_app(0, MAIL_DISPATCH_WORKERS=1)
+    settings = {
+        "server": "127.0.0.1",
+        "port": smtp_server.server_address[1],
+        "username": "noreply@example.com",
+        "password": "password",
+        "use_tls": False,
+        "suppress": False,
+        "default_sender": "noreply@example.com",
+    }
+    for name, value in settings.items():
+        monkeypatch.setattr(app.extensions["mail"], name, value)
+    dispatcher = MailDispatcher(app)
+
+    with app.app_context():
+        mail_pool.close_all()
+        messages = [
+            Message(f"Subject {i}", recipients=[f"user{i}@example.com"], html="<p/>")
+            for i in range(3)
+        ]
+        dispatcher.send(*messages[:2])
+        dispatcher.join()
+        dispatcher.send(messages[2])
+        dispatcher.join()
+        dispatcher.shutdown()
+        mail_pool.close_all()
+
+    assert [
+        message.split("Subject: ")[1].split("\r\n")[0]
+        for message in smtp_server.messages
+    ] == [
+        "Subject 0",
+        "Subject 1",
+        "Subject 2",
+    ]
+    # One login for all of them, the connection checked before it was reused
+    assert smtp_server.connections == 1
+    assert smtp_server.commands.count("AUTH") == 1
+    assert "NOOP" in smtp_server.commands
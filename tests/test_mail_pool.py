@@ -0,0 +1,106 @@
+from smtplib import SMTPServerDisconnected
+
+from flask_mail import Message
+
+
+class FakeHost:
+    def __init__(self):
+        self.alive = True
+        self.closed = False
+
+    def noop(self):
+        if not self.alive:
+            raise SMTPServerDisconnected("Connection unexpectedly closed")
+        return 250, b"OK"
+
+    def sendmail(self, *args):
+        if not self.alive:
+            raise SMTPServerDisconnected("Connection unexpectedly closed")
+
+    def quit(self):
+        self.closed = True
+
+    close = quit
+
+
+def test_dead_connections_are_not_reused(make_app, monkeypatch):
+    from project.extensions import mail_pool
+    from project.mail_pool import Connection
+
+    app = make_app(0)
+    opened = []
+
+    def configure_host(self):
+        opened.append(FakeHost())
+        return opened[-1]
+
+    monkeypatch.setattr(Connection, "configure_host", configure_host)
+    message = Message(
+        "Subject",
+        sender="noreply@example.com",
+        recipients=["user@example.com"],
+        html="<p>Text</p>",
+    )
+    with app.app_context():
+        monkeypatch.setattr(app.extensions["mail"], "suppress", False)
+        mail_pool.close_all()
+        with mail_pool.connect() as connection:
+            connection.send(message)
+
+        # Closed by the server while idle: replaced by a new connection
+        opened[0].alive = False
+        with mail_pool.connect() as connection:
+            assert connection.host is opened[1]
+        assert opened[0].closed
+
+        # Broken while in use, with the error handled by the caller
+        with mail_pool.connect() as connection:
+            connection.host.alive = False
+            try:
+                connection.send(message)
+            except SMTPServerDisconnected:
+                pass
+        assert opened[1].closed and not mail_pool._idle
+
+
+def test_send_and_reuse_metrics_are_exported(make_app, monkeypatch):
+    from prometheus_client.parser import text_string_to_metric_families
+
+    from project.extensions import mail_pool
+    from project.mail_pool import Connection
+
+    app = make_app(0)
+    monkeypatch.setattr(Connection, "configure_host", lambda self: FakeHost())
+
+    def get_samples():
+        text = app.test_client().get("/metrics").text
+        return {
+            (sample.name, tuple(sorted(sample.labels.items()))): sample.value
+            for family in text_string_to_metric_families(text)
+            for sample in family.samples
+        }
+
+    before = get_samples()
+    message = Message(
+        "Subject",
+        sender="noreply@example.com",
+        recipients=["user@example.com"],
+        html="<p>Text</p>",
+    )
+    with app.app_context():
+        monkeypatch.setattr(app.extensions["mail"], "suppress", False)
+        mail_pool.close_all()
+        for _ in range(2):
+            with mail_pool.connect() as connection:
+                connection.send(message)
+        mail_pool.close_all()
+    after = get_samples()
+
+    def increase(name, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        return after[key] - before.get(key, 0)
+
+    assert increase("mail_sends_total", result="sent") == 2
+    assert increase("mail_send_duration_seconds_count") == 2
+    assert increase("mail_pool_connections_total", origin="opened") == 1
+    assert increase("mail_pool_connections_total", origin="reused") == 1
@@ -0,0 +1,55 @@
+from smtplib import SMTPRecipientsRefused, SMTPServerDisconnected
+
+
+class FakeHost:
+    def __init__(self, errors):
+        self.errors = errors
+        self.sent = []
+        self.closed = False
+
+    def sendmail(self, sender, recipients, message, *options):
+        error = self.errors.pop(0) if self.errors else None
+        if error:
+            raise error
+        self.sent.append(recipients)
+
+    def quit(self):
+        self.closed = True
+
+    close = quit
+
+
+def test_broken_connection_is_closed_and_retried_later(make_app, monkeypatch):
+    from project.extensions import db, mail_pool
+    from project.models import OutboxMessage
+    from project.outbox import add_to_outbox, drain_outbox
+
+    app = make_app(0, MAIL_DEFAULT_SENDER="noreply@example.com")
+    hosts = [
+        FakeHost([SMTPRecipientsRefused({}), SMTPServerDisconnected("gone")]),
+        FakeHost([]),
+    ]
+    monkeypatch.setattr(mail_pool, "_acquire", lambda mail: hosts[0])
+    with app.app_context():
+        mail_pool.close_all()
+        for i in range(3):
+            add_to_outbox("Subject", "<p>Text</p>", [f"user{i}@example.com"])
+        db.session.commit()
+
+        assert drain_outbox(batch_size=10, max_attempts=5, backoff=60) == 0
+        # The refused email kept the connection, the disconnect closed it
+        # instead of putting it back into the pool
+        assert hosts[0].closed and not mail_pool._idle
+        messages = db.session.scalars(db.select(OutboxMessage)).all()
+        assert all(message.last_error for message in messages)
+
+        # Not due before the backoff
+        monkeypatch.setattr(mail_pool, "_acquire", lambda mail: hosts[1])
+        assert drain_outbox(batch_size=10, max_attempts=5, backoff=60) == 0
+        assert not hosts[1].sent
+
+        db.session.execute(
+            db.update(OutboxMessage).values(next_attempt_at=db.func.now())
+        )
+        db.session.commit()
+        assert drain_outbox(batch_size=10, max_attempts=5, backoff=60) == 3
@@ -0,0 +1,25 @@
+def test_cursor_pages_have_no_page_number_or_total(make_app):
+    client = make_app(300).test_client()
+
+    first = client.get("/education-programs", query_string={"after": "", "size": 2})
+    second = client.get(
+        "/education-programs", query_string={"after": first.json["next"], "size": 2}
+    )
+
+    for page in (first.json, second.json):
+        assert page["pageNumber"] is None
+        assert page["totalElements"] is None
+    first_ids = [program["id"] for program in first.json["content"]]
+    second_ids = [program["id"] for program in second.json["content"]]
+    assert first_ids == [3, 2] and second_ids == [1]
+    assert second.json["next"] is None
+
+
+def test_offset_pages_of_cursor_lists_are_numbered(make_app):
+    response = make_app(300).test_client().get(
+        "/education-programs", query_string={"page": 2, "size": 2}
+    )
+
+    assert response.json["pageNumber"] == 2
+    assert response.json["totalElements"] == 3
+    assert [program["id"] for program in response.json["content"]] == [1]
@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy import select
+
+
+@pytest.fixture(scope="module")
+def app(make_app):
+    return make_app(100, QUERY_BUDGET_RAISE=True)
+
+
+def test_endpoints_stay_within_their_budgets(app):
+    from project.extensions import db
+    from project.models import Syllabus
+
+    with app.app_context():
+        syllabus_ids = db.session.scalars(select(Syllabus.id)).all()
+
+    client = app.test_client()
+    assert client.get("/disciplines", query_string={"size": 100}).status_code == 200
+    for syllabus_id in syllabus_ids[:10]:
+        response = client.get(f"/syllabuses/general-info/{syllabus_id}")
+        assert response.status_code == 200
+
+    for email in ("admin1@example.com", "teacher1@example.com"):
+        login = client.post(
+            "/user/login", data={"email": email, "password": "password"}
+        )
+        assert login.status_code == 200
+        refresh = client.post(
+            "/user/refresh", headers={"Authorization": login.json["refresh_token"]}
+        )
+        assert refresh.status_code == 200
+
+
+def test_request_over_budget_raises(app, monkeypatch):
+    from project.query_counter import QueryBudgetExceeded
+    from project.routes.disciplines import DisciplinesList
+
+    monkeypatch.setattr(DisciplinesList.get, "query_budget", 1)
+    with pytest.raises(QueryBudgetExceeded):
+        app.test_client().get("/disciplines")
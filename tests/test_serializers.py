@@ -0,0 +1,83 @@
+import json
+
+import flask_restx
+import pytest
+from flask_restx import fields
+from flask_restx.marshalling import make
+
+SAMPLES = {fields.String: "Текст", fields.Integer: 7, fields.Boolean: True}
+
+
+def make_object(model, depth=0):
+    """A dict with a value for every field of the model, nested ones included"""
+    data = {}
+    for key, field in model.resolved.items():
+        field = make(field)
+        attribute = field.attribute if isinstance(field.attribute, str) else key
+        *path, name = attribute.split(".")
+        target = data
+        for part in path:
+            target = target.setdefault(part, {})
+        target[name] = make_value(field, depth)
+    return data
+
+
+def make_value(field, depth):
+    if isinstance(field, fields.Nested):
+        # Nested models may refer to each other
+        return make_object(field.nested, depth + 1) if depth < 3 else None
+    if isinstance(field, fields.List):
+        item = make_value(make(field.container), depth)
+        return [item, item]
+    return SAMPLES.get(type(field))
+
+
+def dump(function, *args, **kwargs):
+    """JSON of the result, with the order of the keys, or the type of the error"""
+    try:
+        return json.dumps(function(*args, **kwargs), ensure_ascii=False)
+    except Exception as e:
+        return type(e).__name__
+
+
+@pytest.fixture(scope="module")
+def models(make_app):
+    from project.extensions import api
+
+    app = make_app(0)
+    assert api.models
+    return app, api.models
+
+
+def test_compiled_marshal_matches_flask_restx(models):
+    from project.serializers import compile_serializer, marshal
+
+    app, models = models
+    compiled = 0
+    for name, model in models.items():
+        compiled += compile_serializer(model) is not None
+        full = make_object(model)
+        for data in (full, {}, None, [full, {}, full], []):
+            expected = dump(flask_restx.marshal, data, model)
+            assert dump(marshal, data, model) == expected, (name, data)
+            assert dump(marshal, data, model, envelope="content") == dump(
+                flask_restx.marshal, data, model, envelope="content"
+            ), name
+    assert compiled
+
+
+def test_marshal_with_applies_the_mask_header(models):
+    from project.serializers import marshal_with
+
+    app, models = models
+    for name, model in models.items():
+        data = make_object(model)
+        decorated = marshal_with(model)(lambda: data)
+        mask = "{" + ",".join(list(model.resolved)[:2]) + "}"
+        with app.test_request_context(headers={"X-Fields": mask}):
+            assert dump(decorated) == dump(
+                flask_restx.marshal, data, model, mask=mask
+            ), name
+        # Outside of a request there is no header to read
+        with app.app_context():
+            assert dump(decorated) == dump(flask_restx.marshal, data, model), name
@@ -0,0 +1,77 @@
+import pytest
+
+from sqlalchemy import func, select, update
+
+
+def test_set_all_filling_statuses_updates_in_one_statement(make_app, count_statements):
+    from project.counters import get_counters, recount_counters
+    from project.extensions import db
+    from project.models import Syllabus, SyllabusStatus
+    from project.routes.syllabus import get_filling_status_expression
+
+    app = make_app(100)
+    with app.app_context():
+        db.session.execute(update(Syllabus).values(status=SyllabusStatus.PROPOSED))
+        db.session.commit()
+        recount_counters()
+
+    with count_statements(app) as statements:
+        response = app.test_client().post("/syllabuses/set-all-filling-statuses")
+
+    assert len(response.json["syllabuses"]) == 100
+    updates = [
+        s for s in statements if s.lstrip().upper().startswith("UPDATE SYLLABUSES")
+    ]
+    assert len(updates) == 1 and " IN (" not in updates[0].upper()
+    with app.app_context():
+        wrong_statuses = db.session.scalar(
+            select(func.count()).where(
+                Syllabus.status != get_filling_status_expression()
+            )
+        )
+        assert wrong_statuses == 0
+        counters = {name: value for name, value in get_counters().items() if value}
+        assert counters == recount_counters()
+
+
+@pytest.mark.parametrize(
+    "path, key, item",
+    [
+        (
+            "/syllabuses/assessments",
+            "assessments",
+            {"object": "О", "method": "М", "tool": "І"},
+        ),
+        ("/syllabuses/graduate-tasks", "graduate_tasks", {"name": "Завдання"}),
+        ("/syllabuses/self-study", "self_study_topics", {"name": "Тема"}),
+    ],
+)
+def test_first_insert_and_last_delete_change_the_status(make_app, path, key, item):
+    from project.counters import get_counters, recount_counters
+    from project.extensions import db
+    from project.models import Syllabus, SyllabusStatus
+    from project.routes.syllabus import get_filling_status_expression
+
+    app = make_app(20)
+    with app.app_context():
+        syllabus_id = db.session.scalar(
+            select(func.min(Syllabus.id)).where(
+                get_filling_status_expression() == SyllabusStatus.NOT_FILLED.value
+            )
+        )
+
+    def get_status():
+        with app.app_context():
+            return db.session.get(Syllabus, syllabus_id).status
+
+    client = app.test_client()
+    response = client.post(f"{path}/{syllabus_id}", json={key: [item]})
+    assert response.status_code == 200
+    assert get_status() == SyllabusStatus.ON_FILLING.value
+
+    (created,) = response.json["content"][key]
+    assert client.delete(f"{path}/{created['id']}").status_code == 200
+    assert get_status() == SyllabusStatus.NOT_FILLED.value
+
+    with app.app_context():
+        assert get_counters() == recount_counters()